@@ -0,0 +1,110 @@
+from collections import defaultdict
+
+from django.db.models import Exists, OuterRef
+from django.urls import reverse
+
+from resource_hub.core.conflicts import usage_segments
+from resource_hub.items.models import Item, ItemBooking
+from resource_hub.venues.models import EventOccurrence, Venue
+from resource_hub.workshops.models import Workshop, WorkshopBookingOccurrence
+
+ASSET_TYPES = ['venue', 'workshop', 'item']
+
+
+def available_venues(start, end, location=None, capacity=None, usage=None) -> list:
+    occupied = EventOccurrence.objects.filter(
+        venue=OuterRef('pk'), dtstart__lt=end, dtend__gt=start)
+    venues = Venue.objects.filter(bookable=True)
+    if location:
+        venues = venues.filter(location=location)
+    if capacity:
+        venues = venues.filter(size__gte=capacity)
+    if usage:
+        venues = venues.filter(usage_types__contains=[usage])
+    venues = venues.annotate(occupied=Exists(occupied)).filter(occupied=False)
+    return [{
+        'type': 'venue',
+        'id': pk,
+        'name': name,
+        'location': location_name,
+        'capacity': size,
+        'link': reverse('venues:venue_details', kwargs={
+            'venue_slug': slug, 'location_slug': location_slug}),
+    } for pk, name, slug, size, location_name, location_slug in venues.values_list(
+        'pk', 'name', 'slug', 'size', 'location__name', 'location__slug')]
+
+
+def available_workshops(start, end, location=None, capacity=None) -> list:
+    occupied = WorkshopBookingOccurrence.objects.filter(
+        workshop=OuterRef('pk'), dtstart__lt=end, dtend__gt=start)
+    workshops = Workshop.objects.filter(bookable=True)
+    if location:
+        workshops = workshops.filter(location=location)
+    if capacity:
+        workshops = workshops.filter(workplaces__gte=capacity)
+    workshops = workshops.annotate(
+        occupied=Exists(occupied)).filter(occupied=False)
+    return [{
+        'type': 'workshop',
+        'id': pk,
+        'name': name,
+        'location': location_name,
+        'capacity': workplaces,
+        'link': reverse('workshops:workshop_details', kwargs={
+            'workshop_slug': slug, 'location_slug': location_slug}),
+    } for pk, name, slug, workplaces, location_name, location_slug in workshops.values_list(
+        'pk', 'name', 'slug', 'workplaces', 'location__name', 'location__slug')]
+
+
+def available_items(start, end, location=None, capacity=None) -> list:
+    items = Item.objects.filter(state=Item.STATE.AVAILABLE)
+    if location:
+        items = items.filter(location=location)
+    if capacity:
+        items = items.filter(quantity__gte=capacity)
+
+    # one query for the bookings of all candidates, peaks by sweeping per item
+    bookings = defaultdict(list)
+    for item, dtstart, dtend, quantity in ItemBooking.objects.filter(
+        item__in=items.values('pk'),
+        dtend__gt=start,
+        dtstart__lt=end,
+    ).values_list('item', 'dtstart', 'dtend', 'quantity'):
+        bookings[item].append((max(dtstart, start), min(dtend, end), quantity))
+
+    result = []
+    for pk, name, slug, quantity, owner_slug, location_name, is_public in items.values_list(
+            'pk', 'name', 'slug', 'quantity', 'owner__slug', 'location__name', 'location__is_public'):
+        peak = max((usage for _, _, usage in usage_segments(
+            bookings.get(pk, []))), default=0)
+        available = quantity - peak
+        if available < (capacity or 1):
+            continue
+        result.append({
+            'type': 'item',
+            'id': pk,
+            'name': name,
+            'location': location_name if is_public else None,
+            'capacity': available,
+            'link': reverse('items:details', kwargs={
+                'item_slug': slug, 'owner_slug': owner_slug}),
+        })
+    return result
+
+
+def search_available(start, end, types=None, location=None, capacity=None, usage=None) -> list:
+    '''
+    assets free between start and end, best fitting capacity first
+    '''
+    types = types or ASSET_TYPES
+    result = []
+    if 'venue' in types:
+        result += available_venues(start, end, location, capacity, usage)
+    # usage types only exist for venues
+    if 'workshop' in types and not usage:
+        result += available_workshops(start, end, location, capacity)
+    if 'item' in types and not usage:
+        result += available_items(start, end, location, capacity)
+    result.sort(key=lambda asset: (
+        asset['capacity'] - (capacity or 0), asset['name']))
+    return result
@@ -0,0 +1,99 @@
+from datetime import datetime
+from decimal import Decimal
+
+from django.shortcuts import reverse
+from django.utils import timezone
+
+from resource_hub.core.models import Price
+from resource_hub.items.models import (Item, ItemBooking, ItemContract,
+                                       ItemContractProcedure)
+from resource_hub.venues.models import Event, Venue
+from resource_hub.venues.tests import BaseVenueTest
+
+
+class TestAvailabilitySearch(BaseVenueTest):
+    def setUp(self):
+        super(TestAvailabilitySearch, self).setUp()
+        self.free_venue = Venue.objects.create(
+            name='Free venue',
+            description='nice',
+            size=50,
+            contract_procedure=self.contract_procedure,
+            location=self.location,
+            owner=self.user,
+            base_price=Price.objects.create(
+                value=Decimal('10'),
+            ),
+        )
+        event = Event.objects.create(
+            name='event',
+            description='1',
+            dtstart=datetime(2020, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            dtend=datetime(2020, 1, 1, 13, 0, 0, tzinfo=timezone.utc),
+            dtlast=datetime(2020, 1, 1, 13, 0, 0, tzinfo=timezone.utc),
+            organizer=self.user,
+            recurrences="DTSTART:20200101T120000Z",
+        )
+        event.venues.add(self.venue)
+        self.url = reverse('api:availability_search')
+
+    def test_occupied_venues_excluded(self):
+        response = self.client.get(self.url, {
+            'start': '2020-01-01T12:30:00Z',
+            'end': '2020-01-01T14:00:00Z',
+            'types': 'venue',
+        })
+        self.assertEqual(
+            [asset['id'] for asset in response.data['results']],
+            [self.free_venue.pk],
+        )
+
+        # touching the event is no conflict, best fitting size first
+        response = self.client.get(self.url, {
+            'start': '2020-01-01T13:00:00Z',
+            'end': '2020-01-01T14:00:00Z',
+            'capacity': 5,
+        })
+        self.assertEqual(
+            [(asset['type'], asset['id']) for asset in response.data['results']],
+            [('venue', self.venue.pk), ('venue', self.free_venue.pk)],
+        )
+
+    def test_invalid_parameters(self):
+        response = self.client.get(self.url, {
+            'start': '2020-01-01T13:00:00Z',
+            'end': '2020-01-01T14:00:00Z',
+            'types': 'rooms',
+        })
+        self.assertEqual(response.status_code, 400)
+
+    def test_items_without_offset(self):
+        item = Item.objects.create(
+            name='item',
+            state=Item.STATE.AVAILABLE,
+            description='test',
+            location=self.location,
+            quantity=2,
+            unit=Item.UNIT.HOURS,
+            contract_procedure=ItemContractProcedure.objects.create(
+                name='test', owner=self.user),
+            maximum_duration=7,
+            owner=self.user,
+        )
+        ItemBooking.objects.create(
+            item=item,
+            contract=ItemContract.objects.create(),
+            dtstart=datetime(2020, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            dtend=datetime(2020, 1, 1, 14, 0, 0, tzinfo=timezone.utc),
+            quantity=1,
+        )
+        response = self.client.get(self.url, {
+            'start': '2020-01-01T12:00',
+            'end': '2020-01-01T16:00',
+            'types': 'item',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(asset['id'], asset['capacity']) for asset in response.data['results']],
+            [(item.pk, 1)],
+        )
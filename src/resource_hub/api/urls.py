@@ -3,8 +3,14 @@ from django.urls import include, path
 
 from resource_hub.core.hooks import UrlHook
 
+from . import views
+
 app_name = 'api'
 api_urls = UrlHook()
+api_urls.register([
+    path('search/availability/', views.AvailabilitySearch.as_view(),
+         name='availability_search'),
+])
 urlpatterns = [
     path('', include(api_urls.get())),
 ]
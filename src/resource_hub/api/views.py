@@ -0,0 +1,64 @@
+from django.utils.translation import gettext_lazy as _
+from resource_hub.core.utils import parse_aware_datetime
+from resource_hub.core.views.api import LargeResultsSetPagination
+from rest_framework import exceptions
+from rest_framework.decorators import (authentication_classes,
+                                       permission_classes)
+from rest_framework.views import APIView
+
+from .availability import ASSET_TYPES, search_available
+
+
+@authentication_classes([])
+@permission_classes([])
+class AvailabilitySearch(APIView):
+    http_method_names = ['get']
+
+    def get_int(self, name):
+        value = self.request.query_params.get(name, None)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            raise exceptions.ParseError(
+                detail=_('%(name)s parameter has to be a number') % {'name': name})
+
+    def get(self, request):
+        start_str = self.request.query_params.get('start', None)
+        end_str = self.request.query_params.get('end', None)
+
+        if start_str is None or end_str is None:
+            raise exceptions.NotFound(
+                detail=_('start or end parameter not set'))
+
+        try:
+            start = parse_aware_datetime(start_str)
+            end = parse_aware_datetime(end_str)
+        except ValueError:
+            raise exceptions.ParseError(
+                detail=_('start or end parameter not valid iso_8601 string'))
+
+        if start >= end:
+            raise exceptions.ParseError(
+                detail=_('start has to be before end'))
+
+        types = self.request.query_params.get('types', None)
+        if types is not None:
+            types = types.split(',')
+            if not set(types) <= set(ASSET_TYPES):
+                raise exceptions.ParseError(
+                    detail=_('types has to be a comma separated list of %(types)s') % {
+                        'types': ', '.join(ASSET_TYPES)})
+
+        result = search_available(
+            start,
+            end,
+            types=types,
+            location=self.get_int('location'),
+            capacity=self.get_int('capacity'),
+            usage=self.request.query_params.get('usage', None),
+        )
+        paginator = LargeResultsSetPagination()
+        page = paginator.paginate_queryset(result, request, view=self)
+        return paginator.get_paginated_response(page)
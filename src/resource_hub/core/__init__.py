@@ -2,7 +2,7 @@ from django.apps import AppConfig
 
 from resource_hub.core.hook_listeners import (control_sidebar,
                                               location_profile, navigation_bar)
-from resource_hub.core.hooks import hook
+from resource_hub.core.hooks import LANGUAGE, hook
 
 
 class CoreConfig(AppConfig):
@@ -11,7 +11,8 @@ class CoreConfig(AppConfig):
     def ready(self):
         hook.register('navigation_bar', navigation_bar)
         hook.register('control_sidebar', control_sidebar)
-        hook.register('location_profile', location_profile)
+        hook.register('location_profile', location_profile, cache=LANGUAGE,
+                      key=lambda context: context['location'].pk)
 
         from . import signals
 
@@ -0,0 +1,53 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import get_language
+from rest_framework.response import Response
+
+
+def get_modified_key(scope, pk) -> str:
+    return 'calendar:{}:{}:modified'.format(scope, pk)
+
+
+def get_calendar_modified(scope, pk):
+    '''time of the last change to the calendar, doubles as cache version'''
+    return cache.get_or_set(get_modified_key(scope, pk), timezone.now, None)
+
+
+def invalidate_calendars(scope, pks):
+    '''bumps the calendar versions once the current transaction is committed'''
+    keys = [get_modified_key(scope, pk) for pk in pks]
+    if keys:
+        transaction.on_commit(lambda: cache.set_many(
+            dict.fromkeys(keys, timezone.now()), None))
+
+
+def calendar_response(request, scope, pk, start, end, build) -> Response:
+    '''
+    cached calendar feed for the window start to end
+    build returns the entries and is only called on a cache miss
+    '''
+    modified = get_calendar_modified(scope, pk)
+    version = '{}:{}:{}:{}:{}:{}'.format(
+        scope, pk, modified.timestamp(), start.isoformat(), end.isoformat(), get_language())
+    digest = hashlib.md5(version.encode()).hexdigest()
+    etag = quote_etag(digest)
+    last_modified = int(modified.timestamp())
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified)
+    if response is None:
+        key = 'calendar:{}'.format(digest)
+        results = cache.get(key)
+        if results is None:
+            results = build()
+            cache.set(key, results, settings.CALENDAR_CACHE_TTL)
+        response = Response({'results': results})
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
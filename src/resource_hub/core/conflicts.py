@@ -0,0 +1,85 @@
+from collections import namedtuple
+
+Conflict = namedtuple('Conflict', ['start', 'end', 'other_start', 'other_end', 'obj'])
+
+
+class IntervalIndex:
+    '''
+    augmented interval tree answering overlap queries in O(min(n, (k + 1) log n))
+    the tree is implicit, the node of the sorted range [lo, hi) is its middle
+    intervals are half open, touching intervals do not overlap
+    '''
+
+    def __init__(self, intervals=()):
+        self.intervals = sorted(intervals, key=lambda i: (i[0], i[1]))
+        # maximum end per subtree, lets queries skip subtrees ending before the start
+        self.max_ends = [None] * len(self.intervals)
+        self._build(0, len(self.intervals))
+
+    def _build(self, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self.intervals[mid][1]
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > max_end:
+                max_end = child
+        self.max_ends[mid] = max_end
+        return max_end
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def overlapping(self, start, end) -> list:
+        found = []
+        nodes = [(0, len(self.intervals))]
+        while nodes:
+            lo, hi = nodes.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self.max_ends[mid] <= start:
+                continue
+            nodes.append((lo, mid))
+            other_start, other_end = self.intervals[mid][:2]
+            # the right subtree starts at or after this interval
+            if other_start < end:
+                if other_end > start:
+                    found.append(mid)
+                nodes.append((mid + 1, hi))
+        return [self.intervals[i] for i in sorted(found)]
+
+    def find_conflicts(self, intervals) -> list:
+        conflicts = []
+        for start, end in intervals:
+            for other_start, other_end, obj in self.overlapping(start, end):
+                conflicts.append(
+                    Conflict(start, end, other_start, other_end, obj))
+        return conflicts
+
+
+def find_conflicts(intervals, existing) -> list:
+    '''
+    intervals: iterable of (start, end)
+    existing: iterable of (start, end, obj)
+    '''
+    return IntervalIndex(existing).find_conflicts(intervals)
+
+
+def usage_segments(intervals) -> list:
+    '''
+    sweep over (start, end, quantity) intervals
+    returns (start, end, usage) segments of constant concurrent usage
+    '''
+    points = []
+    for start, end, quantity in intervals:
+        points.append((start, quantity))
+        points.append((end, -quantity))
+    points.sort(key=lambda point: point[0])
+    segments = []
+    usage = 0
+    for i, (time, delta) in enumerate(points):
+        usage += delta
+        if i + 1 < len(points) and points[i + 1][0] > time and usage > 0:
+            segments.append((time, points[i + 1][0], usage))
+    return segments
@@ -0,0 +1,138 @@
+import csv
+import io
+import json
+import zipfile
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .models import InvoicePosition
+from .renderer import InvoiceRenderer
+from .utils import language
+
+LEDGER_FIELDS = [
+    'invoice__full_invoice_no',
+    'invoice__date',
+    'invoice__invoice_from_name',
+    'invoice__invoice_to_name',
+    'position',
+    'item',
+    'quantity',
+    'unit',
+    'price',
+    'currency',
+    'net',
+    'discount',
+    'discounted_net',
+    'tax_rate',
+    'gross',
+    'period_start',
+    'period_end',
+]
+LEDGER_FORMATS = ['csv', 'json']
+
+
+class StreamBuffer:
+    '''write only file object, collects what zipfile writes until it is yielded'''
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def get_invoice_pdf(invoice) -> bytes:
+    '''stored pdf of the invoice, rendered on the fly when missing'''
+    if invoice.file:
+        with invoice.file.open('rb') as pdf:
+            return pdf.read()
+    with language(invoice.locale):
+        fname, ftype, content = InvoiceRenderer().generate(invoice)
+    return content
+
+
+def iter_ledger(invoices, format_):
+    positions = InvoicePosition.objects.filter(
+        invoice__in=invoices
+    ).order_by(
+        'invoice__date', 'invoice__full_invoice_no', 'position', 'pk'
+    ).values_list(*LEDGER_FIELDS).iterator()
+
+    if format_ == 'csv':
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow([field.replace('invoice__', '')
+                         for field in LEDGER_FIELDS])
+        for row in positions:
+            writer.writerow(row)
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+        yield output.getvalue()
+    else:
+        yield '['
+        separator = ''
+        for row in positions:
+            yield separator + json.dumps(
+                dict(zip(LEDGER_FIELDS, row)), cls=DjangoJSONEncoder)
+            separator = ','
+        yield ']'
+
+
+def get_invoice_filename(invoice) -> str:
+    '''
+    archive entry of the invoice pdf, one folder per creditor
+    as all creditors share the default invoice number prefix
+    '''
+    creditor = invoice.contract.creditor
+    return '{}-{}/{}.pdf'.format(creditor.pk, creditor.slug, invoice.full_invoice_no)
+
+
+def iter_invoice_archive(invoices, ledger='csv'):
+    '''
+    yields a zip archive with the pdf of every invoice and a ledger of their positions
+    entries are written one by one, so memory stays flat for large exports
+    '''
+    buffer = StreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for invoice in invoices.select_related('contract__creditor').iterator():
+            if invoice.shredded:
+                continue
+            # pdfs are compressed already
+            info = zipfile.ZipInfo(
+                get_invoice_filename(invoice),
+                date_time=timezone.localtime(invoice.created_at).timetuple()[:6],
+            )
+            info.compress_type = zipfile.ZIP_STORED
+            archive.writestr(info, get_invoice_pdf(invoice))
+            yield buffer.pop()
+
+        with archive.open('ledger.{}'.format(ledger), 'w') as entry:
+            for chunk in iter_ledger(invoices, ledger):
+                entry.write(chunk.encode('utf-8'))
+                if buffer.chunks:
+                    yield buffer.pop()
+    yield buffer.pop()
+
+
+def export_invoices(invoices, ledger='csv') -> StreamingHttpResponse:
+    if ledger not in LEDGER_FORMATS:
+        raise ValueError('unknown ledger format {}'.format(ledger))
+    response = StreamingHttpResponse(
+        iter_invoice_archive(invoices, ledger),
+        content_type='application/zip',
+    )
+    response['Content-Disposition'] = 'attachment; filename="invoices-{}.zip"'.format(
+        timezone.localdate().isoformat())
+    return response
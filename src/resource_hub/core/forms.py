@@ -254,6 +254,19 @@ class TableActionForm(forms.Form):
     )
 
 
+class InvoiceActionForm(forms.Form):
+    ACTIONS = [
+        ('export_csv', _('Export as ZIP with CSV ledger')),
+        ('export_json', _('Export as ZIP with JSON ledger')),
+    ]
+    action = forms.ChoiceField(
+        choices=ACTIONS,
+        label=_('Action'),
+        help_text=_(
+            'Exports the selected invoices or, if none are selected, all filtered invoices'),
+    )
+
+
 class BaseFilterForm(forms.Form):
     per_page = forms.IntegerField(
         required=False,
@@ -291,6 +304,17 @@ class PaymentMethodFilterForm(BaseFilterForm):
     )
 
 
+class InvoiceFilterForm(BaseFilterForm):
+    date__gte = forms.DateField(
+        required=False,
+        label=_('From'),
+    )
+    date__lte = forms.DateField(
+        required=False,
+        label=_('To'),
+    )
+
+
 class BankAccountFormNonRequired(forms.ModelForm):
     class Meta:
         model = BankAccount
@@ -0,0 +1,92 @@
+import math
+
+from django.conf import settings
+from django.db.models import Avg, Count, F, FloatField, Q
+from django.db.models.functions import (ASin, Cast, Cos, Floor, Power, Radians,
+                                        Sin, Sqrt)
+
+EARTH_RADIUS = 6371.0
+KM_PER_DEGREE = 111.32
+
+
+def wrap_longitude(longitude) -> float:
+    return (longitude + 180) % 360 - 180
+
+
+def parse_bbox(value):
+    '''
+    west,south,east,north as sent by leaflets LatLngBounds.toBBoxString
+    '''
+    try:
+        west, south, east, north = [float(part) for part in value.split(',')]
+    except (AttributeError, ValueError):
+        raise ValueError('bbox must be west,south,east,north')
+    if south > north:
+        raise ValueError('bbox south is above north')
+    return west, max(south, -90.0), east, min(north, 90.0)
+
+
+def get_bbox(latitude, longitude, radius):
+    '''
+    bounding box around a point with radius in km, used to narrow radius queries
+    '''
+    delta_lat = radius / KM_PER_DEGREE
+    south, north = max(latitude - delta_lat, -90.0), min(latitude + delta_lat, 90.0)
+    cos_lat = math.cos(math.radians(max(abs(south), abs(north))))
+    if cos_lat < 1e-6 or radius / (KM_PER_DEGREE * cos_lat) >= 180:
+        return -180.0, south, 180.0, north
+    delta_lng = radius / (KM_PER_DEGREE * cos_lat)
+    return longitude - delta_lng, south, longitude + delta_lng, north
+
+
+def within_bbox(queryset, west, south, east, north):
+    queryset = queryset.filter(latitude__gte=south, latitude__lte=north)
+    if east - west >= 360:
+        return queryset
+    west, east = wrap_longitude(west), wrap_longitude(east)
+    if west <= east:
+        return queryset.filter(longitude__gte=west, longitude__lte=east)
+    # the box crosses the antimeridian
+    return queryset.filter(Q(longitude__gte=west) | Q(longitude__lte=east))
+
+
+def within_radius(queryset, latitude, longitude, radius):
+    '''
+    filters by great circle distance in km and annotates it as distance
+    '''
+    queryset = within_bbox(queryset, *get_bbox(latitude, longitude, radius))
+    lat = Radians(Cast(F('latitude'), FloatField()))
+    lng = Radians(Cast(F('longitude'), FloatField()))
+    origin_lat, origin_lng = math.radians(latitude), math.radians(longitude)
+    haversine = (
+        Power(Sin((lat - origin_lat) / 2), 2)
+        + Cos(lat) * math.cos(origin_lat) * Power(Sin((lng - origin_lng) / 2), 2)
+    )
+    return queryset.annotate(
+        distance=2 * EARTH_RADIUS * ASin(Sqrt(haversine))
+    ).filter(distance__lte=radius)
+
+
+def get_cell_size(zoom) -> float:
+    '''width of a cluster cell in degrees, MAP_CLUSTER_CELL_SIZE pixels at zoom'''
+    return 360.0 / (256 * 2 ** zoom) * settings.MAP_CLUSTER_CELL_SIZE
+
+
+def cluster(queryset, zoom) -> list:
+    '''
+    groups the locations in a grid of cells and returns count and center per cell
+    '''
+    size = get_cell_size(zoom)
+    cells = queryset.annotate(
+        cell_x=Floor(Cast(F('longitude'), FloatField()) / size),
+        cell_y=Floor(Cast(F('latitude'), FloatField()) / size),
+    ).order_by().values('cell_x', 'cell_y').annotate(
+        count=Count('pk'),
+        center_latitude=Avg(Cast(F('latitude'), FloatField())),
+        center_longitude=Avg(Cast(F('longitude'), FloatField())),
+    )
+    return [{
+        'latitude': cell['center_latitude'],
+        'longitude': cell['center_longitude'],
+        'count': cell['count'],
+    } for cell in cells]
@@ -1,8 +1,15 @@
 
 
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.http import HttpRequest
 from django.template.loader import render_to_string
 from django.utils.html import mark_safe
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 from .signals import register_modules
@@ -72,20 +79,76 @@ def get_modules(map_function):
     return result
 
 
+# module structures per (method, actor type), built once per process
+_structures = {}
+_digests = {}
+
+
+def clear_module_structures():
+    _structures.clear()
+    _digests.clear()
+
+
+def get_actor_type(request) -> str:
+    if not request.user.is_authenticated:
+        return 'anonymous'
+    if request.user.pk == request.actor.pk:
+        return 'user'
+    return 'organization'
+
+
+def get_module_structure(method, request):
+    '''
+    structure returned by method of all registered modules, the modules may
+    only vary it by the actor type, so urls are reversed once per process
+    '''
+    key = (method, get_actor_type(request))
+    if key not in _structures:
+        _structures[key] = get_modules(
+            lambda tuple: getattr(tuple[1](), method)(request))
+    return key, _structures[key]
+
+
+def get_urls(structure) -> list:
+    urls = []
+    for item in structure:
+        if item:
+            urls.append(item['url'])
+            urls += get_urls(item.get('sub_items', []))
+            urls += get_urls(item.get('subsub_items', []))
+    return urls
+
+
+def render_modules(method, request, renderer, path_dependent=False) -> str:
+    '''
+    rendered module structure, cached per actor type and language
+    path dependent fragments are cached per set of urls matching the path
+    '''
+    key, structure = get_module_structure(method, request)
+    language = get_language()
+    if key + (language, ) not in _digests:
+        _digests[key + (language, )] = hashlib.md5(json.dumps(
+            structure, cls=DjangoJSONEncoder).encode()).hexdigest()
+    active = [url for url in get_urls(structure)
+              if url in request.path] if path_dependent else []
+    cache_key = 'modules:{}:{}:{}:{}'.format(
+        method, key[1], language, hashlib.md5('{}:{}'.format(
+            _digests[key + (language, )], active).encode()).hexdigest())
+    html = cache.get(cache_key)
+    if html is None:
+        html = renderer(structure, request)
+        cache.set(cache_key, html, settings.MODULES_CACHE_TTL)
+    return mark_safe(html)
+
+
 def navigation_bar(context, *args, **kwargs):
-    request = context.request
-    modules = get_modules(lambda tuple: tuple[1]().get_navbar_items(request))
-    return navbar_item_renderer(
-        modules,
-        request
-    )
+    return render_modules(
+        'get_navbar_items', context.request, navbar_item_renderer)
 
 
 def control_sidebar(context, *args, **kwargs):
-    request = context.request
-    modules = get_modules(
-        lambda tuple: tuple[1]().get_sidebar_modules(request))
-    return sidebar_module_renderer(modules, request)
+    return render_modules(
+        'get_sidebar_modules', context.request, sidebar_module_renderer, path_dependent=True)
 
 
 def location_profile(context, *args, **kwargs):
@@ -1,6 +1,76 @@
 """
 Big thanks to https://github.com/nitely/django-hooks for providing the logic
 """
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+from sekizai.helpers import Watcher, get_varname
+
+logger = logging.getLogger(__name__)
+
+# cache policies of hook callbacks
+STATIC = 'static'
+LANGUAGE = 'language'
+ACTOR = 'actor'
+
+
+class HookCallback(object):
+    """
+    A registered callback and its cache policy.\
+    Cached callbacks get the template context as first argument,\
+    their output must only vary by the policy and key
+    :param str cache: None, STATIC, LANGUAGE or ACTOR
+    :param int ttl: Seconds to cache, defaults to HOOK_CACHE_TTL
+    :param callable key: Returns additional parts of the cache key\
+    for the context, e.g. the pk of the displayed object
+    """
+
+    def __init__(self, name, func, cache=None, ttl=None, key=None):
+        assert cache in (None, STATIC, LANGUAGE, ACTOR), \
+            "Unknown cache policy {}".format(cache)
+        self.name = name
+        self.func = func
+        self.cache = cache
+        self.ttl = settings.HOOK_CACHE_TTL if ttl is None else ttl
+        self.key = key
+
+    def get_cache_key(self, context):
+        parts = ['hook', self.name, '{}.{}'.format(
+            self.func.__module__, self.func.__qualname__)]
+        if self.cache in (LANGUAGE, ACTOR):
+            parts.append(get_language())
+        if self.cache == ACTOR:
+            request = getattr(context, 'request', None)
+            user = getattr(request, 'user', None)
+            parts.append(request.actor.pk if user and user.is_authenticated
+                         else 'anonymous')
+        if self.key:
+            parts.append(self.key(context))
+        return ':'.join(str(part) for part in parts)
+
+    def __call__(self, *args, **kwargs):
+        if self.cache is None:
+            return self.func(*args, **kwargs)
+
+        context = args[0]
+        key = self.get_cache_key(context)
+        cached = cache.get(key)
+        if cached is None:
+            # blocks added with sekizai are cached and replayed as well
+            watcher = Watcher(context)
+            response = self.func(*args, **kwargs)
+            cache.set(key, (response, watcher.get_changes()), self.ttl)
+            return response
+
+        response, changes = cached
+        blocks = context.get(get_varname())
+        for name, values in changes.items():
+            for value in values:
+                blocks[name].append(value)
+        return response
 
 
 class TemplateHook(object):
@@ -11,8 +81,9 @@ class TemplateHook(object):
     this hook can pass along in a :py:func:`.__call__`
     """
 
-    def __init__(self, providing_args=None):
+    def __init__(self, providing_args=None, name=None):
         self.providing_args = providing_args or []
+        self.name = name
         self._registry = []
 
     def __call__(self, *args, **kwargs):
@@ -22,17 +93,18 @@ class TemplateHook(object):
         this is usually a list of HTML strings
         :rtype: list
         """
-        return [func(*args, **kwargs) for func in self._registry]
+        return [callback(*args, **kwargs) for callback in self._registry]
 
-    def register(self, func):
+    def register(self, func, **policy):
         """
         Register a new callback
         :param callable func: A function reference used as a callback
+        :param \*\*policy: Cache policy, see :py:class:`HookCallback`
         """
         assert callable(func), \
             "Callback func must be a callable"
 
-        self._registry.append(func)
+        self._registry.append(HookCallback(self.name, func, **policy))
 
     def unregister(self, func):
         """
@@ -40,10 +112,8 @@ class TemplateHook(object):
         :param callable func: A function reference\
         that was registered previously
         """
-        try:
-            self._registry.remove(func)
-        except ValueError:
-            pass
+        self._registry = [
+            callback for callback in self._registry if callback.func != func]
 
     def unregister_all(self):
         """
@@ -75,7 +145,17 @@ class Hook(object):
         except KeyError:
             return []
 
-        return templatehook(*args, **kwargs)
+        start = time.perf_counter()
+        responses = templatehook(*args, **kwargs)
+        duration = time.perf_counter() - start
+        logger.debug('hook %s took %.2f ms', name, duration * 1000)
+        # timings per hook are collected on the request of the template context
+        request = getattr(args[0], 'request', None) if args else None
+        if request is not None:
+            timings = getattr(request, 'hook_timings', {})
+            timings[name] = timings.get(name, 0) + duration
+            request.hook_timings = timings
+        return responses
 
     def _register(self, name):
         """
@@ -85,11 +165,11 @@ class Hook(object):
         :return: Instance of :py:class:`TemplateHook`
         :rtype: :py:class:`TemplateHook`
         """
-        templatehook = TemplateHook()
+        templatehook = TemplateHook(name=name)
         self._registry[name] = templatehook
         return templatehook
 
-    def register(self, name, func):
+    def register(self, name, func, **policy):
         """
         Register a new callback.\
         When the name/id is not found\
@@ -98,13 +178,14 @@ class Hook(object):
         the first registered callback
         :param str name: Hook name
         :param callable func: A func reference (callback)
+        :param \*\*policy: Cache policy, see :py:class:`HookCallback`
         """
         try:
             templatehook = self._registry[name]
         except KeyError:
             templatehook = self._register(name)
 
-        templatehook.register(func)
+        templatehook.register(func, **policy)
 
     def unregister(self, name, func):
         """
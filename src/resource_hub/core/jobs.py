@@ -1,11 +1,13 @@
 from datetime import datetime, timedelta
 
 import django_rq
+from django.conf import settings
 from django.core import mail
-from django.db.models import Max
-from django.utils import timezone
+from django.db import transaction
+from django.db.models import DateTimeField, ExpressionWrapper, F, Max
+from django.db.models.functions import Now
 from django_rq import job
-from resource_hub.core.models import Contract, Notification
+from resource_hub.core.models import Contract, Invoice, Notification
 
 
 def clear_schedule():
@@ -55,35 +57,36 @@ def expire_contracts():
             contract.set_expired()
 
 
+def build_mails(subject, message, recipients, attachments=None, connection=None) -> list:
+    # one message per recipient bc django class is not sending to multiple recipients
+    mails = []
+    for recipient in recipients:
+        email = mail.EmailMultiAlternatives(
+            subject,
+            message,
+            to=[recipient, ],
+            connection=connection,
+        )
+        email.attach_alternative(message, 'text/html')
+        if mails:
+            # attachments are read once per notification
+            email.attachments = list(mails[0].attachments)
+        elif attachments:
+            for attachment in attachments:
+                email.attach_file(attachment)
+        mails.append(email)
+    return mails
+
+
 @job('default')
 def send_mail(subject, message, recipients, attachments=None, connection=None):
     '''
     :param connection can only be used if job is executed synchonously
     as connection objects cannot be pickled by RQ
     '''
-
-    # loop through recipients bc django class is not sending to multiple recipients
-    for recipient in recipients:
-        if connection:
-            email = mail.EmailMultiAlternatives(
-                subject,
-                message,
-                to=[recipient, ],
-                connection=connection,
-            )
-
-        else:
-            email = mail.EmailMultiAlternatives(
-                subject,
-                message,
-                to=[recipient, ],
-            )
-        email.attach_alternative(message, 'text/html')
-        if attachments:
-            for attachment in attachments:
-                email.attach_file(attachment)
-
-        email.send(fail_silently=False)
+    connection = connection or mail.get_connection()
+    connection.send_messages(build_mails(
+        subject, message, recipients, attachments, connection))
 
 
 @job('high')
@@ -91,16 +94,57 @@ def send_notification_mails():
     Notification.send_open_mails()
 
 
+def get_due_contracts():
+    threshold = ExpressionWrapper(
+        Now() - F('contract_procedure__settlement_interval') *
+        timedelta(days=1),
+        output_field=DateTimeField(),
+    )
+    return Contract.objects.filter(
+        state=Contract.STATE.RUNNING,
+        contract_procedure__isnull=False,
+    ).annotate(
+        last_settlement=Max('settlement_logs__timestamp'),
+    ).filter(
+        last_settlement__gt=threshold,
+    )
+
+
 @job('low')
 def settle_claims():
-    for contract in Contract.objects.filter(state=Contract.STATE.RUNNING):
-        if contract.contract_procedure:
-            last_settlement = contract.settlement_logs.aggregate(
-                Max('timestamp'))
-            if timezone.now() - timedelta(days=contract.contract_procedure.settlement_interval) < last_settlement['timestamp__max']:
+    pks = list(get_due_contracts().order_by(
+        'pk').values_list('pk', flat=True))
+    chunk_size = settings.SETTLEMENT_CHUNK_SIZE
+    for i in range(0, len(pks), chunk_size):
+        settle_contract_claims.delay(pks[i:i + chunk_size])
+
+
+@job('low')
+def settle_contract_claims(pks):
+    for pk in pks:
+        with transaction.atomic():
+            # skip contracts which are settled by another worker
+            contract = Contract.objects.select_for_update(
+                skip_locked=True).filter(pk=pk).first()
+            if contract and get_due_contracts().filter(pk=pk).exists():
                 contract.settle_claims()
 
 
+@job('invoices')
+def render_invoice(pk):
+    try:
+        with transaction.atomic():
+            invoice = Invoice.objects.select_for_update().filter(pk=pk).first()
+            # jobs are keyed by invoice, skip invoices which are already rendered
+            if invoice is None or invoice.rendering == Invoice.RENDERING.DONE:
+                return
+            invoice.create_pdf()
+    except Exception:
+        Invoice.objects.filter(pk=pk).update(
+            rendering=Invoice.RENDERING.FAILED)
+        raise
+
+
 @job('high')
 def publish_contract_events():
     Contract.publish_events()
@@ -0,0 +1,44 @@
+from datetime import timedelta
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from resource_hub.core.models import Contract
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the claim generation of a contract, changes are rolled back'
+
+    def add_arguments(self, parser):
+        parser.add_argument('contract', type=int)
+        parser.add_argument('--occurrences', type=int,
+                            nargs='+', default=[1, 10, 52, 520])
+
+    def handle(self, *args, **options):
+        try:
+            contract = Contract.objects.get_subclass(pk=options['contract'])
+        except Contract.DoesNotExist:
+            raise CommandError('Contract does not exist')
+
+        start = timezone.now().replace(minute=0, second=0, microsecond=0)
+        for count in options['occurrences']:
+            occurrences = [
+                (start + timedelta(weeks=week),
+                 start + timedelta(weeks=week, hours=2))
+                for week in range(count)
+            ]
+            with transaction.atomic():
+                claims = contract.claim_set.count()
+                with CaptureQueriesContext(connection) as queries:
+                    begin = default_timer()
+                    contract.claim_factory(occurrences=occurrences)
+                    elapsed = default_timer() - begin
+                claims = contract.claim_set.count() - claims
+                transaction.set_rollback(True)
+
+            self.stdout.write('{} occurrences: {} claims, {} queries, {:.4f}s'.format(
+                count, claims, len(queries), elapsed))
+        self.stdout.write(self.style.SUCCESS('Benchmark finished'))
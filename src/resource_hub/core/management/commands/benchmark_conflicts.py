@@ -0,0 +1,77 @@
+import random
+from datetime import datetime, timedelta, timezone
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand
+
+from resource_hub.core.conflicts import IntervalIndex
+from resource_hub.core.utils import timespan_conflict
+
+
+def build_recurring_events(count, occurrences, seed=0):
+    rand = random.Random(seed)
+    origin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    intervals = []
+    for event in range(count):
+        start = origin + timedelta(
+            days=rand.randrange(365), hours=rand.randrange(8, 20))
+        duration = timedelta(minutes=rand.choice([30, 60, 90, 120]))
+        for week in range(occurrences):
+            occurrence_start = start + timedelta(weeks=week)
+            intervals.append(
+                (occurrence_start, occurrence_start + duration, event))
+    return intervals
+
+
+def build_long_events(count, seed=0):
+    '''events spanning most of the year, as long running bookings do'''
+    rand = random.Random(seed)
+    origin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    intervals = []
+    for event in range(count):
+        start = origin + timedelta(days=rand.randrange(30))
+        intervals.append(
+            (start, start + timedelta(days=rand.randrange(200, 330)), 'long-{}'.format(event)))
+    return intervals
+
+
+def naive_conflicts(intervals, existing):
+    return [
+        (start, end, other)
+        for start, end in intervals
+        for other in existing
+        if timespan_conflict(start, end, other[0], other[1])
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the conflict detection against recurring events'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=10000)
+        parser.add_argument('--occurrences', type=int, default=10)
+        parser.add_argument('--long-events', type=int, default=0,
+                            help='events spanning most of the year added to the existing ones')
+        parser.add_argument('--skip-naive', action='store_true')
+
+    def handle(self, *args, **options):
+        new = [(start, end) for start, end, _ in build_recurring_events(
+            1, 52, seed=1)]
+        for count in (options['events'] // 10, options['events'] // 2, options['events']):
+            existing = build_recurring_events(count, options['occurrences'])
+            existing += build_long_events(options['long_events'])
+
+            begin = default_timer()
+            conflicts = IntervalIndex(existing).find_conflicts(new)
+            indexed = default_timer() - begin
+            line = '{} events ({} intervals): index {:.4f}s'.format(
+                count, len(existing), indexed)
+
+            if not options['skip_naive']:
+                begin = default_timer()
+                naive = naive_conflicts(new, existing)
+                line += ', naive {:.4f}s'.format(default_timer() - begin)
+                assert len(naive) == len(conflicts)
+
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS('Benchmark finished'))
@@ -0,0 +1,36 @@
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand, CommandError
+
+from resource_hub.core.models import Invoice
+from resource_hub.core.renderer import InvoiceRenderer, clear_renderer_cache
+from resource_hub.core.utils import language
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the invoice rendering with and without the renderer cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('invoice', type=int)
+        parser.add_argument('--runs', type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            locale = Invoice.objects.get(pk=options['invoice']).locale
+        except Invoice.DoesNotExist:
+            raise CommandError('Invoice does not exist')
+
+        with language(locale):
+            for cached in (False, True):
+                clear_renderer_cache()
+                elapsed = 0
+                for i in range(options['runs']):
+                    if not cached:
+                        clear_renderer_cache()
+                    invoice = Invoice.objects.get(pk=options['invoice'])
+                    begin = default_timer()
+                    InvoiceRenderer().generate(invoice)
+                    elapsed += default_timer() - begin
+                self.stdout.write('{}: {:.4f}s per invoice'.format(
+                    'cached' if cached else 'uncached', elapsed / options['runs']))
+        self.stdout.write(self.style.SUCCESS('Benchmark finished'))
@@ -0,0 +1,171 @@
+import logging
+import time
+from contextvars import ContextVar
+
+from django.core.cache import cache
+from django.template.base import Template
+from django_redis import get_redis_connection
+from django_redis.cache import RedisCache
+from django_rq.queues import DjangoRQ
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# metrics of the request handled in the current thread
+current_metrics = ContextVar('current_metrics', default=None)
+
+# name, help text of the counters exported per view
+METRICS = [
+    ('requests_total', 'Handled requests'),
+    ('request_seconds_total', 'Time spent handling requests'),
+    ('db_queries_total', 'Executed SQL queries'),
+    ('db_seconds_total', 'Time spent executing SQL queries'),
+    ('template_seconds_total', 'Time spent rendering templates'),
+    ('cache_hits_total', 'Cache hits'),
+    ('cache_misses_total', 'Cache misses'),
+    ('rq_enqueued_total', 'Jobs enqueued to redis queue'),
+]
+MISSING = object()
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.enqueued = 0
+        self.rendering = False
+
+    def execute(self, execute, sql, params, many, context):
+        '''execute wrapper of the database connection'''
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - start
+
+    def get_values(self, duration) -> dict:
+        return {
+            'requests_total': 1,
+            'request_seconds_total': duration,
+            'db_queries_total': self.queries,
+            'db_seconds_total': self.db_time,
+            'template_seconds_total': self.template_time,
+            'cache_hits_total': self.cache_hits,
+            'cache_misses_total': self.cache_misses,
+            'rq_enqueued_total': self.enqueued,
+        }
+
+    def get_headers(self, view_name, duration) -> dict:
+        return {
+            'X-View-Name': view_name,
+            'X-Response-Time': '{:.2f}ms'.format(duration * 1000),
+            'X-Query-Count': str(self.queries),
+            'X-DB-Time': '{:.2f}ms'.format(self.db_time * 1000),
+            'X-Template-Time': '{:.2f}ms'.format(self.template_time * 1000),
+            'X-Cache-Hits': str(self.cache_hits),
+            'X-Cache-Misses': str(self.cache_misses),
+            'X-RQ-Enqueued': str(self.enqueued),
+        }
+
+
+class InstrumentedRedisCache(RedisCache):
+    '''counts hits and misses for the metrics of the current request'''
+
+    def get(self, key, default=None, *args, **kwargs):
+        value = super(InstrumentedRedisCache, self).get(
+            key, MISSING, *args, **kwargs)
+        metrics = current_metrics.get()
+        if metrics is not None:
+            if value is MISSING:
+                metrics.cache_misses += 1
+            else:
+                metrics.cache_hits += 1
+        return default if value is MISSING else value
+
+    def get_many(self, keys, *args, **kwargs):
+        values = super(InstrumentedRedisCache, self).get_many(
+            keys, *args, **kwargs)
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.cache_hits += len(values)
+            metrics.cache_misses += len(keys) - len(values)
+        return values
+
+
+class InstrumentedQueue(DjangoRQ):
+    '''counts enqueued jobs for the metrics of the current request'''
+
+    def enqueue_call(self, *args, **kwargs):
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.enqueued += 1
+        return super(InstrumentedQueue, self).enqueue_call(*args, **kwargs)
+
+
+def instrument_templates():
+    '''
+    times the outermost template rendered during a request,
+    templates have no hooks for this, so Template._render is wrapped once
+    '''
+    if getattr(Template._render, 'instrumented', False):
+        return
+    render = Template._render
+
+    def _render(self, context):
+        metrics = current_metrics.get()
+        if metrics is None or metrics.rendering:
+            return render(self, context)
+        metrics.rendering = True
+        start = time.perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            metrics.template_time += time.perf_counter() - start
+            metrics.rendering = False
+
+    _render.instrumented = True
+    Template._render = _render
+
+
+def get_metrics_key() -> str:
+    return cache.make_key('metrics')
+
+
+def record_metrics(view_name, metrics, duration):
+    '''
+    adds the request to the counters shared by all processes
+    lost if redis is unavailable, the response must not fail because of it
+    '''
+    try:
+        pipeline = get_redis_connection('default').pipeline()
+        for name, value in metrics.get_values(duration).items():
+            pipeline.hincrbyfloat(
+                get_metrics_key(), '{}|{}'.format(name, view_name), value)
+        pipeline.execute()
+    except RedisError:
+        logger.exception('Recording metrics of %s failed', view_name)
+
+
+def clear_metrics():
+    get_redis_connection('default').delete(get_metrics_key())
+
+
+def render_metrics() -> str:
+    '''counters in the prometheus text format'''
+    counters = {}
+    for field, value in get_redis_connection('default').hgetall(get_metrics_key()).items():
+        name, view_name = field.decode().split('|', 1)
+        counters.setdefault(name, []).append((view_name, float(value)))
+
+    lines = []
+    for name, help_text in METRICS:
+        lines.append('# HELP resource_hub_{} {}'.format(name, help_text))
+        lines.append('# TYPE resource_hub_{} counter'.format(name))
+        for view_name, value in sorted(counters.get(name, [])):
+            lines.append('resource_hub_{}{{view="{}"}} {}'.format(
+                name, view_name.replace('\\', '\\\\').replace('"', '\\"'), value))
+    return '\n'.join(lines) + '\n'
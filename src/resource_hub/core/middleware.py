@@ -1,10 +1,17 @@
+import time
+
+from django.conf import settings
 from django.contrib.auth import user_logged_in
+from django.db import connection
 from django.dispatch import receiver
 from django.utils import translation
 from django.utils.deprecation import MiddlewareMixin
 from django.utils.functional import SimpleLazyObject
 
+from resource_hub.core.metrics import (RequestMetrics, current_metrics,
+                                       instrument_templates, record_metrics)
 from resource_hub.core.models import Actor
+from resource_hub.core.utils import get_actor
 
 
 class ActorMiddleware:
@@ -28,8 +35,39 @@ class ActorMiddleware:
     @staticmethod
     def get_actor(request):
         if 'actor_id' in request.session:
-            actor_id = request.session['actor_id']
-            actor = Actor.objects.get(id=actor_id)
+            actor = get_actor(request.session['actor_id'])
         else:
             actor = None
         return actor
+
+
+class InstrumentationMiddleware:
+    '''
+    per request query count, db, template and cache metrics tagged by url name
+    added to MIDDLEWARE with INSTRUMENTATION, debug headers only with DEBUG
+    '''
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        instrument_templates()
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(metrics.execute):
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        duration = time.perf_counter() - start
+
+        match = request.resolver_match
+        view_name = match.view_name if match else 'unresolved'
+        record_metrics(view_name, metrics, duration)
+        if settings.DEBUG:
+            for header, value in metrics.get_headers(view_name, duration).items():
+                response[header] = value
+            response['X-Hook-Time'] = '{:.2f}ms'.format(
+                sum(getattr(request, 'hook_timings', {}).values()) * 1000)
+        return response
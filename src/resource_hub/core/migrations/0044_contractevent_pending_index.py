@@ -0,0 +1,17 @@
+# Generated by Django 3.1 on 2026-10-18 03:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0043_auto_20200930_0845'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contractevent',
+            index=models.Index(condition=models.Q(state='p'), fields=['id'], name='core_contractevent_pending'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.1 on 2026-10-18 03:15
+
+from django.db import migrations, models
+
+
+def set_rendered(apps, schema_editor):
+    Invoice = apps.get_model('core', 'Invoice')
+    Invoice.objects.exclude(file_ptr__file='').update(rendering='d')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0044_contractevent_pending_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='invoice',
+            name='rendering',
+            field=models.CharField(choices=[('p', 'pending'), ('d', 'done'), ('f', 'failed')], default='p', max_length=1, verbose_name='Rendering status'),
+        ),
+        migrations.RunPython(set_rendered, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 3.1 on 2026-10-18 03:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0045_invoice_rendering'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InvoiceSequence',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefix', models.CharField(max_length=160, verbose_name='Prefix')),
+                ('value', models.PositiveIntegerField(default=0, verbose_name='Last number')),
+                ('creditor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='invoice_sequences', to='core.actor', verbose_name='Creditor')),
+            ],
+            options={
+                'unique_together': {('creditor', 'prefix')},
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 3.1 on 2026-10-18 03:37
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# frozen copy of resource_hub.core.search.build_search_vector,
+# later changes of the application must not change this migration
+SEARCH_CONFIGS = ['german', 'english']
+
+
+def build_search_vector(fields):
+    vector = None
+    for config in SEARCH_CONFIGS:
+        for field, weight in fields:
+            part = django.contrib.postgres.search.SearchVector(
+                field, weight=weight, config=config)
+            vector = part if vector is None else vector + part
+    return vector
+
+
+SEARCH_FIELDS = [('name', 'A'), ('description', 'C')]
+
+
+def update_search_vectors(apps, schema_editor):
+    Location = apps.get_model('core', 'Location')
+    Location.objects.update(search_vector=build_search_vector(SEARCH_FIELDS))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0046_invoice_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='location',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='core_locati_search__1ce27a_gin'),
+        ),
+        migrations.RunPython(update_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1 on 2026-10-18 03:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0047_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['latitude', 'longitude'], name='core_locati_latitud_367ccc_idx'),
+        ),
+    ]
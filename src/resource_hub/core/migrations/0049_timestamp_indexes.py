@@ -0,0 +1,49 @@
+# Generated by Django 3.1 on 2026-10-18 03:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0048_location_coordinates_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['created_at', 'id'], name='core_claim_created_e48185_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['updated_at', 'id'], name='core_claim_updated_464ccd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['created_at', 'id'], name='core_contra_created_6cbcb1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['updated_at', 'id'], name='core_contra_updated_a0b7eb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=models.Index(fields=['created_at', 'id'], name='core_file_created_4d5eef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['created_at', 'id'], name='core_notifi_created_d584c6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['updated_at', 'id'], name='core_notifi_updated_d653c5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['created_at', 'id'], name='core_paymen_created_fe3ed3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['updated_at', 'id'], name='core_paymen_updated_9874e1_idx'),
+        ),
+    ]
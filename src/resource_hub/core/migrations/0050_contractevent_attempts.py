@@ -0,0 +1,18 @@
+# Generated by Django 3.1 on 2026-10-18 04:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0049_timestamp_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contractevent',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -4,10 +4,11 @@ from .actors import (Actor, Organization, OrganizationInvitation,
 from .assets import AssetMixin, BaseAsset
 from .base import (Address, BankAccount, BaseModel, BaseStateMachine, Gallery,
                    GalleryImage, Location)
-from .contracts import (BaseTrigger, Claim, Contract, ContractProcedure,
-                        ContractTrigger, DeclarationOfIntent, PaymentMethod,
-                        SettlementLog)
+from .contracts import (BaseTrigger, Claim, ClaimBuilder, Contract,
+                        ContractProcedure, ContractTrigger,
+                        DeclarationOfIntent, PaymentMethod, SettlementLog)
 from .files import File, ICSFile
 from .finance import Payment, Price, PriceProfile
-from .invoices import Invoice, InvoicePosition, invoice_filename, today
+from .invoices import (Invoice, InvoicePosition, InvoiceSequence,
+                       invoice_filename, today)
 from .notifications import Notification, NotificationAttachment
@@ -215,8 +215,10 @@ class Organization(Actor):
 
     @property
     def notification_recipients(self) -> list:
-        if self.notification_recipient_set.exists():
-            return list(Organization.objects.get(pk=2).notification_recipient_set.all().values_list('email', flat=True))
+        recipients = [
+            recipient.email for recipient in self.notification_recipient_set.all()]
+        if recipients:
+            return recipients
         return [self.email_public, ]
     # Methods
 
@@ -1,11 +1,14 @@
 
 import uuid
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Value
 from django.utils.translation import gettext_lazy as _
 from imagekit.models import ImageSpecField
 from imagekit.processors import ResizeToFill
 
+from ..search import build_search_vector
 from .base import BaseModel, Gallery, Location
 from .finance import Price
 
@@ -60,10 +63,29 @@ class AssetMixin(models.Model):
         on_delete=models.PROTECT,
         verbose_name=_('Base price'),
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+    )
+
+    # weighted fields of the search vector, the location name has weight B
+    SEARCH_FIELDS = [
+        ('name', 'A'),
+        ('description', 'C'),
+    ]
 
     class Meta:
         abstract = True
 
+    @classmethod
+    def get_search_vector(cls, location_name):
+        location = Value(location_name or '', output_field=models.CharField())
+        return build_search_vector(cls.SEARCH_FIELDS + [(location, 'B')])
+
+    def update_search_vector(self):
+        self.__class__.all_objects.filter(pk=self.pk).update(
+            search_vector=self.get_search_vector(self.location.name))
+
 
 class BaseAsset(AssetMixin, BaseModel):
     class Meta:
@@ -1,5 +1,7 @@
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
@@ -9,6 +11,7 @@ from model_utils.fields import MonitorField
 from model_utils.managers import InheritanceManager
 
 from ..managers import CombinedManager
+from ..search import build_search_vector
 from ..utils import get_valid_slug
 
 
@@ -253,10 +256,23 @@ class Location(BaseModel):
         on_delete=models.CASCADE,
         verbose_name=_('Owner'),
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+    )
+
+    SEARCH_FIELDS = [
+        ('name', 'A'),
+        ('description', 'C'),
+    ]
 
     # Metadata
     class Meta:
         ordering = ['name']
+        indexes = [
+            GinIndex(fields=['search_vector']),
+            models.Index(fields=['latitude', 'longitude']),
+        ]
 
     # Methods
     def __str__(self):
@@ -268,6 +284,10 @@ class Location(BaseModel):
 
         super(Location, self).save(*args, **kwargs)
 
+    def update_search_vector(self):
+        Location.all_objects.filter(pk=self.pk).update(
+            search_vector=build_search_vector(self.SEARCH_FIELDS))
+
 
 class Gallery(BaseModel):
     pass
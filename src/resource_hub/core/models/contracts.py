@@ -3,8 +3,9 @@ import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from django.conf import settings
 from django.db import models, transaction
-from django.db.models import Min, Q, Sum
+from django.db.models import F, Min, Q, Sum
 from django.http import HttpResponse
 from django.shortcuts import reverse
 from django.utils import timezone
@@ -322,6 +323,12 @@ class DeclarationOfIntent(models.Model):
 
 
 class Contract(BaseContract):
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
+        ]
+
     @property
     def verbose_name(self) -> str:
         return _('Contract')
@@ -564,7 +571,7 @@ class Contract(BaseContract):
                     pk=self.payment_method.pk)
                 if self.contract_procedure.is_invoicing and total > Decimal('0.0'):
                     invoice = Invoice.build(self, open_claims, self.creditor)
-                    invoice.create_pdf()
+                    invoice.create_pdf_async()
                     InvoiceCreatedEvent.build(
                         contract=self,
                         invoice=invoice,
@@ -580,16 +587,70 @@ class Contract(BaseContract):
         self.settlement_logs.create()
 
     @classmethod
-    def publish_events(cls):
-        events = ContractEvent.objects.filter(
-            state=ContractEvent.STATE.PENDING)
-        for event in events:
-            for trigger in event.contract.contract_procedure.triggers.filter(event=event.type_).select_subclasses():
-                trigger.call(event)
-            logging.info('[%s] Published %s (%s)',
-                         datetime.now(),
-                         event.verbose_name, event.uuid)
-            event.set_published()
+    def publish_events(cls, batch_size=None):
+        batch_size = batch_size or settings.CONTRACT_EVENT_BATCH_SIZE
+        event_types = {
+            event_class.TYPE: event for event, event_class in cls.EVENT_CLASSES.items()
+        }
+        triggers = {}
+        # events failed in this run are retried by the next run
+        failed = set()
+        while True:
+            with transaction.atomic():
+                # claim a batch, pending events locked by other workers are skipped
+                events = list(ContractEvent.objects.select_for_update(
+                    skip_locked=True, of=('self', )
+                ).filter(
+                    state=ContractEvent.STATE.PENDING
+                ).exclude(
+                    pk__in=failed
+                ).select_related('contract').select_subclasses().order_by('pk')[:batch_size])
+                if not events:
+                    break
+
+                published, batch_failed = [], []
+                for event in events:
+                    key = (event.contract.contract_procedure_id,
+                           event_types.get(event.type_))
+                    if key not in triggers:
+                        triggers[key] = list(ContractTrigger.objects.filter(
+                            procedure=key[0], event=key[1]
+                        ).select_subclasses()) if key[0] and key[1] else []
+                    try:
+                        # a failing trigger must not roll back the rest of the batch
+                        with transaction.atomic():
+                            for trigger in triggers[key]:
+                                trigger.call(event)
+                    except Exception:
+                        logging.exception('[%s] Publishing %s (%s) failed',
+                                          datetime.now(),
+                                          event.verbose_name, event.uuid)
+                        batch_failed.append(event.pk)
+                        continue
+                    logging.info('[%s] Published %s (%s)',
+                                 datetime.now(),
+                                 event.verbose_name, event.uuid)
+                    event.set_published()
+                    published.append(event.pk)
+
+                ContractEvent.objects.filter(
+                    pk__in=published
+                ).update(
+                    state=ContractEvent.STATE.PUBLISHED,
+                    state_changed=timezone.now(),
+                )
+                if batch_failed:
+                    failed.update(batch_failed)
+                    ContractEvent.objects.filter(
+                        pk__in=batch_failed
+                    ).update(attempts=F('attempts') + 1)
+                    ContractEvent.objects.filter(
+                        pk__in=batch_failed,
+                        attempts__gte=settings.CONTRACT_EVENT_MAX_ATTEMPTS,
+                    ).update(
+                        state=ContractEvent.STATE.FAILED,
+                        state_changed=timezone.now(),
+                    )
 
 
 class SettlementLog(BaseModel):
@@ -686,26 +747,58 @@ class Claim(BaseStateMachine):
         verbose_name=_('Performance period end'),
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
+        ]
+
     @classmethod
     def build(cls, contract, item, quantity, unit, price, start, end):
+        claim = ClaimBuilder(contract).add(
+            item, quantity, unit, price, start, end)
+        claim.save()
+        return claim
+
+
+class ClaimBuilder:
+    '''
+    collects the claims of a contract in memory and writes them at once
+    '''
+
+    def __init__(self, contract):
+        self.contract = contract
+        self.price_profile = contract.price_profile
+        self.contract_procedure = contract.contract_procedure
+        self.discount = self.price_profile.discount if self.price_profile else 0
+        self.claims = []
+        self.net_total = 0
+
+    def add(self, item, quantity, unit, price, start, end):
         net = quantity * float(price.value)
-        discounted_net = contract.price_profile.apply(
-            net) if contract.price_profile else net
-        gross = contract.contract_procedure.apply_tax(discounted_net)
-        return cls.objects.create(
-            contract=contract,
+        discounted_net = self.price_profile.apply(
+            net) if self.price_profile else net
+        claim = Claim(
+            contract=self.contract,
             item=item,
             quantity=quantity,
             unit=unit,
             price=price.value,
             currency=price.currency,
             net=net,
+            discount=self.discount,
             discounted_net=discounted_net,
-            tax_rate=contract.contract_procedure.tax_rate,
-            gross=gross,
+            tax_rate=self.contract_procedure.tax_rate,
+            gross=self.contract_procedure.apply_tax(discounted_net),
             period_start=start,
             period_end=end,
         )
+        self.claims.append(claim)
+        self.net_total += net
+        return claim
+
+    def save(self):
+        return Claim.objects.bulk_create(self.claims)
 
 
 class BaseTrigger(BaseModel):
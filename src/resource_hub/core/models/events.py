@@ -1,6 +1,7 @@
 import uuid
 
 from django.db import models
+from django.db.models import Q
 from django.forms import model_to_dict
 from django.utils.translation import gettext_lazy as _
 from resource_hub.core.models import BaseStateMachine
@@ -16,14 +17,16 @@ TYPES = get_types()
 class BaseEvent(BaseStateMachine):
     class STATE(BaseStateMachine.STATE):
         PUBLISHED = 'ps'
+        FAILED = 'fa'
 
     STATES = [
         *BaseStateMachine.STATES,
         (STATE.PUBLISHED, _('published')),
+        (STATE.FAILED, _('failed')),
     ]
 
     STATE_GRAPH = {
-        STATE.PENDING: {STATE.PUBLISHED},
+        STATE.PENDING: {STATE.PUBLISHED, STATE.FAILED},
     }
 
     # unique char, that identifies the event type
@@ -33,6 +36,10 @@ class BaseEvent(BaseStateMachine):
         default=uuid.uuid4,
     )
     context = models.JSONField()
+    # failed publishing attempts
+    attempts = models.PositiveIntegerField(
+        default=0,
+    )
 
     @property
     def verbose_name(self):
@@ -77,6 +84,16 @@ class ContractEvent(BaseEvent):
     def build_context(cls, kwargs):
         return {}
 
+    class Meta:
+        indexes = [
+            # outbox of events waiting to be published
+            models.Index(
+                fields=['id'],
+                name='core_contractevent_pending',
+                condition=Q(state=BaseEvent.STATE.PENDING),
+            ),
+        ]
+
 
 class StateChangedEvent(ContractEvent):
     TYPE = 'st_ev'
@@ -44,6 +44,11 @@ class File(BaseModel):
         verbose_name=_('actor'),
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
+
     @property
     def directory(self) -> str:
         return 'default'
@@ -66,6 +66,12 @@ class Payment(BaseStateMachine):
         verbose_name=_('Payment method'),
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
+        ]
+
 
 class Price(BaseModel):
     addressee = models.ForeignKey(
@@ -1,7 +1,7 @@
 import string
 
 from django.core.files.base import ContentFile
-from django.db import DatabaseError, models, transaction
+from django.db import models, transaction
 from django.db.models import Max
 from django.db.models.functions import Cast
 from django.shortcuts import reverse
@@ -33,6 +33,17 @@ class Invoice(File):
     '''
     thanks to https://github.com/pretix/pretix/blob/master/src/pretix/base/models/invoices.py
     '''
+    class RENDERING:
+        PENDING = 'p'
+        DONE = 'd'
+        FAILED = 'f'
+
+    RENDERING_STATES = [
+        (RENDERING.PENDING, _('pending')),
+        (RENDERING.DONE, _('done')),
+        (RENDERING.FAILED, _('failed')),
+    ]
+
     contract = models.ForeignKey(
         'Contract', related_name='invoices', db_index=True, on_delete=models.CASCADE)
     prefix = models.CharField(max_length=160, db_index=True)
@@ -71,6 +82,12 @@ class Invoice(File):
         decimal_places=4, max_digits=10, null=True, blank=True)
     foreign_currency_rate_date = models.DateField(null=True, blank=True)
     shredded = models.BooleanField(default=False)
+    rendering = models.CharField(
+        max_length=1,
+        choices=RENDERING_STATES,
+        default=RENDERING.PENDING,
+        verbose_name=_('Rendering status'),
+    )
 
     internal_reference = models.TextField(blank=True)
     custom_field = models.CharField(max_length=255, null=True)
@@ -146,8 +163,8 @@ class Invoice(File):
         ]
         return '\n'.join([p.strip() for p in parts if p and p.strip()])
 
-    def _get_numeric_invoice_number(self):
-        numeric_invoices = Invoice.objects.filter(
+    def _get_max_invoice_number(self):
+        return Invoice.objects.filter(
             contract__creditor=self.contract.creditor,
             prefix=self.prefix,
         ).exclude(invoice_no__contains='-').annotate(
@@ -155,7 +172,11 @@ class Invoice(File):
         ).aggregate(
             max=Max('numeric_number')
         )['max'] or 0
-        return self._to_numeric_invoice_number(numeric_invoices + 1)
+
+    def _get_numeric_invoice_number(self):
+        number = InvoiceSequence.next_value(
+            self.contract.creditor, self.prefix, self._get_max_invoice_number)
+        return self._to_numeric_invoice_number(number)
 
     def save(self, *args, **kwargs):
         if not self.contract:
@@ -166,19 +187,11 @@ class Invoice(File):
             if self.is_cancellation:
                 self.prefix = self.contract.creditor.invoice_numbers_prefix_cancellations or self.prefix
 
-        if not self.invoice_no:
-            for i in range(10):
+        with transaction.atomic():
+            if not self.invoice_no:
                 self.invoice_no = self._get_numeric_invoice_number()
-                try:
-                    with transaction.atomic():
-                        return super().save(*args, **kwargs)
-                except DatabaseError:
-                    # Suppress duplicate key errors and try again
-                    if i == 9:
-                        raise
-
-        self.full_invoice_no = self.number
-        return super().save(*args, **kwargs)
+            self.full_invoice_no = self.number
+            return super().save(*args, **kwargs)
 
     def delete(self, *args, **kwargs):
         """
@@ -213,7 +226,8 @@ class Invoice(File):
             self.file.delete()
         with language(self.locale):
             fname, ftype, fcontent = InvoiceRenderer().generate(self)
-            self.file.save(fname, ContentFile(fcontent))
+            self.file.save(fname, ContentFile(fcontent), save=False)
+            self.rendering = self.RENDERING.DONE
             self.save()
             Notification.build(
                 type_=Notification.TYPE.MONETARY,
@@ -233,6 +247,14 @@ class Invoice(File):
             )
         return self.file.name
 
+    def create_pdf_async(self):
+        '''
+        renders the pdf on the invoices queue once the transaction is committed
+        '''
+        from ..jobs import render_invoice
+        transaction.on_commit(lambda: render_invoice.delay(
+            self.pk, job_id='render-invoice-{}'.format(self.pk)))
+
     @classmethod
     def build(cls, contract, claims, owner):
         invoice = cls()
@@ -285,8 +307,8 @@ class Invoice(File):
 
             invoice.save()
 
-            for i, c in enumerate(claims.order_by('-period_start')):
-                InvoicePosition.objects.create(
+            InvoicePosition.objects.bulk_create([
+                InvoicePosition(
                     position=i,
                     invoice=invoice,
                     item=c.item,
@@ -302,10 +324,55 @@ class Invoice(File):
                     period_start=c.period_start,
                     period_end=c.period_end,
                 )
+                for i, c in enumerate(claims.order_by('-period_start'))
+            ])
 
             return invoice
 
 
+class InvoiceSequence(models.Model):
+    '''
+    last issued invoice number per creditor and prefix
+    the row lock serializes number allocation without scanning all invoices
+    '''
+    creditor = models.ForeignKey(
+        'Actor',
+        on_delete=models.CASCADE,
+        related_name='invoice_sequences',
+        verbose_name=_('Creditor'),
+    )
+    prefix = models.CharField(
+        max_length=160,
+        verbose_name=_('Prefix'),
+    )
+    value = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Last number'),
+    )
+
+    class Meta:
+        unique_together = ('creditor', 'prefix')
+
+    def __str__(self):
+        return '{}: {}-{}'.format(self.creditor, self.prefix, self.value)
+
+    @classmethod
+    def next_value(cls, creditor, prefix, initial=0) -> int:
+        '''
+        increments the sequence and returns the new value
+        initial (value or callable) seeds a sequence that does not exist yet
+        must be called inside a transaction, the row stays locked until commit
+        '''
+        sequence, created = cls.objects.select_for_update().get_or_create(
+            creditor=creditor,
+            prefix=prefix,
+            defaults={'value': initial},
+        )
+        sequence.value += 1
+        sequence.save(update_fields=['value'])
+        return sequence.value
+
+
 class InvoicePosition(models.Model):
     invoice = models.ForeignKey(
         'Invoice', related_name='positions', on_delete=models.CASCADE)
@@ -1,14 +1,20 @@
+import logging
+from collections import defaultdict
+from smtplib import SMTPException
 
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core import mail
 from django.db import models
+from django.db.models import F, prefetch_related_objects
 from django.template.loader import render_to_string
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from resource_hub.core.utils import language
 
-from .actors import Actor
+from .actors import Actor, Organization
 from .base import BaseModel, BaseStateMachine
 from .constants import LEVEL, LEVELS
 from .files import File
@@ -66,9 +72,10 @@ class Notification(BaseStateMachine):
         and settings
         '''
         SENT = 's'
+        FAILED = 'f'
 
     STATE_GRAPH = {
-        STATE.PENDING: {STATE.SENT}
+        STATE.PENDING: {STATE.SENT, STATE.FAILED}
     }
 
     # fields
@@ -116,6 +123,16 @@ class Notification(BaseStateMachine):
         default=False,
         verbose_name=_('Read?'),
     )
+    # failed mailing attempts
+    attempts = models.PositiveIntegerField(
+        default=0,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
+        ]
 
     @property
     def type_(self):
@@ -126,27 +143,33 @@ class Notification(BaseStateMachine):
     def get_type_icon(cls, type_):
         return cls.TYPE_ICON_MAP.get(type_, cls.TYPE_ICON_MAP['default'])
 
+    def get_mails(self, recipient, connection=None) -> list:
+        '''
+        has to be called in the language of the recipient
+        '''
+        from ..jobs import build_mails
+        if self.level < recipient.notification_level:
+            return []
+        message = render_to_string('core/mail_notification.html', context={
+            'recipient': recipient,
+            'link': self.link,
+            'message': self.message,
+        })
+        return build_mails(
+            subject=self.header,
+            message=message,
+            recipients=recipient.notification_recipients,
+            attachments=[
+                attachment.file.path for attachment in self.attachments.all()],
+            connection=connection,
+        )
+
     def send_mail(self, connection=None):
-        from ..jobs import send_mail
-        attachments = []
-        for attachment in self.attachments.all():
-            attachments.append(attachment.file.path)
-        recipient = Actor.objects.get_subclass(pk=self.recipient.pk)
-
-        if self.level >= recipient.notification_level:
-            with language(recipient.language):
-                message = render_to_string('core/mail_notification.html', context={
-                    'recipient': recipient,
-                    'link': self.link,
-                    'message': self.message,
-                })
-            send_mail(
-                subject=self.header,
-                message=message,
-                recipients=recipient.notification_recipients,
-                attachments=attachments,
-                connection=connection,
-            )
+        connection = connection or mail.get_connection()
+        recipient = Actor.objects.get_subclass(pk=self.recipient_id)
+        with language(recipient.language):
+            mails = self.get_mails(recipient, connection)
+        connection.send_messages(mails)
         self.move_to(self.STATE.SENT)
         self.save()
 
@@ -171,12 +194,73 @@ class Notification(BaseStateMachine):
         return notification
 
     @classmethod
-    def send_open_mails(cls):
-        connection = mail.get_connection()
-        connection.open()
-        for notification in cls.objects.filter(state=cls.STATE.PENDING):
-            notification.send_mail(connection)
-        connection.close()
+    def send_open_mails(cls, batch_size=None):
+        batch_size = batch_size or settings.NOTIFICATION_MAIL_BATCH_SIZE
+        # notifications failed in this run are retried by the next run
+        failed = set()
+        while True:
+            notifications = list(cls.objects.filter(
+                state=cls.STATE.PENDING
+            ).exclude(
+                pk__in=failed
+            ).order_by('pk').prefetch_related('attachments__file')[:batch_size])
+            if not notifications:
+                break
+
+            recipients = {
+                recipient.pk: recipient for recipient in Actor.all_objects.filter(
+                    pk__in={n.recipient_id for n in notifications}
+                ).select_subclasses()
+            }
+            prefetch_related_objects(
+                [r for r in recipients.values() if isinstance(
+                    r, Organization)],
+                'notification_recipient_set',
+            )
+
+            # render grouped by language
+            by_language = defaultdict(list)
+            for notification in notifications:
+                recipient = recipients[notification.recipient_id]
+                by_language[recipient.language].append(
+                    (notification, recipient))
+
+            batch_failed = []
+            # one connection per batch, smtp servers limit the messages per connection
+            connection = mail.get_connection()
+            connection.open()
+            try:
+                for lang, group in by_language.items():
+                    with language(lang):
+                        for notification, recipient in group:
+                            try:
+                                connection.send_messages(notification.get_mails(
+                                    recipient, connection))
+                            except (SMTPException, OSError):
+                                logging.exception('[%s] Mailing notification %s failed',
+                                                  timezone.now(), notification.pk)
+                                batch_failed.append(notification.pk)
+                                continue
+                            # mark right away, so a later failure does not send it twice
+                            cls.objects.filter(pk=notification.pk).update(
+                                state=cls.STATE.SENT,
+                                state_changed=timezone.now(),
+                            )
+            finally:
+                connection.close()
+
+            if batch_failed:
+                failed.update(batch_failed)
+                cls.objects.filter(
+                    pk__in=batch_failed
+                ).update(attempts=F('attempts') + 1)
+                cls.objects.filter(
+                    pk__in=batch_failed,
+                    attempts__gte=settings.NOTIFICATION_MAIL_MAX_ATTEMPTS,
+                ).update(
+                    state=cls.STATE.FAILED,
+                    state_changed=timezone.now(),
+                )
 
 
 class NotificationAttachment(BaseModel):
@@ -19,7 +19,8 @@ class BaseModule():
 
     def get_sidebar_modules(self, request) -> list:
         '''
-        Items to be displayed in the top navigaion bar
+        Items to be displayed in the control sidebar
+        computed once per process and actor type, may only depend on the actor type
         :return return list of dicts with the structure defined by sidebar_module_renderer
         '''
         raise NotImplementedError()
@@ -27,6 +28,7 @@ class BaseModule():
     def get_navbar_items(self, request) -> list:
         '''
         Items to be displayed in the top navigation
+        computed once per process and actor type, may only depend on the actor type
         :return return list of dicts with "name", "url"
         '''
         raise NotImplementedError()
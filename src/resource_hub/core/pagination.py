@@ -0,0 +1,83 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+
+
+def estimate_count(queryset):
+    '''
+    row estimate of the query planner, None if the database has no planner estimate
+    '''
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]['Plan']['Plan Rows']
+
+
+def get_count(queryset):
+    '''
+    exact count for small results, the planner estimate above TABLE_COUNT_ESTIMATE_THRESHOLD
+    :return count, estimated
+    '''
+    estimate = estimate_count(queryset)
+    if estimate is not None and estimate > settings.TABLE_COUNT_ESTIMATE_THRESHOLD:
+        return estimate, True
+    return queryset.count(), False
+
+
+class CountedPaginator(Paginator):
+    '''
+    paginator with a count known beforehand, e.g. the estimate of get_count
+    '''
+
+    def __init__(self, object_list, per_page, count=None, estimated=False, **kwargs):
+        super(CountedPaginator, self).__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            self.count = count
+        self.estimated = estimated
+
+
+def encode_cursor(value, pk) -> str:
+    # str keeps the microseconds of datetimes, lookups parse it again
+    return base64.urlsafe_b64encode(json.dumps(
+        [value, pk], default=str).encode()).decode()
+
+
+def decode_cursor(cursor) -> list:
+    try:
+        value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError('invalid cursor {}'.format(cursor))
+    return value, pk
+
+
+def keyset_page(queryset, sort, cursor=None, per_page=settings.DEFAULT_PER_PAGE):
+    '''
+    rows after the cursor ordered by the non null field sort and pk
+    :return rows, cursor of the next page or None on the last page
+    '''
+    field = sort.lstrip('-')
+    descending = sort.startswith('-')
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        lookup = 'lt' if descending else 'gt'
+        queryset = queryset.filter(
+            Q(**{'{}__{}'.format(field, lookup): value}) |
+            Q(**{field: value, 'pk__{}'.format(lookup): pk})
+        )
+    rows = list(queryset.order_by(
+        sort, '-pk' if descending else 'pk')[:per_page + 1])
+    if len(rows) <= per_page:
+        return rows, None
+    rows = rows[:per_page]
+    return rows, encode_cursor(getattr(rows[-1], field), rows[-1].pk)
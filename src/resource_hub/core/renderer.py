@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from collections import defaultdict
 from decimal import Decimal
@@ -5,10 +6,13 @@ from io import BytesIO
 from typing import Tuple
 
 from django.contrib.staticfiles import finders
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.utils.formats import date_format, localize
 from django.utils.translation import get_language, gettext_lazy, pgettext
 
 import bleach
+from PIL import Image
 from PIL.Image import BICUBIC
 from reportlab.lib import pagesizes
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT
@@ -27,6 +31,24 @@ from .utils import money_filter, normalize_fraction
 
 logger = logging.getLogger(__name__)
 
+# process wide caches, fonts are parsed and stylesheets built only once
+_registered_fonts = set()
+_stylesheets = {}
+
+
+def register_font(name, path):
+    """
+    Register a TTF font from the static files with reportlab, unless it is already registered.
+    """
+    if name not in _registered_fonts:
+        pdfmetrics.registerFont(TTFont(name, finders.find(path)))
+        _registered_fonts.add(name)
+
+
+def clear_renderer_cache():
+    _registered_fonts.clear()
+    _stylesheets.clear()
+
 
 class NumberedCanvas(Canvas):
     def __init__(self, *args, **kwargs):
@@ -106,12 +128,23 @@ class BaseReportlabInvoiceRenderer(BaseInvoiceRenderer):
     font_regular = 'OpenSans'
     font_bold = 'OpenSansBd'
 
+    fonts = [
+        ('OpenSans', 'fonts/OpenSans-Regular.ttf'),
+        ('OpenSansIt', 'fonts/OpenSans-Italic.ttf'),
+        ('OpenSansBd', 'fonts/OpenSans-Bold.ttf'),
+        ('OpenSansBI', 'fonts/OpenSans-BoldItalic.ttf'),
+    ]
+
     def _init(self):
         """
         Initialize the renderer. By default, this registers fonts and sets ``self.stylesheet``.
+        Both are set up once per process and renderer class.
         """
-        self.stylesheet = self._get_stylesheet()
         self._register_fonts()
+        cls = self.__class__
+        if cls not in _stylesheets:
+            _stylesheets[cls] = self._get_stylesheet()
+        self.stylesheet = _stylesheets[cls]
 
     def _get_stylesheet(self):
         """
@@ -134,16 +167,11 @@ class BaseReportlabInvoiceRenderer(BaseInvoiceRenderer):
 
     def _register_fonts(self):
         """
-        Register fonts with reportlab. By default, this registers the OpenSans font family
+        Register fonts with reportlab. By default, this registers the fonts listed in ``fonts``,
+        subclasses may extend the list to register additional fonts on first use.
         """
-        pdfmetrics.registerFont(
-            TTFont('OpenSans', finders.find('fonts/OpenSans-Regular.ttf')))
-        pdfmetrics.registerFont(
-            TTFont('OpenSansIt', finders.find('fonts/OpenSans-Italic.ttf')))
-        pdfmetrics.registerFont(
-            TTFont('OpenSansBd', finders.find('fonts/OpenSans-Bold.ttf')))
-        pdfmetrics.registerFont(
-            TTFont('OpenSansBI', finders.find('fonts/OpenSans-BoldItalic.ttf')))
+        for name, path in self.fonts:
+            register_font(name, path)
         pdfmetrics.registerFontFamily('OpenSans', normal='OpenSans', bold='OpenSansBd',
                                       italic='OpenSansIt', boldItalic='OpenSansBI')
 
@@ -226,24 +254,34 @@ class BaseReportlabInvoiceRenderer(BaseInvoiceRenderer):
         return 'invoice.pdf', 'application/pdf', buffer.read()
 
 
-class ThumbnailingImageReader(ImageReader):
-    def resize(self, width, height, dpi):
-        if width is None:
-            width = height * self._image.size[0] / self._image.size[1]
-        if height is None:
-            height = width * self._image.size[1] / self._image.size[0]
-        self._image.thumbnail(
-            size=(int(width * dpi / 72), int(height * dpi / 72)),
-            resample=BICUBIC
-        )
-        self._data = None
-        return width, height
+def get_logo_path(digest, size=None) -> str:
+    if size is None:
+        return 'CACHE/invoice_logos/{}'.format(digest)
+    return 'CACHE/invoice_logos/{}/{}x{}.png'.format(digest, *size)
+
 
-    def _jpeg_fh(self):
-        # Bypass a reportlab-internal optimization that falls back to the original
-        # file handle if the file is a JPEG, and therefore does not respect the
-        # (smaller) size of the modified image.
-        return None
+def get_logo_thumbnail(image, width, height, dpi) -> bytes:
+    """
+    Returns the logo resized to the given dimensions. Thumbnails are cached in the
+    media storage keyed by the hash of the image content.
+    """
+    image.open('rb')
+    try:
+        content = image.read()
+    finally:
+        image.close()
+    size = (int(width * dpi / 72), int(height * dpi / 72))
+    path = get_logo_path(hashlib.sha256(content).hexdigest(), size)
+    if default_storage.exists(path):
+        with default_storage.open(path, 'rb') as f:
+            return f.read()
+
+    thumbnail = Image.open(BytesIO(content))
+    thumbnail.thumbnail(size=size, resample=BICUBIC)
+    buffer = BytesIO()
+    thumbnail.save(buffer, format='PNG')
+    default_storage.save(path, ContentFile(buffer.getvalue()))
+    return buffer.getvalue()
 
 
 class ClassicInvoiceRenderer(BaseReportlabInvoiceRenderer):
@@ -311,12 +349,12 @@ class ClassicInvoiceRenderer(BaseReportlabInvoiceRenderer):
     def _draw_logo(self, canvas):
         if self.invoice.contract.creditor.invoice_logo_image:
             logo_file = self.invoice.contract.creditor.invoice_logo_image
-            ir = ThumbnailingImageReader(logo_file)
             try:
-                ir.resize(self.logo_width, self.logo_height, 300)
+                ir = ImageReader(BytesIO(get_logo_thumbnail(
+                    logo_file, self.logo_width, self.logo_height, 300)))
             except:
                 logger.exception("Can not resize image")
-                pass
+                return
             canvas.drawImage(ir,
                              self.logo_left,
                              self.pagesize[1] -
@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.contrib.postgres.search import (SearchQuery, SearchRank,
+                                            SearchVector, TrigramSimilarity)
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+from django.utils.translation import get_language
+
+# text search configuration per language, vectors are stemmed with all of them
+SEARCH_CONFIGS = {
+    'de': 'german',
+    'en': 'english',
+}
+
+
+def build_search_vector(fields):
+    '''
+    fields: iterable of (field name or expression, weight)
+    '''
+    vector = None
+    for config in SEARCH_CONFIGS.values():
+        for field, weight in fields:
+            part = SearchVector(field, weight=weight, config=config)
+            vector = part if vector is None else vector + part
+    return vector
+
+
+def get_search_config(language=None) -> str:
+    language = (language or get_language() or settings.LANGUAGE_CODE)[:2]
+    return SEARCH_CONFIGS.get(language, SEARCH_CONFIGS['en'])
+
+
+def search(queryset, query, language=None, trigram_field='name'):
+    '''
+    filters the queryset by its search_vector and annotates the weighted rank
+    falls back to trigram similarity if enabled and nothing matches
+    '''
+    search_query = SearchQuery(
+        query, config=get_search_config(language), search_type='websearch')
+    # double precision keeps the rank exact for cursor pagination
+    result = queryset.filter(search_vector=search_query).annotate(
+        rank=Cast(SearchRank(F('search_vector'), search_query), FloatField()))
+    if settings.SEARCH_TRIGRAM_FALLBACK and not result.exists():
+        result = queryset.annotate(
+            rank=Cast(TrigramSimilarity(trigram_field, query), FloatField())
+        ).filter(rank__gte=settings.SEARCH_TRIGRAM_THRESHOLD)
+    return result
@@ -8,6 +8,21 @@ from rest_framework import serializers
 from .models import NotificationAttachment, OrganizationMember
 
 
+class SparseFieldsMixin:
+    '''
+    limits the fields to the comma separated fields query parameter
+    '''
+
+    def __init__(self, *args, **kwargs):
+        super(SparseFieldsMixin, self).__init__(*args, **kwargs)
+        request = self.context.get('request', None)
+        fields = request.query_params.get('fields', None) if request else None
+        if fields:
+            allowed = set(fields.split(','))
+            for name in set(self.fields) - allowed:
+                self.fields.pop(name)
+
+
 class UserSerializer(serializers.ModelSerializer):
     full_name = serializers.SerializerMethodField()
 
@@ -68,7 +83,7 @@ class ContractSerializer(serializers.ModelSerializer):
                   'debitor', 'link', 'created_at', ]
 
 
-class LocationSerializer(serializers.ModelSerializer):
+class LocationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     address = AddressSerializer()
     owner = ActorSerializer()
     # thumbnail = serializers.ImageField(use_url=False)
@@ -87,6 +102,18 @@ class LocationSerializer(serializers.ModelSerializer):
                   'longitude', 'address', 'owner', 'thumbnail', 'location_link', ]
 
 
+class LocationMapSerializer(serializers.ModelSerializer):
+    address = AddressSerializer()
+    location_link = serializers.SerializerMethodField()
+
+    def get_location_link(self, obj):
+        return reverse('core:locations_profile', kwargs={'slug': obj.slug})
+
+    class Meta:
+        model = Location
+        fields = ['name', 'latitude', 'longitude', 'address', 'location_link', ]
+
+
 class AttachmentSerializer(serializers.ModelSerializer):
     path = serializers.SerializerMethodField()
     filename = serializers.SerializerMethodField()
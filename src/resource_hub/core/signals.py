@@ -1,3 +1,4 @@
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
 
 from .modules import CoreModule
@@ -21,3 +22,34 @@ register_modules = Signal(
 @receiver(register_modules)
 def register_module(sender, **kwargs):
     return CoreModule
+
+
+@receiver(post_save, sender='core.Location')
+def update_location_search_vector(sender, instance, **kwargs):
+    instance.update_search_vector()
+
+
+@receiver(post_save, sender='core.OrganizationMember')
+@receiver(post_delete, sender='core.OrganizationMember')
+def invalidate_member_actor_cache(sender, instance, **kwargs):
+    from .utils import invalidate_actors
+    invalidate_actors(user_pks=[instance.user_id])
+
+
+@receiver(post_save, sender='core.Organization')
+@receiver(post_delete, sender='core.Organization')
+def invalidate_organization_actor_cache(sender, instance, **kwargs):
+    from .models import OrganizationMember
+    from .utils import invalidate_actors
+    # members lose or gain the organization with it
+    invalidate_actors(actor_pks=[instance.pk], user_pks=OrganizationMember.all_objects.filter(
+        organization=instance).values_list('user', flat=True))
+
+
+@receiver(post_save, sender='core.User')
+@receiver(post_delete, sender='core.User')
+@receiver(post_save, sender='core.Actor')
+@receiver(post_delete, sender='core.Actor')
+def invalidate_actor_cache(sender, instance, **kwargs):
+    from .utils import invalidate_actors
+    invalidate_actors(actor_pks=[instance.pk], user_pks=[instance.pk])
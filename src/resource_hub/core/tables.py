@@ -44,6 +44,7 @@ class SelectableTable(BaseTable):
 
 
 class PaymentMethodsTable(SelectableTable):
+    prefetch = ['owner']
     name = tables.Column(
         linkify=('control:finance_payment_methods_edit', {'pk': A('pk')}))
     verbose_name = tables.Column(
@@ -82,6 +83,7 @@ class OrganizationsTable(SelectableTable):
 
 
 class MembersTable(tables.Table):
+    prefetch = ['user']
     username = tables.Column(verbose_name=_(
         'Username'), accessor=A('user__username'))
     first_name = tables.Column(verbose_name=_('First name'),
@@ -108,6 +110,7 @@ class MembersTable(tables.Table):
 
 
 class LocationsTable(SelectableTable):
+    prefetch = ['owner']
     name = tables.LinkColumn(
         'control:locations_edit',
         verbose_name=_('Name'),
@@ -174,6 +177,7 @@ class ClaimTable(tables.Table):
 
 
 class ContractProcedureTable(SelectableTable):
+    prefetch = ['owner']
     # columns
     type_name = tables.Column(verbose_name=_('Type'))
     owner = tables.Column(verbose_name=_('Owner'))
@@ -185,20 +189,20 @@ class ContractProcedureTable(SelectableTable):
         pass
 
 
-class InvoiceTable(tables.Table):
-    pk = tables.Column(verbose_name=_('Invoice Number'))
+class InvoiceTable(SelectableTable):
+    invoice_no = tables.Column(verbose_name=_('Invoice Number'))
     invoice_to_name = tables.Column(verbose_name=_('Invoice to'))
     invoice_from_name = tables.Column(verbose_name=_('Invoice from'))
     file = tables.Column(verbose_name=_('File'))
     created_at = tables.DateColumn(verbose_name=('Date'))
 
-    def render_pk(self, value, record):
+    def render_invoice_no(self, value, record):
         return record.number
 
     def render_file(self, value, record):
         return mark_safe('<a href="{}"><i class="icon file"></i></a>'.format(value.url))
 
-    class Meta:
+    class Meta(SelectableTable.Meta):
         attrs = {
             "class": "ui selectable table"
         }
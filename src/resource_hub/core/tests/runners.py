@@ -1,8 +1,38 @@
+import os
+import shutil
+import tempfile
+
 from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 from django.test.runner import DiscoverRunner as DjangoTestSuiteRunner
 
+# default images referenced by the models
+MEDIA_DEFAULTS = ['images/default.png', 'images/logo.png']
+
 
 class MyTestSuiteRunner(DjangoTestSuiteRunner):
     def __init__(self, *args, **kwargs):
         settings.TESTING = True
+        # cached rows must not outlive the test database
+        settings.CACHES['default']['KEY_PREFIX'] = '{}-test'.format(
+            settings.CACHES['default'].get('KEY_PREFIX', ''))
         super(MyTestSuiteRunner, self).__init__(*args, **kwargs)
+
+    def setup_test_environment(self, **kwargs):
+        super(MyTestSuiteRunner, self).setup_test_environment(**kwargs)
+        cache.delete_pattern('*')
+        # invoices, exports and uploads of the tests go to a temporary media root
+        self.media_root = tempfile.mkdtemp()
+        for name in MEDIA_DEFAULTS:
+            os.makedirs(os.path.join(self.media_root,
+                                     os.path.dirname(name)), exist_ok=True)
+            shutil.copy(os.path.join(settings.MEDIA_ROOT, name),
+                        os.path.join(self.media_root, name))
+        self.media_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.media_override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.media_override.disable()
+        shutil.rmtree(self.media_root)
+        super(MyTestSuiteRunner, self).teardown_test_environment(**kwargs)
@@ -5,7 +5,9 @@ from rest_framework.test import (APIClient, APIRequestFactory,
                                  force_authenticate)
 from rest_framework.views import APIView
 
-from ..models import Organization, OrganizationMember, User
+from ..models import (Address, Location, Organization, OrganizationMember,
+                      User)
+from ..utils import get_authorized_actors
 from ..views.api import OrganizationMembersChange
 
 USER_DATA = {
@@ -70,3 +72,77 @@ class TestOrganizationMembersChange(BaseAPITest):
             organization=self.organization,
             user=self.user2,
         ).role, OrganizationMember.ADMIN)
+
+    def test_change_authorized_actors(self):
+        m = OrganizationMember.objects.get(
+            user=self.user2,
+            organization=self.organization
+        )
+        kwargs = {'organization_pk': self.organization.pk}
+        self.post({m.pk: {'role': OrganizationMember.ADMIN}}, self.user1, kwargs=kwargs)
+        self.assertIn(self.organization.pk, get_authorized_actors(
+            User.objects.get(pk=self.user2.pk)).values_list('pk', flat=True))
+        self.post({m.pk: {'role': OrganizationMember.MEMBER}}, self.user1, kwargs=kwargs)
+        self.assertNotIn(self.organization.pk, get_authorized_actors(
+            User.objects.get(pk=self.user2.pk)).values_list('pk', flat=True))
+
+
+class TestLocationsMap(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create(**USER_DATA)
+        self.address = Address.objects.create(
+            street='street',
+            street_number=12,
+            postal_code='12345',
+            city='test',
+            country='de'
+        )
+        # Hannover, Linden, Hamburg, Fiji
+        for name, latitude, longitude in [
+            ('A', 52.3759, 9.7320),
+            ('B', 52.3660, 9.7080),
+            ('C', 53.5511, 9.9937),
+            ('D', -17.7134, 179.9),
+        ]:
+            Location.objects.create(
+                name=name,
+                address=self.address,
+                latitude=latitude,
+                longitude=longitude,
+                owner=self.user,
+            )
+
+    def get(self, **params):
+        response = self.client.get(reverse('api:locations_map'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def get_names(self, **params):
+        return sorted(location['name'] for location in self.get(**params)['results'])
+
+    def test_bbox(self):
+        self.assertEqual(self.get_names(bbox='9,52,10,53'), ['A', 'B'])
+        self.assertEqual(self.get_names(bbox='179,-18,-179,-17'), ['D'])
+
+    def test_radius(self):
+        self.assertEqual(self.get_names(
+            lat=52.3759, lng=9.7320, radius=5), ['A', 'B'])
+        self.assertEqual(self.get_names(
+            lat=52.3759, lng=9.7320, radius=150), ['A', 'B', 'C'])
+        self.assertEqual(self.get_names(
+            lat=-17.7, lng=-179.9, radius=50), ['D'])
+
+    def test_clusters(self):
+        data = self.get(bbox='-180,-90,180,90', zoom=5)
+        self.assertEqual(data['results'], [])
+        self.assertEqual(
+            sorted(cluster['count'] for cluster in data['clusters']), [1, 1, 2])
+
+    def test_invalid(self):
+        url = reverse('api:locations_map')
+        self.assertEqual(self.client.get(url).status_code, 400)
+        self.assertEqual(self.client.get(
+            url, {'bbox': '1,2,3'}).status_code, 400)
+        self.assertEqual(self.client.get(
+            url, {'radius': 5}).status_code, 400)
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+
+from django.test import TestCase
+
+from ..conflicts import IntervalIndex, find_conflicts
+
+
+def span(start_hour, end_hour):
+    day = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    return (day + timedelta(hours=start_hour), day + timedelta(hours=end_hour))
+
+
+class TestIntervalIndex(TestCase):
+    def setUp(self):
+        self.index = IntervalIndex([
+            span(0, 10) + ('long', ),
+            span(1, 2) + ('a', ),
+            span(3, 4) + ('b', ),
+            span(12, 13) + ('c', ),
+        ])
+
+    def test_overlapping(self):
+        self.assertEqual(
+            [i[2] for i in self.index.overlapping(*span(1, 3))], ['long', 'a'])
+        self.assertEqual(
+            [i[2] for i in self.index.overlapping(*span(11, 14))], ['c'])
+
+    def test_touching_intervals_do_not_overlap(self):
+        self.assertEqual(self.index.overlapping(*span(10, 12)), [])
+        self.assertEqual(self.index.overlapping(*span(13, 14)), [])
+
+    def test_long_interval_first(self):
+        index = IntervalIndex([span(0, 100) + ('long', )] + [
+            span(hour, hour + 1) + (hour, ) for hour in range(1, 99, 2)])
+        self.assertEqual(
+            [i[2] for i in index.overlapping(*span(50, 52))], ['long', 51])
+        self.assertEqual(
+            [i[2] for i in index.overlapping(*span(100, 101))], [])
+
+    def test_matches_naive(self):
+        intervals = [span(i % 7, i % 7 + i % 5 + 1) + (i, ) for i in range(40)]
+        index = IntervalIndex(intervals)
+        for start in range(12):
+            for length in range(1, 4):
+                query = span(start, start + length)
+                self.assertEqual(index.overlapping(*query), sorted(
+                    (i for i in intervals if i[0] < query[1] and i[1] > query[0]),
+                    key=lambda i: (i[0], i[1])))
+
+    def test_find_conflicts(self):
+        conflicts = find_conflicts(
+            [span(3, 5), span(20, 21)],
+            [span(4, 6) + ('x', ), span(0, 1) + ('y', )],
+        )
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0].obj, 'x')
+        self.assertEqual(
+            (conflicts[0].start, conflicts[0].end), span(3, 5))
+        self.assertEqual(
+            (conflicts[0].other_start, conflicts[0].other_end), span(4, 6))
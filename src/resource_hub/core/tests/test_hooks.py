@@ -0,0 +1,54 @@
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.template import RequestContext
+from django.test import RequestFactory, TestCase
+from django.utils import translation
+from sekizai.data import UniqueSequence
+from sekizai.helpers import get_varname
+
+from ..hooks import LANGUAGE, Hook
+
+
+class TestHook(TestCase):
+    def setUp(self):
+        self.hook = Hook()
+        self.calls = 0
+        self.request = RequestFactory().get('/')
+
+    def get_context(self):
+        return RequestContext(self.request, {
+            'pk': 1,
+            get_varname(): defaultdict(UniqueSequence),
+        })
+
+    def callback(self, context):
+        self.calls += 1
+        context[get_varname()]['js'].append('<script></script>')
+        return '<p>{}</p>'.format(context['pk'])
+
+    def test_uncached(self):
+        self.hook.register('test', self.callback)
+        self.hook('test', self.get_context())
+        self.assertEqual(self.hook('test', self.get_context()), ['<p>1</p>'])
+        self.assertEqual(self.calls, 2)
+        self.assertIn('test', self.request.hook_timings)
+
+    def test_cached(self):
+        self.hook.register('test', self.callback, cache=LANGUAGE,
+                           key=lambda context: context['pk'])
+        cache.delete_pattern('hook:test:*')
+        with translation.override('de'):
+            self.hook('test', self.get_context())
+            context = self.get_context()
+            self.assertEqual(self.hook('test', context), ['<p>1</p>'])
+            self.assertEqual(self.calls, 1)
+            # sekizai blocks are replayed from the cache
+            self.assertEqual(list(context[get_varname()]['js']), [
+                             '<script></script>'])
+        with translation.override('en'):
+            self.hook('test', self.get_context())
+        self.assertEqual(self.calls, 2)
+
+        self.hook.unregister('test', self.callback)
+        self.assertEqual(self.hook('test', self.get_context()), [])
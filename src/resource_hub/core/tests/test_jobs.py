@@ -1,5 +1,13 @@
-from ..jobs import settle_claims
-from ..models import Claim, SettlementLog
+from datetime import timedelta
+from unittest import mock
+
+from django.test import override_settings
+from django.utils import timezone
+
+from ..jobs import publish_contract_events, render_invoice, settle_claims
+from ..models import (Claim, Contract, ContractTrigger, Invoice,
+                      Notification, SettlementLog)
+from ..models.events import ContractEvent, StateChangedEvent
 from .test_models import BaseContractTest
 
 
@@ -11,3 +19,70 @@ class TestSettleClaims(BaseContractTest):
         open_claims = self.contract.claim_set.filter(state=Claim.STATE.PENDING)
         self.assertEqual(len(open_claims), self.no_of_claims//2)
         self.assertEqual(self.contract.state, self.contract.STATE.RUNNING)
+
+    def test_settle_claims_not_due(self):
+        self.contract.settlement_logs.create(
+            timestamp=timezone.now() - timedelta(days=self.settlement_interval + 1))
+        self.create_claims()
+        settle_claims()
+        open_claims = self.contract.claim_set.filter(state=Claim.STATE.PENDING)
+        self.assertEqual(len(open_claims), self.no_of_claims)
+
+
+class TestPublishContractEvents(BaseContractTest):
+    def test_publish_contract_events(self):
+        StateChangedEvent.build(
+            contract=self.contract,
+            new_state=self.contract.STATE.RUNNING,
+        )
+        self.assertTrue(ContractEvent.objects.filter(
+            state=ContractEvent.STATE.PENDING).exists())
+        publish_contract_events()
+        self.assertFalse(ContractEvent.objects.filter(
+            state=ContractEvent.STATE.PENDING).exists())
+
+
+    @override_settings(CONTRACT_EVENT_MAX_ATTEMPTS=2)
+    def test_failing_trigger(self):
+        trigger = ContractTrigger.objects.create(
+            name='test', owner=self.actor, event=Contract.EVENT.STATE_CHANGED)
+        self.contract_procedure.triggers.add(trigger)
+        for state in [self.contract.STATE.RUNNING, self.contract.STATE.FINALIZED]:
+            StateChangedEvent.build(contract=self.contract, new_state=state)
+        failing, passing = ContractEvent.objects.order_by('pk')
+
+        def call(trigger, event):
+            if event.pk == failing.pk:
+                raise ValueError('trigger failed')
+
+        with mock.patch.object(ContractTrigger, 'call', call), self.assertLogs(level='ERROR'):
+            publish_contract_events()
+            failing.refresh_from_db()
+            passing.refresh_from_db()
+            self.assertEqual(passing.state, ContractEvent.STATE.PUBLISHED)
+            self.assertEqual(failing.state, ContractEvent.STATE.PENDING)
+            self.assertEqual(failing.attempts, 1)
+
+            publish_contract_events()
+            failing.refresh_from_db()
+            self.assertEqual(failing.state, ContractEvent.STATE.FAILED)
+            self.assertEqual(failing.attempts, 2)
+
+
+class TestRenderInvoice(BaseContractTest):
+    def test_render_invoice(self):
+        self.create_claims()
+        self.contract.settle_claims()
+        invoice = self.contract.invoices.get()
+        self.assertEqual(invoice.rendering, Invoice.RENDERING.PENDING)
+        self.assertFalse(Notification.objects.filter(
+            typ=Notification.TYPE.MONETARY).exists())
+
+        render_invoice(invoice.pk)
+        # rendering is idempotent
+        render_invoice(invoice.pk)
+        invoice.refresh_from_db()
+        self.assertEqual(invoice.rendering, Invoice.RENDERING.DONE)
+        self.assertEqual(Notification.objects.filter(
+            typ=Notification.TYPE.MONETARY).count(), 1)
+        invoice.file.delete()
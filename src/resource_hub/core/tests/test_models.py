@@ -1,16 +1,31 @@
+import csv
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import zipfile
 from datetime import datetime, timedelta
 from decimal import Decimal
+from smtplib import SMTPRecipientsRefused
+from unittest import mock
 
 from django.conf import settings
+from django.core import mail
 from django.core.files import File as DjFile
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.files.storage import default_storage
 from django.db.models import Min
-from django.test import Client, TestCase
+from django.test import Client, TestCase, override_settings
 from django.utils import timezone
 
+from resource_hub.core.export import get_invoice_filename, iter_invoice_archive
 from resource_hub.core.models import (Address, BankAccount, Claim, Contract,
                                       ContractProcedure, File, ICSFile,
-                                      Invoice, Location, Notification,
-                                      Organization, PaymentMethod, User)
+                                      Invoice, InvoiceSequence, Location,
+                                      Notification, Organization,
+                                      PaymentMethod, User)
+from resource_hub.core.renderer import get_logo_path, get_logo_thumbnail
 
 
 class TestLocations(TestCase):
@@ -202,6 +217,57 @@ class TestContract(BaseContractTest):
             1
         )
 
+    def test_invoice_numbers(self):
+        self.create_claims()
+        claims = self.contract.claim_set.all()
+        first = Invoice.build(self.contract, claims, self.actor)
+        second = Invoice.build(self.contract, claims, self.actor)
+        self.assertEqual(first.invoice_no, '00001')
+        self.assertEqual(second.invoice_no, '00002')
+        self.assertEqual(second.full_invoice_no, second.number)
+        self.assertEqual(second.positions.count(), self.no_of_claims)
+
+        # a missing sequence continues after the existing invoices
+        InvoiceSequence.objects.all().delete()
+        third = Invoice.build(self.contract, claims, self.actor)
+        self.assertEqual(third.invoice_no, '00003')
+
+    def test_invoice_export(self):
+        self.create_claims()
+        invoice = Invoice.build(
+            self.contract, self.contract.claim_set.all(), self.actor)
+        content = b''.join(iter_invoice_archive(
+            Invoice.objects.filter(contract=self.contract), 'csv'))
+        archive = zipfile.ZipFile(io.BytesIO(content))
+        filename = get_invoice_filename(invoice)
+        self.assertEqual(archive.namelist(), [filename, 'ledger.csv'])
+        # the missing pdf is rendered on the fly
+        self.assertTrue(archive.read(filename).startswith(b'%PDF'))
+        rows = list(csv.reader(io.StringIO(
+            archive.read('ledger.csv').decode('utf-8'))))
+        self.assertEqual(rows[0][0], 'full_invoice_no')
+        self.assertEqual(len(rows), self.no_of_claims + 1)
+
+    def test_invoice_export_creditors(self):
+        self.create_claims()
+        invoice = Invoice.build(
+            self.contract, self.contract.claim_set.all(), self.actor)
+        contract = Contract.objects.create(
+            contract_procedure=self.contract_procedure,
+            payment_method=self.contract.payment_method,
+            creditor=self.actor2,
+            debitor=self.actor,
+            state=Contract.STATE.RUNNING,
+        )
+        other = Invoice.build(
+            contract, self.contract.claim_set.all(), self.actor2)
+        # both creditors use the default prefix
+        self.assertEqual(invoice.number, other.number)
+        content = b''.join(iter_invoice_archive(
+            Invoice.objects.filter(pk__in=[invoice.pk, other.pk]), 'csv'))
+        names = zipfile.ZipFile(io.BytesIO(content)).namelist()
+        self.assertEqual(len(set(names)), 3)
+
     def test_skip_invoice_creation(self):
         self.create_claims()
         self.contract.claim_set.update(gross=Decimal('0.0'))
@@ -302,6 +368,105 @@ class TestNotification(TestCase):
         for notification in Notification.objects.all():
             self.assertEqual(notification.state, Notification.STATE.SENT)
 
+    def test_send_open_mails_batched(self):
+        notification = Notification.objects.get()
+        for i in range(4):
+            Notification.build(
+                type_=Notification.TYPE.INFO,
+                sender=notification.sender,
+                recipient=notification.recipient,
+                header='test {}'.format(i),
+                message='test',
+                link='',
+                level=Notification.LEVEL.MEDIUM,
+                target=notification.recipient,
+            )
+        with mock.patch.object(EmailBackend, 'open', autospec=True) as open_, \
+                mock.patch.object(EmailBackend, 'send_messages', autospec=True,
+                                  side_effect=EmailBackend.send_messages) as send_messages:
+            Notification.send_open_mails(batch_size=2)
+        self.assertFalse(Notification.objects.filter(
+            state=Notification.STATE.PENDING).exists())
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(len(mail.outbox[0].attachments), 1)
+        # one send per notification, one connection per batch of 2, 2 and 1
+        self.assertEqual(send_messages.call_count, 5)
+        self.assertEqual(open_.call_count, 3)
+
+    def test_send_open_mails_failed(self):
+        notification = Notification.objects.get()
+        for i in range(2):
+            Notification.build(
+                type_=Notification.TYPE.INFO,
+                sender=notification.sender,
+                recipient=notification.recipient,
+                header='test {}'.format(i),
+                message='test',
+                link='',
+                level=Notification.LEVEL.MEDIUM,
+                target=notification.recipient,
+            )
+        failing = Notification.objects.get(header='test 0')
+        send = EmailBackend.send_messages
+
+        def send_messages(backend, messages):
+            if any(message.subject == 'test 0' for message in messages):
+                raise SMTPRecipientsRefused({})
+            return send(backend, messages)
+
+        with mock.patch.object(EmailBackend, 'send_messages', autospec=True,
+                               side_effect=send_messages):
+            with self.assertLogs(level='ERROR'):
+                Notification.send_open_mails(batch_size=2)
+            failing.refresh_from_db()
+            self.assertEqual(failing.state, Notification.STATE.PENDING)
+            self.assertEqual(failing.attempts, 1)
+            self.assertEqual(len(mail.outbox), 2)
+            self.assertEqual(Notification.objects.filter(
+                state=Notification.STATE.SENT).count(), 2)
+
+            for _ in range(settings.NOTIFICATION_MAIL_MAX_ATTEMPTS - 1):
+                with self.assertLogs(level='ERROR'):
+                    Notification.send_open_mails()
+        failing.refresh_from_db()
+        self.assertEqual(failing.state, Notification.STATE.FAILED)
+        self.assertEqual(failing.attempts,
+                         settings.NOTIFICATION_MAIL_MAX_ATTEMPTS)
+        # sent notifications are not mailed twice
+        self.assertEqual(len(mail.outbox), 2)
+
+
+class TestInvoiceLogo(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.media_root, 'images'))
+        for name in ['images/logo.png', 'images/default.png']:
+            shutil.copy(os.path.join(settings.MEDIA_ROOT, name),
+                        os.path.join(self.media_root, name))
+        self.override = override_settings(MEDIA_ROOT=self.media_root)
+        self.override.enable()
+        self.actor, self.actor2 = create_users()
+
+    def tearDown(self):
+        self.override.disable()
+        shutil.rmtree(self.media_root)
+
+    def test_logo_thumbnail_cache(self):
+        logo = self.actor.invoice_logo_image
+        thumbnail = get_logo_thumbnail(logo, 100, 50, 72)
+        self.assertEqual(get_logo_thumbnail(logo, 100, 50, 72), thumbnail)
+        with default_storage.open(logo.name, 'rb') as f:
+            path = get_logo_path(hashlib.sha256(f.read()).hexdigest())
+        self.assertIn('100x50.png', default_storage.listdir(path)[1])
+
+        # thumbnails are keyed by content, other actors may share them
+        self.actor.invoice_logo_image = 'images/default.png'
+        self.actor.save()
+        self.assertEqual(get_logo_thumbnail(
+            self.actor2.invoice_logo_image, 100, 50, 72), thumbnail)
+        self.assertNotEqual(get_logo_thumbnail(
+            self.actor.invoice_logo_image, 100, 50, 72), thumbnail)
+
 
 class TestICSFile(TestCase):
     def setUp(self):
@@ -1,4 +1,43 @@
-
 from django.test import TestCase
 
-from ..utils import get_valid_slug
+from ..models import Organization, OrganizationMember, User
+from ..utils import get_actor, get_authorized_actors, get_valid_slug
+
+
+class TestActorCache(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            username='joe', email='joe@joe.de', name='Joe')
+        self.organization = Organization.objects.create(name='Org')
+
+    def get_pks(self):
+        # a fresh user object per request
+        user = User.objects.get(pk=self.user.pk)
+        return set(get_authorized_actors(user).values_list('pk', flat=True))
+
+    def test_authorized_actors(self):
+        self.assertEqual(self.get_pks(), {self.user.pk})
+        member = OrganizationMember.objects.create(
+            organization=self.organization, user=self.user, role=OrganizationMember.ADMIN)
+        self.assertEqual(self.get_pks(), {self.user.pk, self.organization.pk})
+
+        user = User.objects.get(pk=self.user.pk)
+        get_authorized_actors(user)
+        with self.assertNumQueries(1):
+            list(get_authorized_actors(user))
+
+        member.role = OrganizationMember.MEMBER
+        member.save()
+        self.assertEqual(self.get_pks(), {self.user.pk})
+        member.role = OrganizationMember.OWNER
+        member.save()
+        self.organization.soft_delete()
+        self.assertEqual(self.get_pks(), {self.user.pk})
+
+    def test_actor(self):
+        self.assertEqual(get_actor(self.organization.pk).name, 'Org')
+        with self.assertNumQueries(0):
+            get_actor(self.organization.pk)
+        self.organization.name = 'Other'
+        self.organization.save()
+        self.assertEqual(get_actor(self.organization.pk).name, 'Other')
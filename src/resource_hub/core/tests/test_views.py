@@ -1,12 +1,25 @@
-from unittest import SkipTest
-
-from django.test import Client, TestCase
+import io
+import zipfile
+from unittest import SkipTest, mock
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client, TestCase, modify_settings, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
+from redis.exceptions import RedisError
 
+from resource_hub.core.hook_listeners import clear_module_structures
+from resource_hub.core.metrics import clear_metrics
 from resource_hub.core.models import *
+from resource_hub.core.modules import CoreModule
+from resource_hub.core.pagination import (decode_cursor, encode_cursor,
+                                          get_count, keyset_page)
 from resource_hub.core.tokens import TokenGenerator
+from resource_hub.core.utils import get_authorized_actors
+from resource_hub.plugins.cash.models import Cash
 
 USER_DATA = {
     'username': 'peterpopper',
@@ -63,6 +76,28 @@ class BaseTestView(LoginTestMixin, TestCase):
         self.assertEqual(response.status_code, 200)
 
 
+class TableQueriesMixin:
+    '''
+    the queries of a table view must not grow with the rows on the page
+    '''
+
+    def assertTableQueries(self, view_name, create_row, per_page=(2, 8)):
+        for i in range(max(per_page)):
+            create_row(i)
+        url = reverse(view_name)
+        # warm up the caches of the actor and the sidebar
+        self.client.get(url)
+        counts = []
+        for size in per_page:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, {'per_page': size})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.context['table'].page), size)
+            counts.append(len(context.captured_queries))
+        self.assertEqual(len(set(counts)), 1, 'queries per page size {}: {}'.format(
+            per_page, counts))
+
+
 class TestHome(BaseTestView):
     view_name = 'core:home'
 
@@ -152,9 +187,217 @@ class TestAccountSettings(BaseTestView):
             self.assertEqual(response.status_code, 200)
 
 
+class TestControlSidebar(LoginTestMixin, TestCase):
+    def setUp(self):
+        super(TestControlSidebar, self).setUp()
+        clear_module_structures()
+
+    def test_structure_built_once(self):
+        with mock.patch.object(
+                CoreModule, 'get_sidebar_modules', autospec=True,
+                side_effect=CoreModule.get_sidebar_modules) as get_sidebar_modules:
+            manage = self.client.get(reverse('control:locations_manage'))
+            create = self.client.get(reverse('control:locations_create'))
+        self.assertEqual(get_sidebar_modules.call_count, 1)
+        self.assertRegex(manage.content.decode(
+        ), r'item indent\s+active\s+"\s+href="{}"'.format(reverse('control:locations_manage')))
+        self.assertRegex(create.content.decode(
+        ), r'item indent\s+active\s+"\s+href="{}"'.format(reverse('control:locations_create')))
+
+
+class TestLocationsProfile(LoginTestMixin, TestCase):
+    def test_cached_fragments(self):
+        location = Location.objects.create(
+            name='Location',
+            address=Address.objects.create(
+                street='street', street_number=12, postal_code='12345', city='test'),
+            owner=self.user,
+        )
+        url = reverse('core:locations_profile', kwargs={'slug': location.slug})
+        for i in range(2):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            # scripts of the fragments are added to the js block on cache hits too
+            self.assertContains(
+                response, "create_feed({{ id: '{}' }})".format(location.pk), count=3)
+
+
+@override_settings(
+    INSTRUMENTATION=True,
+    DEBUG=True,
+    CACHES={'default': dict(
+        settings.CACHES['default'], BACKEND='resource_hub.core.metrics.InstrumentedRedisCache')},
+)
+@modify_settings(MIDDLEWARE={'prepend': 'resource_hub.core.middleware.InstrumentationMiddleware'})
+class TestInstrumentation(LoginTestMixin, TestCase):
+    def setUp(self):
+        super(TestInstrumentation, self).setUp()
+        clear_metrics()
+
+    def test_headers(self):
+        response = self.client.get(reverse('control:locations_manage'))
+        self.assertEqual(response['X-View-Name'], 'control:locations_manage')
+        self.assertGreater(int(response['X-Query-Count']), 0)
+        self.assertGreater(int(response['X-Cache-Hits']) +
+                           int(response['X-Cache-Misses']), 0)
+        self.assertNotEqual(response['X-Template-Time'], '0.00ms')
+
+    def test_metrics(self):
+        self.client.get(reverse('control:locations_manage'))
+        self.client.get(reverse('control:locations_manage'))
+        response = self.client.get(reverse('core:metrics'))
+        self.assertContains(
+            response, 'resource_hub_requests_total{view="control:locations_manage"} 2.0')
+        self.assertContains(response, '# TYPE resource_hub_db_queries_total counter')
+
+    def test_redis_unavailable(self):
+        with mock.patch('resource_hub.core.metrics.get_redis_connection',
+                        side_effect=RedisError('unavailable')), self.assertLogs(
+                            'resource_hub.core.metrics', level='ERROR'):
+            response = self.client.get(reverse('control:locations_manage'))
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(INSTRUMENTATION=False)
+    def test_metrics_disabled(self):
+        response = self.client.get(reverse('core:metrics'))
+        self.assertEqual(response.status_code, 404)
+
+
+class TestTableQueries(TableQueriesMixin, LoginTestMixin, TestCase):
+    def test_locations(self):
+        address = Address.objects.create(
+            street='street', street_number=12, postal_code='12345', city='test')
+        self.assertTableQueries('control:locations_manage', lambda i: Location.objects.create(
+            name='Location {}'.format(i), address=address, owner=self.user))
+
+    def test_no_count_estimate(self):
+        Cash.objects.create(name='Cash', owner=self.user, currency='EUR')
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(reverse('control:finance_payment_methods_manage'))
+        self.assertFalse([query for query in context.captured_queries
+                          if query['sql'].startswith('EXPLAIN')])
+
+    def test_payment_methods(self):
+        self.assertTableQueries('control:finance_payment_methods_manage', lambda i: Cash.objects.create(
+            name='Cash {}'.format(i), owner=self.user, currency='EUR'))
+
+
+class TestKeysetTable(LoginTestMixin, TestCase):
+    def setUp(self):
+        super(TestKeysetTable, self).setUp()
+        address = Address.objects.create(
+            street='street', street_number=12, postal_code='12345', city='test')
+        for i in range(3):
+            Location.objects.create(
+                name='Location {}'.format(i), address=address, owner=self.user)
+        self.keyset = mock.patch(
+            'resource_hub.core.views.control.LocationsManage.keyset', True)
+        self.keyset.start()
+
+    def tearDown(self):
+        self.keyset.stop()
+
+    def test_per_page_clamped(self):
+        url = reverse('control:locations_manage')
+        for per_page, rows in [(0, 1), (-1, 1), (2, 2), ('x', 3)]:
+            response = self.client.get(url, {'per_page': per_page})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.context['table'].rows), rows)
+
+    def test_orderable_columns(self):
+        response = self.client.get(reverse('control:locations_manage'))
+        self.assertFalse(response.context['table'].columns['name'].orderable)
+
+
+class TestPagination(LoginTestMixin, TestCase):
+    def setUp(self):
+        super(TestPagination, self).setUp()
+        address = Address.objects.create(
+            street='street', street_number=12, postal_code='12345', city='test')
+        self.locations = [Location.objects.create(
+            name='Location {}'.format(i), address=address, owner=self.user)
+            for i in range(5)]
+
+    def test_keyset_page(self):
+        queryset = Location.objects.all()
+        rows, cursor = keyset_page(queryset, '-created_at', per_page=2)
+        pages = [rows]
+        while cursor:
+            rows, cursor = keyset_page(
+                queryset, '-created_at', cursor=cursor, per_page=2)
+            pages.append(rows)
+        self.assertEqual([len(rows) for rows in pages], [2, 2, 1])
+        self.assertEqual([row for rows in pages for row in rows],
+                         list(reversed(self.locations)))
+
+    def test_cursor(self):
+        location = self.locations[0]
+        value, pk = decode_cursor(encode_cursor(location.created_at, location.pk))
+        self.assertEqual(pk, location.pk)
+        self.assertEqual(Location.objects.get(created_at=value), location)
+        with self.assertRaises(ValueError):
+            decode_cursor('invalid')
+
+    def test_get_count(self):
+        self.assertEqual(get_count(Location.objects.all()), (5, False))
+        with override_settings(TABLE_COUNT_ESTIMATE_THRESHOLD=-1):
+            count, estimated = get_count(Location.objects.all())
+        self.assertTrue(estimated)
+
+
+class TestFinanceInvoicesOutgoing(BaseTestView):
+    view_name = 'control:finance_invoices_outgoing'
+
+    def test_export(self):
+        response = self.client.post(
+            reverse(self.view_name), {'action': 'export_json'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertEqual(archive.namelist(), ['ledger.json'])
+        self.assertEqual(archive.read('ledger.json'), b'[]')
+
+
+    def test_generic_actions(self):
+        with mock.patch('resource_hub.core.views.TableView.post') as post:
+            response = self.client.post(
+                reverse(self.view_name), {'action': 'trash'})
+        self.assertRedirects(response, reverse(self.view_name))
+        post.assert_not_called()
+
+
+class TestFinanceInvoicesIncoming(BaseTestView):
+    view_name = 'control:finance_invoices_incoming'
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse(self.view_name), {'after': 'invalid'})
+        self.assertEqual(response.status_code, 200)
+
+
 class TestOrganizationsManage(BaseTestView):
     view_name = 'control:organizations_manage'
 
 
 class TestOrganizationsCreate(BaseTestView):
     view_name = 'control:organizations_create'
+
+
+class TestOrganizationsMembers(LoginTestMixin, TestCase):
+    def test_trash(self):
+        organization = Organization.objects.create(name='Org')
+        organization.members.add(self.user, through_defaults={
+            'role': OrganizationMember.OWNER})
+        admin = User.objects.create(
+            username='admin', email='admin@test.de', name='Admin')
+        organization.members.add(admin, through_defaults={
+            'role': OrganizationMember.ADMIN})
+        member = OrganizationMember.objects.get(user=admin)
+        self.assertIn(organization.pk, get_authorized_actors(
+            User.objects.get(pk=admin.pk)).values_list('pk', flat=True))
+
+        url = reverse('control:organizations_members', kwargs={
+            'organization_id': organization.pk})
+        response = self.client.post(url, {'action': 'trash', 'select[]': [member.pk]})
+        self.assertRedirects(response, url)
+        self.assertNotIn(organization.pk, get_authorized_actors(
+            User.objects.get(pk=admin.pk)).values_list('pk', flat=True))
@@ -91,6 +91,7 @@ api_urls.register([
          name='organizations_members_change'),
     path('locations/search/', api.Locations.as_view(),
          name='locations_search'),
+    path('locations/map/', api.LocationsMap.as_view(), name='locations_map'),
     path('contracts/list', api.ContractsList.as_view(), name='contracts_list'),
     path('notifications/list', api.NotificationsList.as_view(),
          name='notifications_list'),
@@ -108,6 +109,7 @@ urlpatterns = [
     path('bug/', site.ReportBug.as_view(), name='report_bug'),
     path('language/', site.Language.as_view(), name='language'),
     path('terms/', site.Terms.as_view(), name='terms'),
+    path('metrics/', site.Metrics.as_view(), name='metrics'),
     path('imprint/', site.Imprint.as_view(), name='imprint'),
     path('privacy/', site.DataPrivacyStatement.as_view(), name='privacy'),
     path('locations/<slug:slug>/',
@@ -2,20 +2,85 @@ import re
 from contextlib import contextmanager
 from decimal import ROUND_HALF_UP, Decimal
 
+import dateutil.parser
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
-from django.utils import translation
+from django.utils import timezone, translation
 from django.utils.text import slugify
 
 
-def get_authorized_actors(user):
+def get_actor_key(pk) -> str:
+    return 'actor:{}'.format(pk)
+
+
+def get_authorized_actors_key(user_pk) -> str:
+    return 'actor:{}:authorized'.format(user_pk)
+
+
+def get_actor(pk):
+    '''
+    actor by pk, cached across requests until the actor is saved
+    '''
+    from .models import Actor
+    key = get_actor_key(pk)
+    actor = cache.get(key)
+    if actor is None:
+        actor = Actor.objects.get(pk=pk)
+        cache.set(key, actor, settings.ACTOR_CACHE_TTL)
+    return actor
+
+
+def get_authorized_actor_ids(user) -> list:
+    '''
+    pks of the user and the organizations the user administrates
+    kept on the user for the request and in the cache until a membership changes
+    '''
     from .models import Actor, OrganizationMember
-    query = Q(pk=user.pk)
-    sub_condition = Q(organization__members=user)
-    sub_condition.add(
-        Q(organization__organizationmember__role__gte=OrganizationMember.ADMIN), Q.AND)
-    query.add(sub_condition, Q.OR)
-    return Actor.objects.filter(query)
+    if not hasattr(user, '_authorized_actor_ids'):
+        key = get_authorized_actors_key(user.pk)
+        pks = cache.get(key)
+        if pks is None:
+            query = Q(pk=user.pk)
+            # one membership row has to match the user, the role and not be removed
+            query.add(Q(
+                organization__organizationmember__user=user,
+                organization__organizationmember__role__gte=OrganizationMember.ADMIN,
+                organization__organizationmember__is_deleted=False,
+            ), Q.OR)
+            pks = list(Actor.objects.filter(query).values_list('pk', flat=True))
+            cache.set(key, pks, settings.ACTOR_CACHE_TTL)
+        user._authorized_actor_ids = pks
+    return user._authorized_actor_ids
+
+
+def get_authorized_actors(user):
+    from .models import Actor
+    return Actor.objects.filter(pk__in=get_authorized_actor_ids(user))
+
+
+def invalidate_actors(actor_pks=(), user_pks=()):
+    keys = [get_actor_key(pk) for pk in actor_pks] + [
+        get_authorized_actors_key(pk) for pk in user_pks]
+    if keys:
+        # again after the commit, other requests may have cached the old rows meanwhile
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def parse_aware_datetime(value):
+    '''
+    iso 8601 string to an aware datetime, values without offset are in the current time zone
+    raises ValueError if the string is not valid
+    '''
+    try:
+        value = dateutil.parser.parse(value)
+    except OverflowError:
+        raise ValueError('{} is out of range'.format(value))
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, is_dst=False)
+    return value
 
 
 def get_valid_slug(obj, string, condition=None):
@@ -1,11 +1,13 @@
 from django.conf import settings
 from django.db import transaction
 from django.db.models import F, Q
+from django.db.models.constants import LOOKUP_SEP
 from django.forms import Form
 from django.shortcuts import redirect, render, reverse
 from django.views import View
 
 from ..forms import BaseFilterForm, TableActionForm
+from ..pagination import CountedPaginator, get_count, keyset_page
 
 
 def convert_value(value, field):
@@ -14,6 +16,26 @@ def convert_value(value, field):
     return value
 
 
+def apply_prefetch(queryset, lookups):
+    '''
+    joins the lookups following single valued relations, prefetches the others
+    '''
+    select, prefetch = [], []
+    for lookup in lookups:
+        model = queryset.model
+        single = True
+        for name in lookup.split(LOOKUP_SEP):
+            field = model._meta.get_field(name)
+            single = single and (field.many_to_one or field.one_to_one)
+            model = field.related_model
+        (select if single else prefetch).append(lookup)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
 class TableView(View):
     template_name = 'core/table_view.html'
     header = 'Header'
@@ -21,10 +43,23 @@ class TableView(View):
     subclasses = False
     filters = True
     actions = True
+    # related lookups rendered per row, in addition to the prefetch of the table
+    prefetch = ()
+    # paginate by the sort value and pk instead of page numbers, for large tables
+    keyset = False
+    # sortable fields in keyset mode, they have to be non null and indexed with the pk
+    keyset_fields = ('created_at', 'updated_at')
+    keyset_ordering = '-created_at'
+    # page counts from the planner estimate above TABLE_COUNT_ESTIMATE_THRESHOLD,
+    # costs an EXPLAIN per render, so only for large tables without keyset
+    count_estimate = False
 
     def get_table(self):
         raise NotImplementedError()
 
+    def get_prefetch(self) -> list:
+        return list(self.prefetch) + list(getattr(self.get_table(), 'prefetch', ()))
+
     def get_filters(self, request):
         return None
 
@@ -65,7 +100,7 @@ class TableView(View):
                         query.add(Q(**parameter), Q.AND)
                     else:
                         query = Q(**parameter)
-        queryset = self.class_.all_objects
+        queryset = apply_prefetch(self.class_.all_objects, self.get_prefetch())
         if self.subclasses:
             queryset = queryset.select_subclasses()
         if sort:
@@ -84,20 +119,66 @@ class TableView(View):
             return BaseFilterForm(data)
         return BaseFilterForm()
 
+    def get_keyset_ordering(self, request):
+        sort = request.GET.get('sort', None)
+        if sort and sort.lstrip('-') in self.keyset_fields:
+            return sort
+        return self.keyset_ordering
+
+    def get_per_page(self, request) -> int:
+        try:
+            per_page = int(request.GET.get('per_page', settings.DEFAULT_PER_PAGE))
+        except ValueError:
+            return settings.DEFAULT_PER_PAGE
+        return min(max(per_page, settings.MIN_PER_PAGE), settings.MAX_PER_PAGE)
+
+    def get_keyset_table(self, rows):
+        table = self.get_table()(rows)
+        # rows are ordered by the cursor, other columns can't be sorted
+        for column in table.columns:
+            if column.name not in self.keyset_fields:
+                column.column.orderable = False
+        return table
+
     def get_context(self, request):
         queryset = self.get_queryset(request)
-
-        if queryset:
+        per_page = self.get_per_page(request)
+        next_cursor = None
+
+        if self.keyset:
+            try:
+                rows, next_cursor = keyset_page(
+                    queryset,
+                    self.get_keyset_ordering(request),
+                    cursor=request.GET.get('after', None),
+                    per_page=per_page,
+                )
+            except ValueError:
+                rows, next_cursor = keyset_page(
+                    queryset, self.keyset_ordering, per_page=per_page)
+            table = self.get_keyset_table(rows) if rows else None
+        elif queryset.exists():
             table = self.get_table()(queryset)
-            table.paginate(
-                page=request.GET.get('page', 1),
-                per_page=request.GET.get('per_page', settings.DEFAULT_PER_PAGE)
-            )
+            if self.count_estimate:
+                count, estimated = get_count(queryset)
+                table.paginate(
+                    paginator_class=CountedPaginator,
+                    page=request.GET.get('page', 1),
+                    per_page=per_page,
+                    count=count,
+                    estimated=estimated,
+                )
+            else:
+                table.paginate(
+                    page=request.GET.get('page', 1),
+                    per_page=per_page,
+                )
         else:
             table = None
         return {
             'header': self.header,
             'table': table,
+            'next_cursor': next_cursor,
             'filter_form': self.get_filter_form(request, request.GET),
             'action_form': self.get_action_form(request),
         }
@@ -119,4 +200,4 @@ class TableView(View):
                 if action == 'untrash':
                     self.class_.all_objects.filter(
                         pk__in=selected_rows).update(is_deleted=False)
-        return redirect(reverse('{}:{}'.format(request.resolver_match.namespace, request.resolver_match.url_name)), kwargs=request.resolver_match.kwargs)
+        return redirect(reverse('{}:{}'.format(request.resolver_match.namespace, request.resolver_match.url_name), kwargs=request.resolver_match.kwargs))
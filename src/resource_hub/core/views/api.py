@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import get_list_or_404
@@ -5,6 +6,7 @@ from django.utils.translation import gettext_lazy as _
 
 from resource_hub.core.models import Contract, Location, Notification, User
 from resource_hub.core.serializers import (ActorSerializer, ContractSerializer,
+                                           LocationMapSerializer,
                                            LocationSerializer,
                                            NotificationSerializer,
                                            UserSerializer)
@@ -12,12 +14,14 @@ from rest_framework import filters, generics
 from rest_framework.decorators import (authentication_classes,
                                        permission_classes)
 from rest_framework.exceptions import ValidationError
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .. import geo
 from ..models import OrganizationMember
-from ..utils import get_authorized_actors
+from ..search import search
+from ..utils import get_authorized_actors, invalidate_actors
 
 
 class SmallResultsSetPagination(PageNumberPagination):
@@ -32,6 +36,40 @@ class LargeResultsSetPagination(PageNumberPagination):
     max_page_size = 1000
 
 
+class CursorResultsSetPagination(CursorPagination):
+    '''
+    keyset pagination, uses the ordering of the view with pk as tiebreaker
+    '''
+    page_size = 12
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-pk')
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, 'ordering', None) or self.ordering
+        if isinstance(ordering, str):
+            ordering = (ordering, )
+        return tuple(ordering)
+
+
+class SmallCursorResultsSetPagination(CursorResultsSetPagination):
+    page_size = 9
+
+
+class SearchMixin:
+    '''
+    full text search on the search_vector of the queryset, ranked results first
+    '''
+    search_param = 'name'
+
+    def search(self, queryset):
+        query = self.request.query_params.get(self.search_param, None)
+        if not query:
+            return queryset
+        self.ordering = ('-rank', 'pk')
+        return search(queryset, query)
+
+
 class NotificationResultsSetPagination(PageNumberPagination):
     page_size = 5
     page_size_query_param = 'page_size'
@@ -62,10 +100,55 @@ class ActorChange(APIView):
 
 @authentication_classes([])
 @permission_classes([])
-class Locations(generics.ListCreateAPIView):
+class Locations(SearchMixin, generics.ListCreateAPIView):
     http_method_names = ['get']
-    queryset = Location.objects.filter(is_public=True).order_by('-updated_at')
     serializer_class = LocationSerializer
+    pagination_class = CursorResultsSetPagination
+    ordering = ('-updated_at', '-pk')
+
+    def get_queryset(self):
+        return self.search(Location.objects.filter(
+            is_public=True).select_related('address', 'owner'))
+
+
+@authentication_classes([])
+@permission_classes([])
+class LocationsMap(APIView):
+    '''
+    public locations in the viewport (bbox) or around a point (lat, lng, radius in km)
+    clustered below MAP_CLUSTER_MAX_ZOOM
+    '''
+
+    def get_queryset(self):
+        params = self.request.query_params
+        queryset = Location.objects.filter(is_public=True)
+        try:
+            if 'bbox' in params:
+                queryset = geo.within_bbox(
+                    queryset, *geo.parse_bbox(params['bbox']))
+            if 'radius' in params:
+                queryset = geo.within_radius(queryset, float(params['lat']), float(
+                    params['lng']), float(params['radius']))
+        except (KeyError, ValueError) as error:
+            raise ValidationError(str(error))
+        return queryset
+
+    def get(self, request, format=None):
+        if 'bbox' not in request.query_params and 'radius' not in request.query_params:
+            raise ValidationError('bbox or radius argument is not set')
+        try:
+            zoom = int(request.query_params.get('zoom', settings.MAP_CLUSTER_MAX_ZOOM))
+        except ValueError:
+            raise ValidationError('zoom must be an integer')
+
+        queryset = self.get_queryset()
+        if zoom < settings.MAP_CLUSTER_MAX_ZOOM:
+            return Response({'clusters': geo.cluster(queryset, zoom), 'results': []})
+
+        queryset = queryset.select_related('address').order_by(
+            'pk')[:settings.MAP_MAX_LOCATIONS]
+        serializer = LocationMapSerializer(queryset, many=True)
+        return Response({'clusters': [], 'results': serializer.data})
 
 
 class ContractsList(generics.ListCreateAPIView):
@@ -138,4 +221,7 @@ class OrganizationMembersChange(APIView):
             if owners <= 0:
                 raise ValidationError(
                     detail=_('There has to be at least one owner!'))
+            # update() bypasses the post_save receiver of the actor cache
+            invalidate_actors(user_pks=OrganizationMember.all_objects.filter(
+                pk__in=request.data.keys()).values_list('user', flat=True))
         return Response({'detail': 'updated notification status as read'})
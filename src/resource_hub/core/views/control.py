@@ -18,11 +18,14 @@ from django.views import View
 
 from ..decorators import organization_admin_required, owner_required
 from ..forms import *
-from ..forms import OrganizationInvitationFormManager, PaymentMethodFilterForm
+from ..export import export_invoices
+from ..forms import (InvoiceActionForm, InvoiceFilterForm,
+                     OrganizationInvitationFormManager, PaymentMethodFilterForm)
 from ..models import *
 from ..signals import register_contract_procedures, register_payment_methods
 from ..tables import (ContractProcedureTable, InvoiceTable, LocationsTable,
                       MembersTable, OrganizationsTable, PaymentMethodsTable)
+from ..utils import invalidate_actors
 from . import TableView
 
 
@@ -349,12 +352,37 @@ class FinanceContractProceduresCreate(View):
         return render(request, 'core/control/finance_contract_procedures_create.html', context)
 
 
+class FinanceInvoices(TableView):
+    class_ = Invoice
+    keyset = True
+    keyset_fields = ('created_at',)
+
+    def get_action_form(self, request):
+        return InvoiceActionForm()
+
+    def get_filter_form(self, request, data):
+        return InvoiceFilterForm(data=data)
+
+    def get_table(self):
+        return InvoiceTable
+
+    def post(self, request):
+        # invoices are records of the ledger, only the exports apply to them
+        form = InvoiceActionForm(data=request.POST)
+        if not form.is_valid():
+            return redirect(request.get_full_path())
+        action = form.cleaned_data['action']
+        # the query string keeps the filters of the table
+        invoices = self.get_queryset(request)
+        selected_rows = request.POST.getlist('select[]')
+        if selected_rows:
+            invoices = invoices.filter(pk__in=selected_rows)
+        return export_invoices(invoices, ledger=action.replace('export_', ''))
+
+
 @method_decorator(login_required, name='dispatch')
-class FinanceInvoicesOutgoing(TableView):
+class FinanceInvoicesOutgoing(FinanceInvoices):
     header = _('Outgoing invoices')
-    class_ = Invoice
-    filters = False
-    actions = False
 
     def get_filters(self, request):
         return {
@@ -364,16 +392,10 @@ class FinanceInvoicesOutgoing(TableView):
             }
         }
 
-    def get_table(self):
-        return InvoiceTable
-
 
 @method_decorator(login_required, name='dispatch')
-class FinanceInvoicesIncoming(TableView):
+class FinanceInvoicesIncoming(FinanceInvoices):
     header = _('Incoming invoices')
-    class_ = Invoice
-    filters = False
-    actions = False
 
     def get_filters(self, request):
         return {
@@ -383,9 +405,6 @@ class FinanceInvoicesIncoming(TableView):
             }
         }
 
-    def get_table(self):
-        return InvoiceTable
-
 
 @method_decorator(login_required, name='dispatch')
 class Notifications(View):
@@ -553,6 +572,13 @@ class OrganizationsMembers(TableView):
         context['organization'] = self.organization
         return render(request, self.template_name, context)
 
+    def post(self, request, organization_id):
+        response = super(OrganizationsMembers, self).post(request)
+        # trash and untrash update the rows without the post_save receiver
+        invalidate_actors(user_pks=OrganizationMember.all_objects.filter(
+            pk__in=request.POST.getlist('select[]')).values_list('user', flat=True))
+        return response
+
 
 @method_decorator([login_required, organization_admin_required], name='dispatch')
 class OrganizationsMembersAdd(View):
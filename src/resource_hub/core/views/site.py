@@ -1,4 +1,6 @@
+from django.conf import settings
 from django.contrib import messages
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -7,6 +9,7 @@ from django.views import View
 from resource_hub.core.forms import ActorForm, ReportBugForm
 from resource_hub.core.models import Actor, Location
 
+from ..metrics import render_metrics
 from ..utils import get_site_info
 
 
@@ -78,3 +81,14 @@ class LocationsProfile(View):
             'location': location
         }
         return render(request, 'core/locations_profile.html', context)
+
+
+class Metrics(View):
+    '''
+    prometheus endpoint, only served with INSTRUMENTATION to METRICS_ALLOWED_IPS
+    '''
+
+    def get(self, request):
+        if not settings.INSTRUMENTATION or request.META.get('REMOTE_ADDR') not in settings.METRICS_ALLOWED_IPS:
+            raise Http404()
+        return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4')
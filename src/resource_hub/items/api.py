@@ -1,41 +1,41 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
-import dateutil.parser
+from django.conf import settings
 from django.db.models import F, Q
 from django.utils.translation import gettext_lazy as _
 
 from django_ical.utils import build_rrule_from_recurrences_rrule
 from django_ical.views import ICalFeed
 from resource_hub.core.models import Contract
-from resource_hub.core.views.api import (LargeResultsSetPagination,
-                                         SmallResultsSetPagination)
+from resource_hub.core.utils import parse_aware_datetime
+from resource_hub.core.views.api import (CursorResultsSetPagination,
+                                         SearchMixin)
 from rest_framework import exceptions, generics
 from rest_framework.decorators import (authentication_classes,
                                        permission_classes)
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .availability import availability_map
 from .models import Item, ItemBooking
 from .serializers import ItemBookingSerializer, ItemSerializer
 
 
 @authentication_classes([])
 @permission_classes([])
-class Items(generics.ListCreateAPIView):
+class Items(SearchMixin, generics.ListCreateAPIView):
     http_method_names = ['get']
     serializer_class = ItemSerializer
-    pagination_class = LargeResultsSetPagination
+    pagination_class = CursorResultsSetPagination
+    ordering = ('-updated_at', '-pk')
 
     def get_queryset(self):
-        name = self.request.query_params.get('name', None)
         pk = self.request.query_params.get('id', None)
         q = Q(state=Item.STATE.AVAILABLE)
-        if name is not None:
-            q.add(Q(name__icontains=name), Q.AND)
-
         if pk is not None:
             q.add(Q(location=pk), Q.AND)
-        return Item.objects.filter(q).order_by('-updated_at')
+        return self.search(Item.objects.filter(q).select_related(
+            'owner', 'location__address', 'location__owner'))
 
 
 @authentication_classes([])
@@ -54,8 +54,8 @@ class Bookings(generics.ListCreateAPIView):
                 detail=_('start or end parameter not set'))
 
         try:
-            start = dateutil.parser.parse(start_str)
-            end = dateutil.parser.parse(end_str)
+            start = parse_aware_datetime(start_str)
+            end = parse_aware_datetime(end_str)
         except ValueError as e:
             raise exceptions.ParseError(
                 detail=_('start or end parameter not valid iso_8601 string'))
@@ -68,6 +68,48 @@ class Bookings(generics.ListCreateAPIView):
         )
 
 
+@authentication_classes([])
+@permission_classes([])
+class Availability(APIView):
+    http_method_names = ['get']
+
+    def get(self, request, pk):
+        start_str = self.request.query_params.get('start', None)
+        end_str = self.request.query_params.get('end', None)
+
+        if start_str is None or end_str is None:
+            raise exceptions.NotFound(
+                detail=_('start or end parameter not set'))
+
+        try:
+            start = parse_aware_datetime(start_str)
+            end = parse_aware_datetime(end_str)
+        except ValueError:
+            raise exceptions.ParseError(
+                detail=_('start or end parameter not valid iso_8601 string'))
+
+        if start >= end:
+            raise exceptions.ParseError(
+                detail=_('start has to be before end'))
+        if end - start > timedelta(days=settings.AVAILABILITY_MAX_DAYS):
+            raise exceptions.ParseError(
+                detail=_('start and end may be at most %(days)s days apart') % {
+                    'days': settings.AVAILABILITY_MAX_DAYS})
+
+        try:
+            item = Item.objects.get(pk=pk)
+        except Item.DoesNotExist:
+            raise exceptions.NotFound(
+                detail=_('No item corresponds to the given id'))
+
+        result = [
+            {'date': day, 'available': available}
+            for day, available in availability_map(item, start, end).items()
+        ]
+
+        return Response({'results': result})
+
+
 class ICSFeed(ICalFeed):
     file_name = 'feed.ics'
 
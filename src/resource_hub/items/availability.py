@@ -0,0 +1,48 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+from resource_hub.core.conflicts import usage_segments
+
+from .models import ItemBooking
+
+
+def get_usage_segments(item, start, end) -> list:
+    '''concurrent usage of the item within start and end'''
+    bookings = ItemBooking.objects.filter(
+        item=item,
+        dtend__gt=start,
+        dtstart__lt=end,
+    ).values_list('dtstart', 'dtend', 'quantity')
+    return usage_segments(
+        (max(dtstart, start), min(dtend, end), quantity)
+        for dtstart, dtend, quantity in bookings
+    )
+
+
+def available_quantity(item, start, end) -> int:
+    peak = max((usage for _, _, usage in get_usage_segments(
+        item, start, end)), default=0)
+    return item.quantity - peak
+
+
+def availability_map(item, start, end) -> dict:
+    '''available quantity per local day within start and end'''
+    def day_start(day):
+        return timezone.make_aware(datetime.combine(day, time.min))
+
+    first = timezone.localtime(start).date()
+    last = timezone.localtime(end).date()
+    peaks = {}
+    for segment_start, segment_end, usage in get_usage_segments(item, start, end):
+        day = timezone.localtime(segment_start).date()
+        while day <= last and day_start(day) < segment_end:
+            peaks[day] = max(peaks.get(day, 0), usage)
+            day += timedelta(days=1)
+
+    result = {}
+    day = first
+    while day <= last:
+        result[day] = item.quantity - peaks.get(day, 0)
+        day += timedelta(days=1)
+    return result
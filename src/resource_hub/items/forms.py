@@ -14,9 +14,9 @@ from resource_hub.core.forms import (BaseForm, ContractProcedureForm,
                                      FormManager, GalleryImageFormSet,
                                      PriceForm, PriceProfileFormSet)
 from resource_hub.core.models import Gallery, Price, PriceProfile
-from resource_hub.core.utils import (get_authorized_actors, language,
-                                     timespan_conflict)
+from resource_hub.core.utils import get_authorized_actors, language
 
+from .availability import get_usage_segments
 from .models import (Item, ItemBooking, ItemContract, ItemContractProcedure,
                      ItemPrice)
 
@@ -278,23 +278,17 @@ class ItemBookingForm(forms.ModelForm):
             if self.item.maximum_duration > 0 and duration > self.item.maximum_duration:
                 raise forms.ValidationError(
                     _('Booking exeeds maximum duration'), code='maximum-duration-exceeded')
-            query = Q(dtend__gt=dtstart)
-            query.add(
-                Q(dtstart__lt=dtend),
-                Q.AND
-            )
-            query.add(Q(item=self.item), Q.AND)
-            bookings = ItemBooking.objects.filter(query)
+            if quantity > self.item.quantity:
+                raise forms.ValidationError(
+                    _('There is a missing quantity of %(delta)s') % {'delta': self.item.quantity - quantity}, code='quantity-exceeded')
+            client_tz = get_current_timezone()
             conflicts = []
-            for booking in bookings:
-                delta = self.item.quantity - booking.quantity - quantity
-                if timespan_conflict(booking.dtstart, booking.dtend, dtstart, dtend) and delta < 0:
-                    client_tz = get_current_timezone()
-                    booking.dtstart = booking.dtstart.astimezone(client_tz)
-                    booking.dtend = booking.dtend.astimezone(client_tz)
+            for segment_start, segment_end, usage in get_usage_segments(self.item, dtstart, dtend):
+                delta = self.item.quantity - usage - quantity
+                if delta < 0:
                     conflicts.append(
                         _('There is a missing quantity of %(delta)s with booking on %(start)s to %(end)s') % {
-                            'delta': delta, 'start': booking.dtstart.strftime('%c'), 'end': booking.dtend.strftime('%c')}
+                            'delta': delta, 'start': segment_start.astimezone(client_tz).strftime('%c'), 'end': segment_end.astimezone(client_tz).strftime('%c')}
                     )
             if conflicts:
                 raise forms.ValidationError(conflicts)
@@ -0,0 +1,17 @@
+# Generated by Django 3.1 on 2026-10-18 03:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0015_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='itembooking',
+            index=models.Index(fields=['created_at', 'id'], name='items_itemb_created_48ace7_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 import datetime
 
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import Q
 from django.shortcuts import reverse
@@ -9,9 +10,10 @@ from django.utils.translation import gettext_lazy as _
 from imagekit.models import ImageSpecField
 from imagekit.processors import ResizeToFill
 from resource_hub.core.models import (Actor, AssetMixin, BaseModel,
-                                      BaseStateMachine, Claim, Contract,
-                                      ContractProcedure, File, Gallery,
-                                      ICSFile, Location, Notification, Price)
+                                      BaseStateMachine, ClaimBuilder,
+                                      Contract, ContractProcedure, File,
+                                      Gallery, ICSFile, Location,
+                                      Notification, Price)
 from resource_hub.core.utils import get_valid_slug, language
 
 
@@ -116,13 +118,13 @@ class ItemContract(Contract):
     def claim_factory(self, **kwargs):
         if self.is_self_dealing:
             return
-        net_total = 0
         currency = ''
         start = datetime.datetime(
             year=datetime.MAXYEAR, month=12, day=31, tzinfo=datetime.timezone.utc)
         end = datetime.datetime(year=datetime.MINYEAR,
                                 month=1, day=1, tzinfo=datetime.timezone.utc)
-        for booking in self.bookings.all():
+        builder = ClaimBuilder(self)
+        for booking in self.bookings.select_related('item__base_price'):
             if booking.dtstart < start:
                 start = booking.dtstart
             if booking.dtend > end:
@@ -130,30 +132,18 @@ class ItemContract(Contract):
             timedelta = (booking.dtend - booking.dtstart).total_seconds()
             delta = timedelta / \
                 3600 if booking.item.unit_hours else timedelta / 86400
-            net = delta * float(booking.item.base_price.value)
-            discounted_net = self.price_profile.apply(
-                net) if self.price_profile else net
-            gross = self.contract_procedure.apply_tax(discounted_net)
-
-            Claim.objects.create(
-                contract=self,
+            builder.add(
                 item=booking.item.name,
                 quantity=delta,
                 unit=booking.item.unit,
-                price=booking.item.base_price.value,
-                currency=booking.item.base_price.currency,
-                net=net,
-                discount=self.price_profile.discount if self.price_profile else 0,
-                discounted_net=discounted_net,
-                tax_rate=self.contract_procedure.tax_rate,
-                gross=gross,
-                period_start=booking.dtstart,
-                period_end=booking.dtend,
+                price=booking.item.base_price,
+                start=booking.dtstart,
+                end=booking.dtend,
             )
 
-            net_total += net
+        builder.save()
         self.create_fee_claims(
-            net_total, booking.item.base_price.currency, start, end)
+            builder.net_total, booking.item.base_price.currency, start, end)
 
     def set_waiting(self, request):
         super(ItemContract, self).set_waiting(request)
@@ -348,8 +338,17 @@ class Item(AssetMixin, BaseStateMachine):
         verbose_name=_('Owner'),
     )
 
+    SEARCH_FIELDS = AssetMixin.SEARCH_FIELDS + [
+        ('custom_id', 'A'),
+        ('manufacturer', 'B'),
+        ('model', 'B'),
+    ]
+
     class Meta:
         unique_together = ('owner', 'slug')
+        indexes = [
+            GinIndex(fields=['search_vector']),
+        ]
 
     @property
     def unit_hours(self):
@@ -399,3 +398,8 @@ class ItemBooking(BaseModel):
         default=1,
         verbose_name=_('Quantity'),
     )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
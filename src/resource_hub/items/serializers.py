@@ -1,13 +1,15 @@
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
-from resource_hub.core.serializers import ActorSerializer, LocationSerializer
+from resource_hub.core.serializers import (ActorSerializer,
+                                           LocationSerializer,
+                                           SparseFieldsMixin)
 from rest_framework import serializers
 
 from .models import Item, ItemBooking
 
 
-class ItemSerializer(serializers.ModelSerializer):
+class ItemSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     owner = ActorSerializer(read_only=True)
     location = serializers.SerializerMethodField()
     thumbnail = serializers.SerializerMethodField()
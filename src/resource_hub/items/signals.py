@@ -1,9 +1,11 @@
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from resource_hub.core.models import Location
 from resource_hub.core.signals import (register_contract_procedures,
                                        register_modules)
 
-from .models import ItemContractProcedure
+from .models import Item, ItemContractProcedure
 from .modules import ItemsModule
 
 
@@ -15,3 +17,14 @@ def register_contract_procedure(sender, **kwargs):
 @receiver(register_modules)
 def register_module(sender, **kwargs):
     return ItemsModule
+
+
+@receiver(post_save, sender=Item)
+def update_search_vector(sender, instance, **kwargs):
+    instance.update_search_vector()
+
+
+@receiver(post_save, sender=Location)
+def update_search_vectors_on_location_changed(sender, instance, **kwargs):
+    Item.all_objects.filter(location=instance).update(
+        search_vector=Item.get_search_vector(instance.name))
@@ -6,6 +6,7 @@ from resource_hub.core.tables import BaseTable, SelectableTable
 
 
 class ItemsTable(SelectableTable):
+    prefetch = ['location']
     name = tables.LinkColumn(
         'control:items_edit',
         verbose_name=_('Name'),
@@ -25,6 +26,7 @@ class ItemsTable(SelectableTable):
 
 
 class ItemBookingsCreditedTable(BaseTable):
+    prefetch = ['item', 'contract__debitor']
     contract = tables.Column(linkify=(
         'control:finance_contracts_manage_details', {'pk': A('contract__pk')}), verbose_name=_('Contract'), accessor=A('contract__pk'))
     item = tables.Column(accessor=A('item__name'), verbose_name=_('Item'))
@@ -38,6 +40,7 @@ class ItemBookingsCreditedTable(BaseTable):
 
 
 class ItemBookingsDebitedTable(ItemBookingsCreditedTable):
+    prefetch = ['item', 'contract__creditor']
     actor = tables.Column(accessor=A(
         'contract__creditor'), verbose_name=_('Debitor'), orderable=False)
 
@@ -2,7 +2,8 @@ import base64
 from datetime import datetime, timedelta, timezone
 
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.shortcuts import reverse
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from django.utils.timezone import get_current_timezone
 
@@ -10,6 +11,7 @@ from recurrence.models import Recurrence
 from resource_hub.core.models import Actor, Address, Location, PaymentMethod
 from resource_hub.core.tests import LoginTestMixin
 
+from ..availability import availability_map, available_quantity
 from ..forms import ItemBookingForm, ItemFormManager
 from ..models import Item, ItemBooking, ItemContract, ItemContractProcedure
 
@@ -277,3 +279,68 @@ class TestItemBookingForm(LoginTestMixin, TestCase):
             }
         ]
         self._test_bookings(bookings, False)
+
+    def test_concurrent_bookings_quantity(self):
+        self.item.quantity = 3
+        self.item.save()
+        ItemBooking.objects.create(
+            item=self.item,
+            contract=self.contract,
+            dtstart=datetime(2020, 1, 1, 13, 0, 0, tzinfo=timezone.utc),
+            dtend=datetime(2020, 1, 1, 15, 0, 0, tzinfo=timezone.utc),
+            quantity=1,
+        )
+        # peak usage of 2 between 13:00 and 14:00
+        self._test_bookings([
+            {
+                'dtstart': datetime(2020, 1, 1, 13, 30, 0, tzinfo=timezone.utc),
+                'dtend': datetime(2020, 1, 1, 14, 30, 0, tzinfo=timezone.utc),
+                'quantity': 2
+            },
+            {
+                'dtstart': datetime(2020, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
+                'dtend': datetime(2020, 1, 1, 11, 0, 0, tzinfo=timezone.utc),
+                'quantity': 4
+            },
+        ], False)
+        self._test_bookings([
+            {
+                'dtstart': datetime(2020, 1, 1, 14, 0, 0, tzinfo=timezone.utc),
+                'dtend': datetime(2020, 1, 1, 16, 0, 0, tzinfo=timezone.utc),
+                'quantity': 2
+            },
+            {
+                'dtstart': datetime(2020, 1, 1, 13, 0, 0, tzinfo=timezone.utc),
+                'dtend': datetime(2020, 1, 1, 14, 0, 0, tzinfo=timezone.utc),
+                'quantity': 1
+            },
+        ], True)
+        self.assertEqual(available_quantity(
+            self.item,
+            datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+            datetime(2020, 1, 2, 0, 0, 0, tzinfo=timezone.utc),
+        ), 1)
+        self.assertEqual(list(availability_map(
+            self.item,
+            datetime(2019, 12, 31, 12, 0, 0, tzinfo=timezone.utc),
+            datetime(2020, 1, 2, 12, 0, 0, tzinfo=timezone.utc),
+        ).values()), [3, 1, 3])
+
+    def test_availability_api(self):
+        url = reverse('api:item_availability', kwargs={'pk': self.item.pk})
+        # without offset in the current time zone
+        response = self.client.get(
+            url, {'start': '2020-01-01T00:00', 'end': '2020-01-03T00:00'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([day['available'] for day in response.data['results']],
+                         [0, 1, 1])
+
+    def test_availability_api_range(self):
+        url = reverse('api:item_availability', kwargs={'pk': self.item.pk})
+        response = self.client.get(
+            url, {'start': '2020-01-02T00:00', 'end': '2020-01-01T00:00'})
+        self.assertEqual(response.status_code, 400)
+        with override_settings(AVAILABILITY_MAX_DAYS=30):
+            response = self.client.get(
+                url, {'start': '2020-01-01T00:00', 'end': '9999-01-01T00:00'})
+        self.assertEqual(response.status_code, 400)
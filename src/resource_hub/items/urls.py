@@ -9,6 +9,8 @@ app_name = 'items'
 api_urls.register([
     path('items/', api.Items.as_view(), name='items'),
     path('items/<int:pk>/bookings/', api.Bookings.as_view(), name='item_bookings'),
+    path('items/<int:pk>/availability/',
+         api.Availability.as_view(), name='item_availability'),
     path('items/<slug:owner_slug>/<slug:item_slug>/feed.ics',
          api.ICSFeed(), name='items_ics_feed'),
 ])
@@ -48,6 +48,8 @@ class ItemsManage(TableView):
 class ItemBookingsCredited(TableView):
     header = _('Credited item bookings')
     class_ = ItemBooking
+    keyset = True
+    keyset_fields = ('created_at',)
     actions = False
 
     def get_filters(self, request):
@@ -66,6 +68,8 @@ class ItemBookingsCredited(TableView):
 class ItemBookingsDebited(TableView):
     header = _('Debited item bookings')
     class_ = ItemBooking
+    keyset = True
+    keyset_fields = ('created_at',)
     actions = False
 
     def get_filters(self, request):
@@ -0,0 +1,27 @@
+# Generated by Django 3.1 on 2026-10-18 03:28
+
+from django.db import migrations, models
+
+
+def set_recurring(apps, schema_editor):
+    SEPAMandate = apps.get_model('sepa', 'SEPAMandate')
+    SEPADirectDebitPayment = apps.get_model('sepa', 'SEPADirectDebitPayment')
+    SEPAMandate.objects.filter(
+        pk__in=SEPADirectDebitPayment.objects.values('mandate')
+    ).update(sequence_type='RCUR')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sepa', '0007_auto_20200924_0840'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sepamandate',
+            name='sequence_type',
+            field=models.CharField(choices=[('FRST', 'first'), ('RCUR', 'recurring')], default='FRST', max_length=4, verbose_name='Next sequence type'),
+        ),
+        migrations.RunPython(set_recurring, migrations.RunPython.noop),
+    ]
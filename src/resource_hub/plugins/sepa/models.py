@@ -1,12 +1,12 @@
 import string
 import uuid
-from collections import defaultdict
-from decimal import Decimal
+from datetime import datetime, time
 
+from django.conf import settings
 from django.contrib import messages
 from django.core.files.base import ContentFile
 from django.db import DatabaseError, models, transaction
-from django.db.models import Max
+from django.db.models import Max, Sum
 from django.shortcuts import redirect, reverse
 from django.template.loader import render_to_string
 from django.utils import timezone
@@ -24,6 +24,23 @@ from .settings import SCHEMA
 
 
 class SEPAMandate(Contract):
+    class SEQUENCE_TYPE:
+        FIRST = 'FRST'
+        RECURRING = 'RCUR'
+
+    SEQUENCE_TYPES = [
+        (SEQUENCE_TYPE.FIRST, _('first')),
+        (SEQUENCE_TYPE.RECURRING, _('recurring')),
+    ]
+
+    # fields
+    sequence_type = models.CharField(
+        max_length=4,
+        choices=SEQUENCE_TYPES,
+        default=SEQUENCE_TYPE.FIRST,
+        verbose_name=_('Next sequence type'),
+    )
+
     @property
     def verbose_name(self):
         return _('SEPA Mandate')
@@ -111,35 +128,45 @@ class SEPA(PaymentMethod):
         )
 
     def settle(self, contract, claims, invoice):
-        currency_map = defaultdict(Decimal)
-        for claim in claims:
-            currency_map[claim.currency] += claim.gross
-            if claim.contract != contract:
-                raise ValueError(
-                    'claims have to be related to the same contract')
-
-        for currency, total in currency_map.items():
-            description = '{}: {}'.format(
-                contract.verbose_name, invoice.number) if invoice else contract.verbose_name
-            mandate = SEPAMandate.objects.get(
+        totals = claims.values('contract', 'currency').annotate(
+            total=Sum('gross')).order_by('currency')
+        if any(row['contract'] != contract.pk for row in totals):
+            raise ValueError(
+                'claims have to be related to the same contract')
+        if not totals:
+            return
+
+        description = '{}: {}'.format(
+            contract.verbose_name, invoice.number) if invoice else contract.verbose_name
+        with transaction.atomic():
+            # locked until the settlement commits, parallel settlements
+            # must not both issue the first direct debit of the mandate
+            mandate = SEPAMandate.objects.select_for_update().get(
                 creditor=contract.creditor, debitor=contract.debitor, state=Contract.STATE.RUNNING)
-            sepa_type = 'RCUR' if SEPADirectDebitPayment.objects.filter(
-                debitor=contract.debitor, mandate=mandate).exists() else 'FRST'
-            SEPADirectDebitPayment.objects.create(
-                payment_method=self,
-                state=SEPADirectDebitPayment.STATE.PENDING,
-                creditor=contract.creditor,
-                debitor=contract.debitor,
-                value=total,
-                name=contract.debitor.name,
-                iban=contract.debitor.bank_account.iban,
-                bic=contract.debitor.bank_account.bic,
-                amount=100*round_decimal(total, currency=currency),
-                currency=currency,
-                sepa_type=sepa_type,
-                mandate=mandate,
-                description=description,
-            )
+            bank_account = contract.debitor.bank_account
+            sequence_type = mandate.sequence_type
+            for row in totals:
+                currency, total = row['currency'], row['total']
+                SEPADirectDebitPayment.objects.create(
+                    payment_method=self,
+                    state=SEPADirectDebitPayment.STATE.PENDING,
+                    creditor=contract.creditor,
+                    debitor=contract.debitor,
+                    value=total,
+                    name=contract.debitor.name,
+                    iban=bank_account.iban,
+                    bic=bank_account.bic,
+                    amount=100*round_decimal(total, currency=currency),
+                    currency=currency,
+                    sepa_type=sequence_type,
+                    mandate=mandate,
+                    description=description,
+                )
+                sequence_type = SEPAMandate.SEQUENCE_TYPE.RECURRING
+
+            if mandate.sequence_type != sequence_type:
+                SEPAMandate.objects.filter(pk=mandate.pk).update(
+                    sequence_type=sequence_type)
 
     def get_invoice_text(self):
         return _('This invoice has been settled with SEPA Direct Debit')
@@ -225,6 +252,49 @@ class SEPADirectDebitXML(File):
         self.full_xml_no = self.number
         return super().save(*args, **kwargs)
 
+    @classmethod
+    def create_files(cls, creditor, batch, collection_date, max_transactions=None) -> list:
+        '''
+        creates the xml files for all open payments of the creditor
+        one file per payment method and currency, split after max_transactions
+        '''
+        max_transactions = max_transactions or settings.SEPA_MAX_TRANSACTIONS_PER_FILE
+        open_payments = SEPADirectDebitPayment.objects.filter(
+            creditor=creditor,
+            state=SEPADirectDebitPayment.STATE.PENDING,
+        )
+        groups = open_payments.values_list(
+            'payment_method', 'currency').distinct().order_by('payment_method', 'currency')
+        xml_files = []
+        for method_pk, currency in groups:
+            method = SEPA.objects.select_related(
+                'bank_account').get(pk=method_pk)
+            payments = open_payments.filter(
+                payment_method=method_pk,
+                currency=currency,
+            ).select_related(
+                'mandate__confirmation', 'debitor', 'creditor'
+            ).order_by('pk')
+            while True:
+                # finalized payments drop out of the queryset
+                chunk = list(payments[:max_transactions])
+                if not chunk:
+                    break
+                xml_file = cls(
+                    creditor=creditor,
+                    creditor_identifier=method.creditor_id,
+                    name=method.bank_account.account_holder,
+                    iban=method.bank_account.iban,
+                    bic=method.bank_account.bic,
+                    batch=batch,
+                    collection_date=collection_date,
+                    currency=currency,
+                )
+                xml_file.save()
+                xml_file.create_xml(chunk)
+                xml_files.append(xml_file)
+        return xml_files
+
     def create_xml(self, payments):
         xml_file = SepaDD({
             "name": self.name,
@@ -236,6 +306,7 @@ class SEPADirectDebitXML(File):
             "instrument": "COR1",
         }, schema=SCHEMA, clean=True)
 
+        notifications = []
         for payment in payments:
             xml_file.add_payment(
                 {
@@ -250,13 +321,10 @@ class SEPADirectDebitXML(File):
                     "description": payment.description,
                     "endtoend_id": str(payment.endtoend_id).replace('-', ''),
                 })
-            payment.sepa_dd_file = self
-            payment.state = SEPADirectDebitPayment.STATE.FINALIZED
-            payment.paymenent_date = self.collection_date
 
             with language(payment.debitor.language):
-                Notification.build(
-                    type_=Notification.TYPE.MONETARY,
+                notifications.append(Notification(
+                    typ=Notification.TYPE.MONETARY,
                     sender=payment.creditor,
                     recipient=payment.debitor,
                     header=_('SEPA Direct Debit initiated'),
@@ -277,12 +345,23 @@ class SEPADirectDebitXML(File):
                     link='',
                     level=Notification.LEVEL.MEDIUM,
                     target=self,
-                )
-            payment.save()
+                ))
 
         self.file.save('test.xml', ContentFile(
             xml_file.export(validate=True)))
         self.save()
+
+        SEPADirectDebitPayment.objects.filter(
+            pk__in=[payment.pk for payment in payments]
+        ).update(
+            sepa_dd_file=self,
+            state=SEPADirectDebitPayment.STATE.FINALIZED,
+            state_changed=timezone.now(),
+            collection_date=self.collection_date,
+            payment_date=timezone.make_aware(
+                datetime.combine(self.collection_date, time.min)),
+        )
+        Notification.objects.bulk_create(notifications)
         return xml_file
 
 
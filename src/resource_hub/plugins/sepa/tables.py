@@ -23,6 +23,7 @@ class SEPAXMLFileTable(tables.Table):
 
 
 class OpenPaymentsTable(tables.Table):
+    prefetch = ['debitor']
     debitor = tables.Column(verbose_name=_('Debitor'))
     amount = tables.Column(verbose_name=_('Amount'))
     currency = tables.Column(verbose_name=_('Currency'))
@@ -1,8 +1,11 @@
 from datetime import datetime
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-from resource_hub.core.models import BankAccount, DeclarationOfIntent
+from resource_hub.core.models import (BankAccount, Claim,
+                                      DeclarationOfIntent, Notification)
 from resource_hub.core.tests.test_models import TestContract
 
 from .models import (SEPA, SEPADirectDebitPayment, SEPADirectDebitXML,
@@ -28,7 +31,7 @@ class TestSEPA(TestContract):
         )
         confirmation = DeclarationOfIntent.objects.create(
         )
-        SEPAMandate.objects.create(
+        self.mandate = SEPAMandate.objects.create(
             creditor=self.contract.creditor,
             debitor=self.contract.debitor,
             state=SEPAMandate.STATE.RUNNING,
@@ -63,3 +66,53 @@ class TestSEPA(TestContract):
             )),
             1
         )
+
+    def test_create_files(self):
+        for i in range(5):
+            SEPADirectDebitPayment.objects.create(
+                payment_method=self.sepa,
+                creditor=self.contract.creditor,
+                debitor=self.contract.debitor,
+                value=10,
+                name=self.contract.debitor.name,
+                iban=self.contract.debitor.bank_account.iban,
+                bic=self.contract.debitor.bank_account.bic,
+                amount=1000,
+                currency='EUR',
+                sepa_type='FRST' if i == 0 else 'RCUR',
+                mandate=self.mandate,
+                description='test',
+            )
+        notifications = Notification.objects.count()
+        xml_files = SEPADirectDebitXML.create_files(
+            creditor=self.contract.creditor,
+            batch=True,
+            collection_date=datetime.now().date(),
+            max_transactions=2,
+        )
+        self.assertEqual(len(xml_files), 3)
+        self.assertEqual(
+            [xml_file.payments.count() for xml_file in xml_files], [2, 2, 1])
+        self.assertFalse(SEPADirectDebitPayment.objects.filter(
+            state=SEPADirectDebitPayment.STATE.PENDING).exists())
+        self.assertEqual(Notification.objects.count(), notifications + 5)
+
+    def test_sequence_type(self):
+        self.create_claims()
+        self.contract.settle_claims()
+        self.contract.claim_set.update(state=Claim.STATE.PENDING)
+        self.contract.settle_claims()
+        payments = SEPADirectDebitPayment.objects.filter(
+            mandate=self.mandate).order_by('pk')
+        self.assertEqual(
+            [payment.sepa_type for payment in payments], ['FRST', 'RCUR'])
+        self.mandate.refresh_from_db()
+        self.assertEqual(self.mandate.sequence_type,
+                         SEPAMandate.SEQUENCE_TYPE.RECURRING)
+
+    def test_mandate_locked(self):
+        self.create_claims()
+        with CaptureQueriesContext(connection) as context:
+            self.contract.settle_claims()
+        self.assertTrue([query for query in context.captured_queries
+                         if 'FOR UPDATE' in query['sql'] and 'sepamandate' in query['sql']])
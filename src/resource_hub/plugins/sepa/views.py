@@ -1,5 +1,3 @@
-from collections import defaultdict
-
 from django.contrib import messages
 from django.db import transaction
 from django.db.models import Q, Sum
@@ -8,7 +6,7 @@ from django.shortcuts import redirect, render, reverse
 from django.utils.translation import gettext_lazy as _
 from django.views import View
 
-from resource_hub.core.models import Contract, PaymentMethod
+from resource_hub.core.models import Contract
 from resource_hub.core.utils import money_filter
 from resource_hub.core.views import TableView
 from resource_hub.core.views.control import get_subobject_or_404
@@ -62,6 +60,8 @@ class SEPAMandateDetails(View):
 class XMLFilesManage(TableView):
     header = _('SEPA Direct Debit XML files')
     class_ = SEPADirectDebitXML
+    keyset = True
+    keyset_fields = ('created_at',)
     filters = False
     actions = False
 
@@ -78,47 +78,35 @@ class XMLFilesManage(TableView):
 
 
 class XMLFilesCreate(View):
-    def get(self, request):
+    def get_context(self, form):
         total = SEPADirectDebitPayment.objects.filter(
             creditor=self.request.actor,
             state=SEPADirectDebitPayment.STATE.PENDING,
         ).aggregate(total=Sum('amount'))['total']
         total = total / 100 if total else 0
-        context = {
-            'form': SEPADirectDebitXMLForm(),
+        return {
+            'form': form,
             'total': money_filter(total),
         }
-        return render(request, 'sepa/control/files_create.html', context)
+
+    def get(self, request):
+        return render(request, 'sepa/control/files_create.html', self.get_context(SEPADirectDebitXMLForm()))
 
     def post(self, request):
-        open_payments = SEPADirectDebitPayment.objects.filter(
-            creditor=self.request.actor,
-            state=SEPADirectDebitPayment.STATE.PENDING,
-        )
         xml_file_form = SEPADirectDebitXMLForm(request.POST)
 
-        if xml_file_form.is_valid():
-            payment_map = defaultdict(list)
-            count = 0
-            with transaction.atomic():
-                for payment in open_payments:
-                    payment_map[payment.payment_method.pk].append(payment)
-
-                for method, payments in payment_map.items():
-                    method = PaymentMethod.objects.get_subclass(
-                        pk=payments[0].payment_method.pk)
-                    count += 1
-                    xml_file = xml_file_form.save(commit=False)
-                    xml_file.creditor = self.request.actor
-                    xml_file.creditor_identifier = method.creditor_id
-                    xml_file.name = method.bank_account.account_holder
-                    xml_file.iban = method.bank_account.iban
-                    xml_file.bic = method.bank_account.bic
-                    xml_file.save()
-                    xml_file.create_xml(payments)
-                message = _('Successfully created %(count)d XML file(s)') % {
-                    'count': count
-                }
+        if not xml_file_form.is_valid():
+            return render(request, 'sepa/control/files_create.html', self.get_context(xml_file_form))
+
+        with transaction.atomic():
+            xml_files = SEPADirectDebitXML.create_files(
+                creditor=self.request.actor,
+                batch=xml_file_form.cleaned_data['batch'],
+                collection_date=xml_file_form.cleaned_data['collection_date'],
+            )
+        message = _('Successfully created %(count)d XML file(s)') % {
+            'count': len(xml_files)
+        }
         messages.add_message(request, messages.SUCCESS, message)
         return redirect(reverse('control:finance_sepa_files_manage'))
 
@@ -126,6 +114,7 @@ class XMLFilesCreate(View):
 class OpenPayments(TableView):
     header = _('Open SEPA Direct Debit payments')
     class_ = SEPADirectDebitPayment
+    keyset = True
     filters = False
     actions = False
 
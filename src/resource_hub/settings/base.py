@@ -255,12 +255,18 @@ CACHES = {
     },
 }
 CACHE_TTL = 60 * 15
+CALENDAR_CACHE_TTL = CACHE_TTL
+ACTOR_CACHE_TTL = CACHE_TTL
+MODULES_CACHE_TTL = CACHE_TTL
+HOOK_CACHE_TTL = CACHE_TTL
 
 # tables
 
 DEFAULT_PER_PAGE = 25
 MIN_PER_PAGE = 1
 MAX_PER_PAGE = 1000
+# exact counts of table pages are replaced by the planner estimate above
+TABLE_COUNT_ESTIMATE_THRESHOLD = 10000
 
 # redis queue
 
@@ -274,8 +280,53 @@ RQ_QUEUES = {
     'default': {
         'USE_REDIS_CACHE': 'default',
     },
+    'invoices': {
+        'USE_REDIS_CACHE': 'default',
+    },
 }
 
+# instrumentation, opt-in as it wraps the cache, queues and template rendering
+INSTRUMENTATION = get_env_var('INSTRUMENTATION', 'False') == 'True'
+# clients allowed to scrape /metrics
+METRICS_ALLOWED_IPS = ['127.0.0.1', '::1']
+if INSTRUMENTATION:
+    MIDDLEWARE.insert(
+        0, 'resource_hub.core.middleware.InstrumentationMiddleware')
+    CACHES['default']['BACKEND'] = 'resource_hub.core.metrics.InstrumentedRedisCache'
+    RQ = {
+        'QUEUE_CLASS': 'resource_hub.core.metrics.InstrumentedQueue',
+    }
+
+# contracts settled per job
+SETTLEMENT_CHUNK_SIZE = 50
+# notifications mailed per batch
+NOTIFICATION_MAIL_BATCH_SIZE = 100
+# mailing attempts before a notification is marked as failed
+NOTIFICATION_MAIL_MAX_ATTEMPTS = 3
+# contract events published per batch
+CONTRACT_EVENT_BATCH_SIZE = 500
+# publishing attempts before a contract event is marked as failed
+CONTRACT_EVENT_MAX_ATTEMPTS = 3
+# direct debit transactions per SEPA XML (PAIN) file
+SEPA_MAX_TRANSACTIONS_PER_FILE = 1000
+
+# availability
+# longest range in days of the item availability calendar
+AVAILABILITY_MAX_DAYS = 366
+
+# search
+# trigram fallback for misspelled queries, requires the pg_trgm extension
+SEARCH_TRIGRAM_FALLBACK = False
+SEARCH_TRIGRAM_THRESHOLD = 0.3
+
+# map
+# locations are clustered below this zoom level
+MAP_CLUSTER_MAX_ZOOM = 10
+# width of a cluster cell in pixels
+MAP_CLUSTER_CELL_SIZE = 64
+# locations returned per viewport above the cluster zoom
+MAP_MAX_LOCATIONS = 500
+
 
 # summernote
 
@@ -1,36 +1,33 @@
-from datetime import datetime
-
 import dateutil.parser
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
-from resource_hub.core.views.api import SmallResultsSetPagination
-from resource_hub.venues.models import Event, Venue
+from resource_hub.core.calendars import calendar_response
+from resource_hub.core.views.api import (SearchMixin,
+                                         SmallCursorResultsSetPagination)
+from resource_hub.venues.models import EventOccurrence, Venue
 from resource_hub.venues.serializers import VenueSerializer
 from rest_framework import exceptions, generics
 from rest_framework.decorators import (authentication_classes,
                                        permission_classes)
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
 
 @authentication_classes([])
 @permission_classes([])
-class Venues(generics.ListCreateAPIView):
+class Venues(SearchMixin, generics.ListCreateAPIView):
     http_method_names = ['get']
     serializer_class = VenueSerializer
-    pagination_class = SmallResultsSetPagination
+    pagination_class = SmallCursorResultsSetPagination
+    ordering = ('name', 'pk')
 
     def get_queryset(self):
-        name = self.request.query_params.get('name', None)
         pk = self.request.query_params.get('id', None)
         q = Q()
-        if name is not None:
-            q.add(Q(name__icontains=name), Q.AND)
-
         if pk is not None:
             q.add(Q(location=pk), Q.AND)
 
-        return Venue.objects.filter(q)
+        return self.search(Venue.objects.filter(q).select_related(
+            'owner', 'location__address', 'location__owner'))
 
 
 @authentication_classes([])
@@ -59,23 +56,19 @@ class VenueEvents(APIView):
             raise exceptions.NotFound(
                 detail=_('No venue corresponds to the given id'))
 
-        events = Event.objects.filter(venues=pk, is_deleted=False)
-        result = []
+        def build():
+            occurrences = EventOccurrence.objects.filter(
+                venue=pk, dtstart__lte=end, dtend__gte=start).select_related('event')
+            result = []
 
-        for e in events:
-            occurrences = e.recurrences.between(
-                start,
-                end,
-                inc=True,
-                dtstart=e.dtstart
-            )
             for o in occurrences:
                 result.append({
-                    'id': e.id,
-                    'title': e.name,
-                    'description': e.description,
-                    'start': datetime.combine(o.date(), e.dtstart.time(), e.dtstart.tzinfo),
-                    'end': datetime.combine(o.date(), e.dtend.time(), e.dtend.tzinfo),
+                    'id': o.event.id,
+                    'title': o.event.name,
+                    'description': o.event.description,
+                    'start': o.dtstart,
+                    'end': o.dtend,
                 })
+            return result
 
-        return Response({'results': result})
+        return calendar_response(request, 'venues', pk, start, end, build)
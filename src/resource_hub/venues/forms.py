@@ -1,4 +1,3 @@
-from datetime import datetime
 from decimal import Decimal
 
 from django import forms
@@ -7,15 +6,16 @@ from django.forms import inlineformset_factory
 from django.forms.models import BaseInlineFormSet
 from django.utils.timezone import get_current_timezone
 from django.utils.translation import gettext_lazy as _
+from resource_hub.core.conflicts import find_conflicts
 from resource_hub.core.fields import CustomMultipleChoiceField, HTMLField
 from resource_hub.core.forms import (BaseForm, ContractProcedureForm,
                                      FormManager, GalleryImageFormSet,
                                      PriceForm, PriceProfileFormSet)
 from resource_hub.core.models import Gallery, Location, PriceProfile
-from resource_hub.core.utils import get_authorized_actors, timespan_conflict
+from resource_hub.core.utils import get_authorized_actors
 
-from .models import (Equipment, EquipmentPrice, Event, Venue, VenueContract,
-                     VenueContractProcedure, VenuePrice)
+from .models import (Equipment, EquipmentPrice, Event, EventOccurrence, Venue,
+                     VenueContract, VenueContractProcedure, VenuePrice)
 
 
 class VenueForm(BaseForm):
@@ -208,54 +208,29 @@ class EventForm(forms.ModelForm):
         return dtend
 
     def _find_conflicts(self, venue, dtstart, dtlast, occurrences):
-        # query existing events in planned timeframe
-        query = Q(dtlast__gt=dtstart)
+        # query materialized occurrences in planned timeframe
+        query = Q(dtend__gt=dtstart)
         query.add(
             Q(dtstart__lt=dtlast),
             Q.AND
         )
-        query.add(Q(venues=venue), Q.AND)
+        query.add(Q(venue=venue), Q.AND)
 
-        current_events = Event.objects.filter(
+        current_occurrences = EventOccurrence.objects.filter(
             query
-        )
+        ).values_list('dtstart', 'dtend', 'event__name')
+        client_tz = get_current_timezone()
         conflicts = []
-        # iterate for conflicts (O(n^3) worst case ha!)
-        for occurrence in occurrences:
-            new_date_start = occurrence[0]
-            new_date_end = occurrence[1]
-            for event in current_events:
-                old_dates = event.recurrences.between(
-                    dtstart.replace(hour=0, minute=0, second=0),
-                    dtlast,
-                    dtstart=event.dtstart,
-                    inc=True
-                )
-
-                for old_date in old_dates:
-                    old_date_start = datetime.combine(
-                        old_date.date(), event.dtstart.time(), event.dtstart.tzinfo)
-                    old_date_end = datetime.combine(
-                        old_date.date(), event.dtend.time(), event.dtend.tzinfo)
-                    # print("{} - {} | {} - {}".format(new_date_start,
-                    #                                  new_date_end, old_date_start, old_date_end))
-                    if (
-                        timespan_conflict(
-                            new_date_start, new_date_end, old_date_start, old_date_end)
-                    ):
-                        client_tz = get_current_timezone()
-                        old_date_start = old_date_start.astimezone(client_tz)
-                        old_date_end = old_date_end.astimezone(client_tz)
-                        conflicts.append(
-                            _('There is a conflict with {}@{} at {} to {}'.format(
-                                event.name, venue.name, old_date_start.strftime('%c'), old_date_end.strftime('%c')))
-                        )
+        for conflict in find_conflicts(occurrences, current_occurrences):
+            conflicts.append(
+                _('There is a conflict with {}@{} at {} to {}'.format(
+                    conflict.obj, venue.name, conflict.other_start.astimezone(client_tz).strftime('%c'), conflict.other_end.astimezone(client_tz).strftime('%c')))
+            )
         return conflicts
 
     def clean_recurrences(self):
         '''
-        quick, dirty and naive conflict detection (polynomial runtime)
-        work in progress
+        conflict detection against the materialized occurrences
         '''
 
         recurrences = self.cleaned_data.get('recurrences')
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from resource_hub.venues.models import Event
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the materialized occurrences of all events'
+
+    def handle(self, *args, **options):
+        count = 0
+        for event in Event.all_objects.iterator():
+            event.update_occurrences()
+            count += 1
+        self.stdout.write(self.style.SUCCESS(
+            'Rebuilt occurrences of {} events'.format(count)))
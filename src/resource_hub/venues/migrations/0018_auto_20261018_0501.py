@@ -0,0 +1,36 @@
+# Generated by Django 3.1 on 2026-10-18 03:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('venues', '0017_auto_20201010_1741'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='event',
+            name='thumbnail_original',
+            field=models.ImageField(blank=True, null=True, upload_to='images/', verbose_name='Thumbnail'),
+        ),
+        migrations.CreateModel(
+            name='EventOccurrence',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dtstart', models.DateTimeField(verbose_name='Start')),
+                ('dtend', models.DateTimeField(verbose_name='End')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occurrence_set', to='venues.event', verbose_name='Event')),
+                ('venue', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='event_occurrences', to='venues.venue', verbose_name='Venue')),
+            ],
+            options={
+                'ordering': ['dtstart'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='eventoccurrence',
+            index=models.Index(fields=['venue', 'dtstart', 'dtend'], name='venues_even_venue_i_e602f5_idx'),
+        ),
+    ]
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import Q
 from django.shortcuts import reverse
@@ -10,11 +11,13 @@ from django.utils.translation import gettext_lazy as _
 from imagekit.models import ImageSpecField
 from imagekit.processors import ResizeToFill
 from recurrence.fields import RecurrenceField
+from resource_hub.core.calendars import invalidate_calendars
 from resource_hub.core.fields import (CustomManyToManyField,
                                       MultipleChoiceArrayField)
-from resource_hub.core.models import (Actor, BaseAsset, BaseModel, Claim,
-                                      Contract, ContractProcedure, Gallery,
-                                      Location, Notification, Price)
+from resource_hub.core.models import (Actor, BaseAsset, BaseModel,
+                                      ClaimBuilder, Contract,
+                                      ContractProcedure, Gallery, Location,
+                                      Notification, Price)
 from resource_hub.core.utils import get_valid_slug, language
 
 
@@ -86,6 +89,9 @@ class Venue(BaseAsset):
     class Meta:
         ordering = ['name']
         unique_together = ['name', 'location', ]
+        indexes = [
+            GinIndex(fields=['search_vector']),
+        ]
 
     # Methods
     def __str__(self):
@@ -258,6 +264,65 @@ class Event(BaseModel):
     def occurrences(self) -> list:
         return self.build_occurrences(self.recurrences.occurrences(), self.dtstart, self.dtend)['occurrences']
 
+    def update_occurrences(self):
+        '''rebuild the materialized occurrences of this event'''
+        occurrences = EventOccurrence.objects.filter(event=self)
+        # calendars of removed venues change as well
+        changed = set(occurrences.values_list('venue', flat=True).distinct())
+        occurrences.delete()
+        if not self.is_deleted:
+            changed.update(self.venues.values_list('pk', flat=True))
+        invalidate_calendars('venues', changed)
+        if self.is_deleted:
+            return
+        dates = self.recurrences.between(
+            self.dtstart.replace(hour=0, minute=0, second=0),
+            self.dtlast,
+            dtstart=self.dtstart,
+            inc=True
+        )
+        occurrences = self.build_occurrences(
+            dates, self.dtstart, self.dtend)['occurrences']
+        EventOccurrence.objects.bulk_create([
+            EventOccurrence(
+                event=self,
+                venue=venue,
+                dtstart=occurrence[0],
+                dtend=occurrence[1],
+            )
+            for venue in self.venues.all()
+            for occurrence in occurrences
+        ])
+
+
+class EventOccurrence(models.Model):
+    '''materialized occurrences per venue for conflict checks and calendars'''
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name='occurrence_set',
+        verbose_name=_('Event'),
+    )
+    venue = models.ForeignKey(
+        Venue,
+        on_delete=models.CASCADE,
+        related_name='event_occurrences',
+        verbose_name=_('Venue'),
+    )
+    dtstart = models.DateTimeField(
+        verbose_name=_('Start'),
+    )
+    dtend = models.DateTimeField(
+        verbose_name=_('End'),
+    )
+
+    # Metadata
+    class Meta:
+        ordering = ['dtstart']
+        indexes = [
+            models.Index(fields=['venue', 'dtstart', 'dtend']),
+        ]
+
 
 class Equipment(models.Model):
     # fields
@@ -367,14 +432,13 @@ class VenueContract(Contract):
         occurrences = kwargs.get('occurrences', None)
         if not occurrences:
             raise ValueError('no occurrences passed')
-        net_total = 0
-        for venue in self.event.venues.all():
+        builder = ClaimBuilder(self)
+        for venue in self.event.venues.select_related('base_price'):
             for occurrence in occurrences:
                 start = occurrence[0]
                 end = occurrence[1]
                 delta = ((end - start).total_seconds())/3600
-                claim = Claim.build(
-                    contract=self,
+                builder.add(
                     item='{}@{}'.format(
                         self.event.name,
                         venue.name
@@ -385,13 +449,12 @@ class VenueContract(Contract):
                     start=start,
                     end=end,
                 )
-                net_total += claim.net
+        net_total = builder.net_total
 
-        for booking in self.equipment_bookings.all():
+        for booking in self.equipment_bookings.select_related('equipment__price', 'equipment__venue'):
             for occurrence in occurrences:
                 equipment = booking.equipment
-                Claim.build(
-                    contract=self,
+                builder.add(
                     item='{}@{}'.format(
                         equipment.name,
                         equipment.venue.name,
@@ -403,6 +466,7 @@ class VenueContract(Contract):
                     end=occurrence[1],
                 )
 
+        builder.save()
         self.create_fee_claims(
             net_total, venue.base_price.currency, start, end)
 
@@ -1,11 +1,13 @@
 from django.urls import reverse
 
-from resource_hub.core.serializers import ActorSerializer, LocationSerializer
+from resource_hub.core.serializers import (ActorSerializer,
+                                           LocationSerializer,
+                                           SparseFieldsMixin)
 from resource_hub.venues.models import Venue
 from rest_framework import serializers
 
 
-class VenueSerializer(serializers.ModelSerializer):
+class VenueSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     owner = ActorSerializer(read_only=True)
     location = LocationSerializer(read_only=True)
     thumbnail = serializers.SerializerMethodField()
@@ -1,9 +1,11 @@
+from django.db.models.signals import m2m_changed, post_save
 from django.dispatch import receiver
 
+from resource_hub.core.models import Location
 from resource_hub.core.signals import (register_contract_procedures,
                                        register_modules)
 
-from .models import VenueContractProcedure
+from .models import Event, Venue, VenueContractProcedure
 from .modules import VenuesModule
 
 
@@ -15,3 +17,30 @@ def register_contract_procedure(sender, **kwargs):
 @receiver(register_modules)
 def register_module(sender, **kwargs):
     return VenuesModule
+
+
+@receiver(post_save, sender=Event)
+def update_occurrences(sender, instance, **kwargs):
+    instance.update_occurrences()
+
+
+@receiver(m2m_changed, sender=Event.venues.through)
+def update_occurrences_on_venues_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        instance.update_occurrences()
+    elif pk_set:
+        for obj in Event.all_objects.filter(pk__in=pk_set):
+            obj.update_occurrences()
+
+
+@receiver(post_save, sender=Venue)
+def update_search_vector(sender, instance, **kwargs):
+    instance.update_search_vector()
+
+
+@receiver(post_save, sender=Location)
+def update_search_vectors_on_location_changed(sender, instance, **kwargs):
+    Venue.all_objects.filter(location=instance).update(
+        search_vector=Venue.get_search_vector(instance.name))
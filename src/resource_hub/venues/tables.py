@@ -6,6 +6,7 @@ from resource_hub.core.tables import SelectableTable
 
 
 class VenuesTable(SelectableTable):
+    prefetch = ['owner']
     name = tables.LinkColumn(
         'control:venues_edit',
         verbose_name=_('Name'),
@@ -0,0 +1,66 @@
+from decimal import Decimal
+
+from django.db import connection
+from django.shortcuts import reverse
+from django.test.utils import CaptureQueriesContext
+from resource_hub.core.models import Price
+from resource_hub.venues.models import Venue
+
+from . import BaseVenueTest
+
+
+class TestVenuesAPI(BaseVenueTest):
+    def create_venues(self, count):
+        for i in range(count):
+            Venue.objects.create(
+                name='Venue {}'.format(i),
+                description='nice',
+                contract_procedure=self.contract_procedure,
+                location=self.location,
+                owner=self.user,
+                base_price=Price.objects.create(value=Decimal('10')),
+            )
+
+    def get_queries(self, params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('api:venues'), params)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_cursor_pagination(self):
+        self.create_venues(4)
+        response = self.client.get(reverse('api:venues'), {'page_size': 3})
+        names = [venue['name'] for venue in response.data['results']]
+        response = self.client.get(response.data['next'])
+        names += [venue['name'] for venue in response.data['results']]
+        self.assertIsNone(response.data['next'])
+        self.assertEqual(names, sorted(Venue.objects.values_list(
+            'name', flat=True)))
+
+    def test_queries_independent_of_page_size(self):
+        self.create_venues(6)
+        self.assertEqual(
+            self.get_queries({'page_size': 2}),
+            self.get_queries({'page_size': 6}),
+        )
+
+    def test_sparse_fields(self):
+        response = self.client.get(
+            reverse('api:venues'), {'fields': 'id,name'})
+        self.assertEqual(
+            list(response.data['results'][0].keys()), ['id', 'name'])
+
+    def test_search(self):
+        self.create_venues(2)
+        Venue.objects.filter(name='Venue 1').update(
+            description='Rooms for concerts and events')
+        Venue.objects.get(name='Venue 1').update_search_vector()
+
+        def search(query):
+            response = self.client.get(reverse('api:venues'), {'name': query})
+            return [venue['name'] for venue in response.data['results']]
+
+        self.assertEqual(search('event'), ['Venue 1'])
+        self.assertEqual(search('venue'), ['Venue', 'Venue 0', 'Venue 1'])
+        self.assertEqual(len(search(self.location.name)), 3)
+        self.assertEqual(search('nothing'), [])
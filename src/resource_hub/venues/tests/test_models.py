@@ -1,11 +1,19 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
+from io import StringIO
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.shortcuts import reverse
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from resource_hub.core.models import Claim
+from resource_hub.core.calendars import get_modified_key
+from resource_hub.core.models import Address, Claim, Location, Price, User
 from resource_hub.core.tests import BaseTest
-from resource_hub.venues.models import Event, VenueContract
+from resource_hub.venues.models import (Event, EventOccurrence, Venue,
+                                        VenueContract, VenueContractProcedure)
 
 from . import BaseVenueTest
 
@@ -42,3 +50,120 @@ class TestVenueContract(BaseVenueTest):
             total += claim.gross
 
         self.assertEqual(total, Decimal('25.0'))
+
+    def test_claim_queries_independent_of_occurrences(self):
+        def count_queries(occurrences):
+            with CaptureQueriesContext(connection) as queries:
+                self.contract.claim_factory(occurrences=occurrences)
+            return len(queries)
+
+        occurrence = self.contract.event.occurrences[0]
+        weekly = [
+            (occurrence[0] + timedelta(weeks=week),
+             occurrence[1] + timedelta(weeks=week))
+            for week in range(52)
+        ]
+        self.assertEqual(count_queries([occurrence]), count_queries(weekly))
+        self.assertEqual(Claim.objects.filter(
+            contract=self.contract).count(), 2 + 2 * 52)
+
+
+class TestEventOccurrences(BaseVenueTest):
+    def setUp(self):
+        super(TestEventOccurrences, self).setUp()
+        self.event = Event.objects.create(
+            name='event',
+            description='1',
+            dtstart=datetime(2020, 1, 1, 12, 0, 0,
+                             tzinfo=timezone.utc),
+            dtend=datetime(2020, 1, 1, 13, 0, 0,
+                           tzinfo=timezone.utc),
+            dtlast=datetime(2020, 1, 29, 13, 0, 0,
+                            tzinfo=timezone.utc),
+            organizer=self.user,
+            recurrences="DTSTART:20200101T120000Z\nRRULE:FREQ=WEEKLY;COUNT=5;"
+        )
+        self.event.venues.add(self.venue)
+
+    def test_occurrences_materialized(self):
+        occurrences = EventOccurrence.objects.filter(venue=self.venue)
+        self.assertEqual(occurrences.count(), 5)
+        self.assertEqual(
+            [(o.dtstart, o.dtend) for o in occurrences],
+            self.event.occurrences,
+        )
+
+    def test_calendar_feed_cached(self):
+        cache.delete(get_modified_key('venues', self.venue.pk))
+        url = reverse('api:venues_event_feed', kwargs={'pk': self.venue.pk})
+        params = {'start': '2020-01-01T00:00:00Z',
+                  'end': '2020-02-01T00:00:00Z'}
+        response = self.client.get(url, params)
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertIn('Last-Modified', response)
+
+        response = self.client.get(
+            url, params, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_occurrences_removed_on_soft_delete(self):
+        self.event.soft_delete()
+        self.assertFalse(EventOccurrence.objects.filter(
+            event=self.event).exists())
+
+    def test_rebuild_command(self):
+        EventOccurrence.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_event_occurrences', stdout=out)
+        self.assertIn('Rebuilt occurrences of 1 events', out.getvalue())
+        self.assertEqual(EventOccurrence.objects.filter(
+            event=self.event).count(), 5)
+
+
+class TestCalendarInvalidation(TransactionTestCase):
+    '''calendars are invalidated on commit, which TestCase never does'''
+
+    def setUp(self):
+        user = User.objects.create(
+            username='Joe', email='joe@joe.de', name='Joe McJoe')
+        location = Location.objects.create(
+            name='Location',
+            address=Address.objects.create(
+                street='street', street_number=12, postal_code='12345', city='test'),
+            owner=user,
+        )
+        self.venue = Venue.objects.create(
+            name='Venue',
+            description='nice',
+            contract_procedure=VenueContractProcedure.objects.create(
+                name='test', owner=user),
+            location=location,
+            owner=user,
+            base_price=Price.objects.create(value=Decimal('10')),
+        )
+        self.event = Event.objects.create(
+            name='event',
+            description='1',
+            dtstart=datetime(2020, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            dtend=datetime(2020, 1, 1, 13, 0, 0, tzinfo=timezone.utc),
+            dtlast=datetime(2020, 1, 29, 13, 0, 0, tzinfo=timezone.utc),
+            organizer=user,
+            recurrences="DTSTART:20200101T120000Z\nRRULE:FREQ=WEEKLY;COUNT=5;"
+        )
+        self.event.venues.add(self.venue)
+
+    def test_invalidated_on_commit(self):
+        cache.delete(get_modified_key('venues', self.venue.pk))
+        url = reverse('api:venues_event_feed', kwargs={'pk': self.venue.pk})
+        params = {'start': '2020-01-01T00:00:00Z',
+                  'end': '2020-02-01T00:00:00Z'}
+        self.assertEqual(
+            len(self.client.get(url, params).data['results']), 5)
+
+        # cached until the soft delete is committed
+        with transaction.atomic():
+            self.event.soft_delete()
+            self.assertEqual(
+                len(self.client.get(url, params).data['results']), 5)
+        self.assertEqual(
+            len(self.client.get(url, params).data['results']), 0)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from resource_hub.workshops.models import WorkshopBooking
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the materialized occurrences of all workshop bookings'
+
+    def handle(self, *args, **options):
+        count = 0
+        for booking in WorkshopBooking.all_objects.iterator():
+            booking.update_occurrences()
+            count += 1
+        self.stdout.write(self.style.SUCCESS(
+            'Rebuilt occurrences of {} bookings'.format(count)))
@@ -0,0 +1,31 @@
+# Generated by Django 3.1 on 2026-10-18 03:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshops', '0002_auto_20201005_2328'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkshopBookingOccurrence',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dtstart', models.DateTimeField(verbose_name='Start')),
+                ('dtend', models.DateTimeField(verbose_name='End')),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occurrence_set', to='workshops.workshopbooking', verbose_name='Booking')),
+                ('workshop', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='booking_occurrences', to='workshops.workshop', verbose_name='Workshop')),
+            ],
+            options={
+                'ordering': ['dtstart'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='workshopbookingoccurrence',
+            index=models.Index(fields=['workshop', 'dtstart', 'dtend'], name='workshops_w_worksho_d10a14_idx'),
+        ),
+    ]
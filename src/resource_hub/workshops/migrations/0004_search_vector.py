@@ -0,0 +1,52 @@
+# Generated by Django 3.1 on 2026-10-18 03:38
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+from django.db.models import Value
+
+
+# frozen copy of resource_hub.core.search.build_search_vector,
+# later changes of the application must not change this migration
+SEARCH_CONFIGS = ['german', 'english']
+
+
+def build_search_vector(fields):
+    vector = None
+    for config in SEARCH_CONFIGS:
+        for field, weight in fields:
+            part = django.contrib.postgres.search.SearchVector(
+                field, weight=weight, config=config)
+            vector = part if vector is None else vector + part
+    return vector
+
+
+SEARCH_FIELDS = [('name', 'A'), ('description', 'C')]
+
+
+def update_search_vectors(apps, schema_editor):
+    Workshop = apps.get_model('workshops', 'Workshop')
+    Location = apps.get_model('core', 'Location')
+    for pk, name in Location.objects.values_list('pk', 'name'):
+        Workshop.objects.filter(location=pk).update(search_vector=build_search_vector(
+            SEARCH_FIELDS + [(Value(name or '', output_field=models.CharField()), 'B')]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshops', '0003_auto_20261018_0501'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workshop',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='workshop',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='workshops_w_search__20d820_gin'),
+        ),
+        migrations.RunPython(update_search_vectors, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import Q
 from django.shortcuts import reverse
@@ -10,11 +11,13 @@ from django.utils.translation import gettext_lazy as _
 from imagekit.models import ImageSpecField
 from imagekit.processors import ResizeToFill
 from recurrence.fields import RecurrenceField
+from resource_hub.core.calendars import invalidate_calendars
 from resource_hub.core.fields import (CustomManyToManyField,
                                       MultipleChoiceArrayField)
-from resource_hub.core.models import (Actor, BaseAsset, BaseModel, Claim,
-                                      Contract, ContractProcedure, Gallery,
-                                      Location, Notification, Price)
+from resource_hub.core.models import (Actor, BaseAsset, BaseModel,
+                                      ClaimBuilder, Contract,
+                                      ContractProcedure, Gallery, Location,
+                                      Notification, Price)
 from resource_hub.core.utils import get_valid_slug, language
 
 
@@ -64,6 +67,9 @@ class Workshop(BaseAsset):
     class Meta:
         ordering = ['name']
         unique_together = ['name', 'location', ]
+        indexes = [
+            GinIndex(fields=['search_vector']),
+        ]
 
     # Methods
     def __str__(self):
@@ -133,6 +139,65 @@ class WorkshopBooking(BaseModel):
     def occurrences(self) -> list:
         return self.build_occurrences(self.recurrences.occurrences(), self.dtstart, self.dtend)['occurrences']
 
+    def update_occurrences(self):
+        '''rebuild the materialized occurrences of this booking'''
+        occurrences = WorkshopBookingOccurrence.objects.filter(booking=self)
+        # calendars of removed workshops change as well
+        changed = set(occurrences.values_list('workshop', flat=True).distinct())
+        occurrences.delete()
+        if not self.is_deleted:
+            changed.update(self.workshops.values_list('pk', flat=True))
+        invalidate_calendars('workshops', changed)
+        if self.is_deleted:
+            return
+        dates = self.recurrences.between(
+            self.dtstart.replace(hour=0, minute=0, second=0),
+            self.dtlast,
+            dtstart=self.dtstart,
+            inc=True
+        )
+        occurrences = self.build_occurrences(
+            dates, self.dtstart, self.dtend)['occurrences']
+        WorkshopBookingOccurrence.objects.bulk_create([
+            WorkshopBookingOccurrence(
+                booking=self,
+                workshop=workshop,
+                dtstart=occurrence[0],
+                dtend=occurrence[1],
+            )
+            for workshop in self.workshops.all()
+            for occurrence in occurrences
+        ])
+
+
+class WorkshopBookingOccurrence(models.Model):
+    '''materialized occurrences per workshop for conflict checks and calendars'''
+    booking = models.ForeignKey(
+        WorkshopBooking,
+        on_delete=models.CASCADE,
+        related_name='occurrence_set',
+        verbose_name=_('Booking'),
+    )
+    workshop = models.ForeignKey(
+        Workshop,
+        on_delete=models.CASCADE,
+        related_name='booking_occurrences',
+        verbose_name=_('Workshop'),
+    )
+    dtstart = models.DateTimeField(
+        verbose_name=_('Start'),
+    )
+    dtend = models.DateTimeField(
+        verbose_name=_('End'),
+    )
+
+    # Metadata
+    class Meta:
+        ordering = ['dtstart']
+        indexes = [
+            models.Index(fields=['workshop', 'dtstart', 'dtend']),
+        ]
+
 
 class WorkshopEquipment(models.Model):
     # fields
@@ -242,15 +307,15 @@ class WorkshopContract(Contract):
         occurrences = kwargs.get('occurrences', None)
         if not occurrences:
             raise ValueError('no occurrences passed')
-        net_total = 0
+        builder = ClaimBuilder(self)
+        workshops = list(self.booking.workshops.select_related('base_price'))
         for i in range(1, self.booking.workplaces + 1):
-            for workshop in self.booking.workshops.all():
+            for workshop in workshops:
                 for occurrence in occurrences:
                     start = occurrence[0]
                     end = occurrence[1]
                     delta = ((end - start).total_seconds())/3600
-                    claim = Claim.build(
-                        contract=self,
+                    builder.add(
                         item=_('%(workplace)s (Workplace %(no)d)') % {
                             'workplace': workshop.name,
                             'no': i,
@@ -261,13 +326,12 @@ class WorkshopContract(Contract):
                         start=start,
                         end=end,
                     )
-                    net_total += claim.net
+        net_total = builder.net_total
 
-        for booking in self.equipment_bookings.all():
+        for booking in self.equipment_bookings.select_related('equipment__price', 'equipment__workshop'):
             for occurrence in occurrences:
                 equipment = booking.equipment
-                Claim.build(
-                    contract=self,
+                builder.add(
                     item='{}@{}'.format(
                         equipment.name,
                         equipment.workshop.name,
@@ -279,6 +343,7 @@ class WorkshopContract(Contract):
                     end=occurrence[1],
                 )
 
+        builder.save()
         self.create_fee_claims(
             net_total, workshop.base_price.currency, start, end)
 
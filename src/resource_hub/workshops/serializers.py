@@ -1,10 +1,12 @@
 from django.urls import reverse
-from resource_hub.core.serializers import ActorSerializer, LocationSerializer
+from resource_hub.core.serializers import (ActorSerializer,
+                                           LocationSerializer,
+                                           SparseFieldsMixin)
 from resource_hub.workshops.models import Workshop
 from rest_framework import serializers
 
 
-class WorkshopSerializer(serializers.ModelSerializer):
+class WorkshopSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     owner = ActorSerializer(read_only=True)
     location = LocationSerializer(read_only=True)
     thumbnail = serializers.SerializerMethodField()
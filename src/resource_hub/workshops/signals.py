@@ -1,8 +1,10 @@
+from django.db.models.signals import m2m_changed, post_save
 from django.dispatch import receiver
+from resource_hub.core.models import Location
 from resource_hub.core.signals import (register_contract_procedures,
                                        register_modules)
 
-from .models import WorkshopContractProcedure
+from .models import Workshop, WorkshopBooking, WorkshopContractProcedure
 from .modules import WorkshopsModule
 
 
@@ -14,3 +16,30 @@ def register_contract_procedure(sender, **kwargs):
 @receiver(register_modules)
 def register_module(sender, **kwargs):
     return WorkshopsModule
+
+
+@receiver(post_save, sender=WorkshopBooking)
+def update_occurrences(sender, instance, **kwargs):
+    instance.update_occurrences()
+
+
+@receiver(m2m_changed, sender=WorkshopBooking.workshops.through)
+def update_occurrences_on_workshops_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        instance.update_occurrences()
+    elif pk_set:
+        for obj in WorkshopBooking.all_objects.filter(pk__in=pk_set):
+            obj.update_occurrences()
+
+
+@receiver(post_save, sender=Workshop)
+def update_search_vector(sender, instance, **kwargs):
+    instance.update_search_vector()
+
+
+@receiver(post_save, sender=Location)
+def update_search_vectors_on_location_changed(sender, instance, **kwargs):
+    Workshop.all_objects.filter(location=instance).update(
+        search_vector=Workshop.get_search_vector(instance.name))
@@ -5,6 +5,7 @@ from resource_hub.core.tables import SelectableTable
 
 
 class WorkshopsTable(SelectableTable):
+    prefetch = ['owner']
     name = tables.LinkColumn(
         'control:workshops_edit',
         verbose_name=_('Name'),
@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+
+from ..forms import WorkshopBookingForm
+from ..models import WorkshopBooking
+from . import BaseWorkshopTest
+
+
+class TestWorkshopBookingForm(BaseWorkshopTest):
+    def setUp(self):
+        super(TestWorkshopBookingForm, self).setUp()
+
+        WorkshopBooking.objects.create(
+            dtstart=datetime(2020, 1, 1, 12, 0, 0,
+                             tzinfo=timezone.utc),
+            dtend=datetime(2020, 1, 1, 13, 0, 0,
+                           tzinfo=timezone.utc),
+            dtlast=datetime(2020, 1, 29, 13, 0, 0,
+                            tzinfo=timezone.utc),
+            recurrences="DTSTART:20200101T120000Z\nRRULE:FREQ=WEEKLY;COUNT=5;"
+        ).workshops.add(self.workshop)
+
+    def create_booking_form(self, dtstart, dtend, recurrence, workshop):
+        return WorkshopBookingForm(
+            workshop,
+            None,
+            data={
+                'workshops': [workshop.pk, ],
+                'workplaces': 1,
+                'dtstart': dtstart,
+                'dtend': dtend,
+                'recurrences': recurrence,
+            },
+        )
+
+    def test_conflicting_bookings(self):
+        bookings = [
+            # single booking
+            (
+                datetime(2020, 1, 1, 12, 30, 0, tzinfo=timezone.utc),
+                datetime(2020, 1, 1, 14, 30, 0, tzinfo=timezone.utc),
+                ''
+            ),
+            # single booking on a later occurrence
+            (
+                datetime(2020, 1, 22, 11, 30, 0, tzinfo=timezone.utc),
+                datetime(2020, 1, 22, 12, 30, 0, tzinfo=timezone.utc),
+                ''
+            ),
+            # recurring booking, starting before the other booking
+            (
+                datetime(2019, 12, 18, 12, 30, 0, tzinfo=timezone.utc),
+                datetime(2019, 12, 18, 13, 30, 0, tzinfo=timezone.utc),
+                'DTSTART:20191218T123000Z\nRRULE:FREQ=WEEKLY;COUNT=3;'
+            ),
+        ]
+        for booking in bookings:
+            booking_form = self.create_booking_form(
+                booking[0],
+                booking[1],
+                booking[2],
+                self.workshop
+            )
+            self.assertFalse(booking_form.is_valid())
+            self.assertIn('recurrences', booking_form.errors)
+
+    def test_nonconflicting_bookings(self):
+        bookings = [
+            # single booking, starts on other bookings end
+            (
+                datetime(2020, 1, 1, 13, 0, 0, tzinfo=timezone.utc),
+                datetime(2020, 1, 1, 14, 0, 0, tzinfo=timezone.utc),
+                ''
+            ),
+            # recurring booking, ends before the other booking starts
+            (
+                datetime(2019, 12, 4, 12, 0, 0, tzinfo=timezone.utc),
+                datetime(2019, 12, 4, 13, 0, 0, tzinfo=timezone.utc),
+                'DTSTART:20191204T120000Z\nRRULE:FREQ=WEEKLY;COUNT=4;'
+            ),
+        ]
+        for booking in bookings:
+            booking_form = self.create_booking_form(
+                booking[0],
+                booking[1],
+                booking[2],
+                self.workshop
+            )
+            self.assertTrue(booking_form.is_valid(), booking_form.errors)
+
+    def test_other_workshop_does_not_conflict(self):
+        booking_form = self.create_booking_form(
+            datetime(2020, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            datetime(2020, 1, 1, 13, 0, 0, tzinfo=timezone.utc),
+            '',
+            self.workshop2
+        )
+        self.assertTrue(booking_form.is_valid(), booking_form.errors)
+
+    def test_find_conflicts(self):
+        booking_form = self.create_booking_form(
+            datetime(2020, 1, 8, 12, 30, 0, tzinfo=timezone.utc),
+            datetime(2020, 1, 8, 13, 30, 0, tzinfo=timezone.utc),
+            '',
+            self.workshop
+        )
+        occurrences = [
+            (datetime(2020, 1, 8, 12, 30, 0, tzinfo=timezone.utc),
+             datetime(2020, 1, 8, 13, 30, 0, tzinfo=timezone.utc)),
+            (datetime(2020, 1, 15, 12, 30, 0, tzinfo=timezone.utc),
+             datetime(2020, 1, 15, 13, 30, 0, tzinfo=timezone.utc)),
+        ]
+        conflicts = booking_form._find_conflicts(
+            self.workshop, occurrences[0][0], occurrences[-1][1], occurrences)
+        self.assertEqual(len(conflicts), 2)
+        self.assertEqual(booking_form._find_conflicts(
+            self.workshop2, occurrences[0][0], occurrences[-1][1], occurrences), [])
@@ -0,0 +1,60 @@
+from datetime import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+from resource_hub.workshops.models import (WorkshopBooking,
+                                           WorkshopBookingOccurrence)
+
+from . import BaseWorkshopTest
+
+
+class TestBookingOccurrences(BaseWorkshopTest):
+    def setUp(self):
+        super(TestBookingOccurrences, self).setUp()
+        self.booking = WorkshopBooking.objects.create(
+            dtstart=datetime(2020, 1, 1, 12, 0, 0,
+                             tzinfo=timezone.utc),
+            dtend=datetime(2020, 1, 1, 13, 0, 0,
+                           tzinfo=timezone.utc),
+            dtlast=datetime(2020, 1, 29, 13, 0, 0,
+                            tzinfo=timezone.utc),
+            recurrences="DTSTART:20200101T120000Z\nRRULE:FREQ=WEEKLY;COUNT=5;"
+        )
+        self.booking.workshops.add(self.workshop)
+
+    def test_occurrences_materialized(self):
+        occurrences = WorkshopBookingOccurrence.objects.filter(
+            workshop=self.workshop)
+        self.assertEqual(occurrences.count(), 5)
+        self.assertEqual(
+            [(o.dtstart, o.dtend) for o in occurrences],
+            self.booking.occurrences,
+        )
+
+    def test_occurrences_removed_on_soft_delete(self):
+        self.booking.soft_delete()
+        self.assertFalse(WorkshopBookingOccurrence.objects.filter(
+            booking=self.booking).exists())
+
+    def test_occurrences_synced_with_workshops(self):
+        self.booking.workshops.add(self.workshop2)
+        self.assertEqual(WorkshopBookingOccurrence.objects.filter(
+            workshop=self.workshop2).count(), 5)
+
+        self.booking.workshops.remove(self.workshop)
+        self.assertFalse(WorkshopBookingOccurrence.objects.filter(
+            workshop=self.workshop).exists())
+
+        # changes from the workshop side are synced as well
+        self.workshop2.workshopbooking_set.remove(self.booking)
+        self.assertFalse(WorkshopBookingOccurrence.objects.filter(
+            booking=self.booking).exists())
+
+    def test_rebuild_command(self):
+        WorkshopBookingOccurrence.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_booking_occurrences', stdout=out)
+        self.assertIn('Rebuilt occurrences of 1 bookings', out.getvalue())
+        self.assertEqual(WorkshopBookingOccurrence.objects.filter(
+            booking=self.booking).count(), 5)